@@ -0,0 +1,128 @@
+import csv
+import json
+import time
+from collections import deque, namedtuple
+from contextlib import contextmanager
+from speech_stats import percentile
+
+PHASES = ('precedence', 'rendering', 'stats', 'persistence', 'other')
+WINDOW = 500  # most recent runs of each action kept for percentiles
+BUDGET_MS = 100  # an action slower than this is counted as over budget
+
+LatencyRow = namedtuple('LatencyRow', ['action', 'count', 'p50_ms', 'p99_ms', 'max_ms', 'over_budget', 'phases'])
+
+
+class ActionTimer:
+    """End-to-end latency of user-facing actions, split into phases.
+
+    Wrap an action in action(name) and the work inside it in phase(name).
+    Phases nest, but each moment is charged to the innermost one only, and
+    whatever no phase claims is 'other'; so the phases of a run add up to
+    its total. Actions started inside another action count as part of the
+    outer one. Outside an action, phase() costs next to nothing and records
+    nothing. The last WINDOW runs of each action are kept for percentiles.
+    """
+
+    def __init__(self, window=WINDOW, budget_ms=BUDGET_MS, clock=time.perf_counter):
+        self._clock = clock
+        self.window = window
+        self.budget_ms = budget_ms
+        self._runs = {}  # action -> deque of (total seconds, {phase: seconds})
+        self._totals = {}  # action -> runs ever recorded
+        self._action = None
+        self._stack = []  # [phase, start of its current stretch], innermost last
+        self._spent = {}
+
+    @contextmanager
+    def action(self, name):
+        if self._action is not None:
+            yield
+            return
+        self._action = name
+        self._spent = {}
+        self._stack = []
+        start = self._clock()
+        try:
+            yield
+        finally:
+            total = self._clock() - start
+            phases = dict(self._spent)
+            phases['other'] = max(0.0, total - sum(phases.values()))
+            self._action = None
+            self._runs.setdefault(name, deque(maxlen=self.window)).append((total, phases))
+            self._totals[name] = self._totals.get(name, 0) + 1
+
+    @contextmanager
+    def phase(self, name):
+        if self._action is None:
+            yield
+            return
+        now = self._clock()
+        if self._stack:
+            self._charge(self._stack[-1], now)
+        entry = [name, now]
+        self._stack.append(entry)
+        try:
+            yield
+        finally:
+            now = self._clock()
+            self._charge(self._stack.pop(), now)
+            if self._stack:
+                self._stack[-1][1] = now
+
+    def _charge(self, entry, now):
+        name, start = entry
+        self._spent[name] = self._spent.get(name, 0.0) + (now - start)
+
+    def actions(self):
+        return list(self._runs)
+
+    def row(self, name):
+        """Percentiles over the recent runs of one action, in milliseconds"""
+        runs = self._runs.get(name)
+        if not runs:
+            return None
+        totals = sorted(total * 1000 for total, _ in runs)
+        phases = {}
+        for phase in PHASES:
+            spent = sorted(p.get(phase, 0.0) * 1000 for _, p in runs)
+            phases[phase] = (percentile(spent, 50), percentile(spent, 99))
+        return LatencyRow(name, self._totals[name], percentile(totals, 50), percentile(totals, 99), totals[-1],
+                          sum(1 for total in totals if total > self.budget_ms), phases)
+
+    def rows(self):
+        return [self.row(name) for name in self._runs]
+
+    def report_lines(self):
+        lines = []
+        for row in self.rows():
+            lines.append(f"{row.action}: p50 {row.p50_ms:.1f} ms, p99 {row.p99_ms:.1f} ms, max {row.max_ms:.1f} ms "
+                         f"({row.count} runs, {row.over_budget} of the last {min(row.count, self.window)} "
+                         f"over {self.budget_ms} ms)")
+            for phase, (p50, p99) in row.phases.items():
+                if p99 > 0:
+                    lines.append(f"    {phase}: p50 {p50:.1f} ms, p99 {p99:.1f} ms")
+        return lines
+
+    def export(self, path):
+        """Write the summary as CSV, or the summary plus every recent run as JSON for a .json path"""
+        if path.lower().endswith('.json'):
+            data = {
+                'window': self.window,
+                'budget_ms': self.budget_ms,
+                'actions': {row.action: row._asdict() for row in self.rows()},
+                'runs': {name: [{'total_ms': total * 1000, **{k: v * 1000 for k, v in phases.items()}}
+                                for total, phases in runs]
+                         for name, runs in self._runs.items()},
+            }
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            return
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['action', 'phase', 'runs', 'p50_ms', 'p99_ms', 'max_ms', 'over_budget'])
+            for row in self.rows():
+                writer.writerow([row.action, 'total', row.count, f"{row.p50_ms:.3f}", f"{row.p99_ms:.3f}",
+                                 f"{row.max_ms:.3f}", row.over_budget])
+                for phase, (p50, p99) in row.phases.items():
+                    writer.writerow([row.action, phase, row.count, f"{p50:.3f}", f"{p99:.3f}", "", ""])
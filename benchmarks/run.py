@@ -0,0 +1,312 @@
+"""Headless benchmarks for the precedence, rendering and persistence hot paths.
+
+    python benchmarks/run.py                        # every size, results to stdout
+    python benchmarks/run.py --output results.json  # save a run
+    python benchmarks/run.py --baseline benchmarks/baseline.json
+
+Each benchmark runs on seeded chambers of SIZES competitors from
+session_generator and reports per-call latency (median, min and max over
+--repeat runs) and the peak memory allocated by one call. Each run follows
+a real change: a logged speech or move, or for the UI a speech undone or
+redone. UI benchmarks show the tracker on the offscreen Qt platform and
+include the repaint, and are recorded as skipped when PyQt6 isn't installed. With --baseline, the run is
+compared against a saved one and the exit status is 1 if anything is more
+than --threshold times slower.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import persistence
+from precedence import PrecedenceEngine, RecencyOrder
+from session_generator import build_session, generate_actions
+from speech_index import SideTally
+
+try:
+    from PyQt6.QtWidgets import QApplication
+except ImportError:
+    QApplication = None  # UI benchmarks are skipped
+
+SIZES = (10, 30, 100, 1000, 10000)
+
+
+def make_chamber(size, seed):
+    """A generated session of size competitors, as loading its file would leave it"""
+    return build_session(generate_actions(size, seed))
+
+def save_chamber(chamber, path):
+    persistence.save_to_csv(path, chamber.competitors, None, chamber.speech_precedence.recency_order(),
+                            chamber.question_precedence.recency_order(), chamber.resolution_list,
+                            chamber.current_resolution, chamber.current_side)
+
+
+def measure(run, repeat, calls=1, setup=None):
+    """Seconds per call for each of repeat runs, and the peak bytes allocated by one run.
+
+    run makes calls calls of the operation being measured. setup, if given,
+    is called untimed before every run.
+    """
+    setup = setup or (lambda: None)
+    setup()
+    run()  # Warm up caches and lazy imports
+    times = []
+    for _ in range(repeat):
+        setup()
+        start = time.perf_counter()
+        run()
+        times.append((time.perf_counter() - start) / calls)
+    setup()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        run()
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+    return times, peak
+
+
+def summarize(times, peak, calls):
+    return {
+        'median_ms': statistics.median(times) * 1000,
+        'min_ms': min(times) * 1000,
+        'max_ms': max(times) * 1000,
+        'runs': len(times),
+        'calls_per_run': calls,
+        'peak_kib': peak / 1024,
+    }
+
+
+# ---- Core benchmarks: no Qt needed ----
+
+def bench_save_to_csv(chamber, workdir, repeat):
+    path = os.path.join(workdir, 'save.csv')
+    return measure(lambda: save_chamber(chamber, path), repeat), 1
+
+def bench_load_from_csv(chamber, workdir, repeat):
+    path = os.path.join(workdir, 'load.csv')
+    save_chamber(chamber, path)
+    return measure(lambda: persistence.load_from_csv(path), repeat), 1
+
+def make_engine(chamber):
+    counts = {c.name: c.speeches for c in chamber.competitors}
+    return PrecedenceEngine(RecencyOrder.from_list(chamber.speech_precedence.recency_order()), counts), counts
+
+def bench_precedence_log(chamber, workdir, repeat):
+    # Logging a speech by whoever has precedence, then the ordering update_lists asks for
+    engine, counts = make_engine(chamber)
+    def run():
+        name = engine.first()
+        counts[name] += 1
+        engine.log(name, counts[name])
+        engine.ordered(False)
+    return measure(run, repeat), 1
+
+def bench_precedence_move(chamber, workdir, repeat):
+    # A manual move in the middle of the list, then the recency order shown in manual mode
+    engine, _ = make_engine(chamber)
+    name = engine.recency_order()[len(engine) // 2]
+    directions = [1]
+    def run():
+        directions[0] = -directions[0]  # Up then back down, so every run is one real swap
+        engine.swap(name, directions[0])
+        engine.ordered(True)
+    return measure(run, repeat), 1
+
+def bench_determine_next_speaker_side(chamber, workdir, repeat):
+    # CongressTracker.determine_next_speaker_side is a call into this tally
+    tally = SideTally()
+    tally.rebuild(chamber.competitors)
+    resolutions = chamber.resolution_list
+    def run():
+        for resolution in resolutions:
+            tally.next_side(resolution)
+    return measure(run, repeat, len(resolutions)), len(resolutions)
+
+CORE_BENCHMARKS = {
+    'save_to_csv': bench_save_to_csv,
+    'load_from_csv': bench_load_from_csv,
+    'precedence_log': bench_precedence_log,
+    'precedence_move': bench_precedence_move,
+    'determine_next_speaker_side': bench_determine_next_speaker_side,
+}
+
+
+# ---- UI benchmarks: offscreen Qt ----
+
+def load_tracker(tracker, chamber):
+    """Put a chamber into a CongressTracker the way loading a file does"""
+    tracker.competitors = chamber.competitors
+    tracker.entered_names = [c.name for c in chamber.competitors]
+    tracker.speech_recency_order = RecencyOrder.from_list(chamber.speech_precedence.recency_order())
+    tracker.question_recency_order = RecencyOrder.from_list(chamber.question_precedence.recency_order())
+    tracker.rebuild_indexes()
+    tracker.resolution_list = list(chamber.resolution_list)
+    tracker.current_resolution = chamber.current_resolution
+    tracker.current_side = chamber.current_side
+    tracker.manual_reordering_speech_enabled = False
+    tracker.manual_reordering_question_enabled = False
+    tracker.tracking_started = True
+    tracker.undo_stack.clear()
+
+def log_speech(tracker):
+    """Log a speech by whoever has precedence, through the tracker's own speech input"""
+    tracker.open_speech_input(tracker.speech_precedence.first())
+    tracker.minutes_input.setText("2")
+    tracker.seconds_input.setText("30")
+    tracker.confirm_log_speech()
+    QApplication.processEvents()
+
+def toggle_speech(tracker):
+    """Undo or redo that speech, leaving the views to catch up as the benchmark's change"""
+    if tracker.undo_stack.can_undo():
+        tracker.undo_stack.undo(tracker)
+    else:
+        tracker.undo_stack.redo(tracker)
+
+def bench_update_lists(tracker, chamber, repeat):
+    load_tracker(tracker, chamber)
+    tracker.tabs.setCurrentWidget(tracker.speech_tab)
+    log_speech(tracker)
+    def run():
+        tracker.update_lists()
+        QApplication.processEvents()  # The repaint of the visible rows
+    return measure(run, repeat, setup=lambda: toggle_speech(tracker)), 1
+
+def bench_update_stats_display(tracker, chamber, repeat):
+    load_tracker(tracker, chamber)
+    tracker.tabs.setCurrentWidget(tracker.speech_tab)
+    log_speech(tracker)
+    tracker.tabs.setCurrentWidget(tracker.stats_tab)
+    def run():
+        tracker.update_stats_display()
+        QApplication.processEvents()
+    return measure(run, repeat, setup=lambda: toggle_speech(tracker)), 1
+
+UI_BENCHMARKS = {
+    'update_lists': bench_update_lists,
+    'update_stats_display': bench_update_stats_display,
+}
+
+
+def make_tracker(home):
+    """A CongressTracker shown on the offscreen platform, or None without PyQt6"""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    os.environ['HOME'] = home  # Keep the user's config out of it
+    try:
+        from ui import CongressTracker
+    except ImportError as e:
+        print(f"Skipping UI benchmarks: {e}")
+        return None, None
+    app = QApplication.instance() or QApplication([])
+    tracker = CongressTracker()
+    tracker.resize(1024, 768)
+    tracker.show()
+    app.processEvents()
+    return app, tracker
+
+
+def run_benchmarks(sizes, repeat, seed, only=None):
+    results = {}
+    workdir = tempfile.mkdtemp(prefix='congress-bench-')
+    try:
+        app, tracker = make_tracker(workdir)
+        benchmarks = [(name, False, bench) for name, bench in CORE_BENCHMARKS.items()]
+        benchmarks += [(name, True, bench) for name, bench in UI_BENCHMARKS.items()]
+        for size in sizes:
+            chamber = make_chamber(size, seed)
+            for name, needs_ui, bench in benchmarks:
+                if only and name not in only:
+                    continue
+                if needs_ui and tracker is None:
+                    results.setdefault(name, {})[str(size)] = {'skipped': 'PyQt6 not available'}
+                    continue
+                if needs_ui:
+                    (times, peak), calls = bench(tracker, chamber, repeat)
+                else:
+                    (times, peak), calls = bench(chamber, workdir, repeat)
+                result = results.setdefault(name, {})[str(size)] = summarize(times, peak, calls)
+                print(f"{name:>28} {size:>6}: {result['median_ms']:10.4f} ms  peak {result['peak_kib']:10.1f} KiB")
+        if tracker is not None:
+            tracker.close()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def environment():
+    try:
+        from PyQt6.QtCore import PYQT_VERSION_STR
+    except ImportError:
+        PYQT_VERSION_STR = None
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'pyqt': PYQT_VERSION_STR,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Lines describing each result against the baseline, and whether any regressed"""
+    lines = []
+    regressed = False
+    for name, by_size in results.items():
+        for size, result in by_size.items():
+            before = baseline.get('results', {}).get(name, {}).get(size)
+            if 'median_ms' not in result or not before or 'median_ms' not in before:
+                continue
+            ratio = result['median_ms'] / before['median_ms'] if before['median_ms'] else float('inf')
+            flag = ""
+            if ratio > threshold:
+                flag = "  REGRESSION"
+                regressed = True
+            lines.append(f"{name:>28} {size:>6}: {before['median_ms']:10.4f} -> {result['median_ms']:10.4f} ms"
+                         f" ({ratio:.2f}x){flag}")
+    return lines, regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--only', nargs='+', help="run just these benchmarks")
+    parser.add_argument('--output', help="write results to this JSON file")
+    parser.add_argument('--baseline', help="compare against a saved JSON run")
+    parser.add_argument('--threshold', type=float, default=1.5, help="slowdown that counts as a regression")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.repeat, args.seed, args.only)
+    run = {
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'environment': environment(),
+        'settings': {'sizes': args.sizes, 'repeat': args.repeat, 'seed': args.seed},
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(run, f, indent=2)
+        print(f"Results written to {args.output}")
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        lines, regressed = compare(results, baseline, args.threshold)
+        print("\n".join(lines))
+        return 1 if regressed else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,228 @@
+import io
+import json
+import os
+import struct
+from models import HistoryItem
+
+KINDS = ('speech', 'question')  # action types with their own index
+ITER_PAGE = 500  # entries read at a time when iterating
+
+_ENTRY = struct.Struct('<QB')  # byte offset in the log, kind code (0 for anything else)
+_OFFSET = struct.Struct('<Q')
+
+
+def log_path(csv_path):
+    return csv_path.replace('.csv', '_history.jsonl')
+
+def index_paths(csv_path):
+    """Index of every entry, then one index per kind"""
+    paths = [csv_path.replace('.csv', '_history.idx')]
+    paths += [csv_path.replace('.csv', f'_history_{kind}.idx') for kind in KINDS]
+    return paths
+
+def history_files(csv_path):
+    return [log_path(csv_path)] + index_paths(csv_path)
+
+def remove_history_files(csv_path):
+    for path in history_files(csv_path):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _open(path):
+    # Append mode keeps every write at the end while reads can still seek anywhere
+    return io.BytesIO() if path is None else open(path, 'a+b')
+
+def _read_line(log, offset):
+    log.seek(offset)
+    return HistoryItem.from_dict(json.loads(log.readline()))
+
+
+class HistoryLog:
+    """Chamber history kept on disk in full, read back a page at a time.
+
+    Entries are appended to <session>_history.jsonl, one JSON object per line.
+    Fixed-width index files hold the byte offset of every entry, and of every
+    entry of each kind in KINDS, so entry n overall or the nth speech is one
+    seek into an index and one into the log. Memory use is a handful of
+    counters however long the session runs. Only the newest entry can be
+    removed, which is all undo needs. Without a path the files live in memory.
+    """
+
+    def __init__(self, csv_path=None):
+        self.csv_path = csv_path
+        self._open_files()
+
+    def _open_files(self):
+        paths = history_files(self.csv_path) if self.csv_path else [None] * (2 + len(KINDS))
+        if self.csv_path:
+            os.makedirs(os.path.dirname(self.csv_path) or '.', exist_ok=True)
+        self._log = _open(paths[0])
+        self._index = _open(paths[1])
+        self._kind_index = {kind: _open(path) for kind, path in zip(KINDS, paths[2:])}
+        self._counts = {None: self._size(self._index) // _ENTRY.size}
+        for kind, f in self._kind_index.items():
+            self._counts[kind] = self._size(f) // _OFFSET.size
+        if not self._consistent():
+            self._rebuild()
+
+    @staticmethod
+    def _size(f):
+        return f.seek(0, os.SEEK_END)
+
+    def _consistent(self):
+        """True when the indexes cover exactly the lines in the log"""
+        total = self._counts[None]
+        if self._size(self._index) != total * _ENTRY.size:
+            return False
+        if any(self._size(f) != self._counts[kind] * _OFFSET.size for kind, f in self._kind_index.items()):
+            return False
+        if sum(self._counts[kind] for kind in KINDS) > total:
+            return False
+        log_size = self._size(self._log)
+        if not total:
+            return log_size == 0
+        offset, _ = self._entry(total - 1)
+        self._log.seek(offset)
+        line = self._log.readline()
+        return line.endswith(b'\n') and offset + len(line) == log_size
+
+    def _rebuild(self):
+        # Only after a crash between writing the log and its indexes
+        print(f"Rebuilding history index for {self.csv_path}")
+        for f in [self._index] + list(self._kind_index.values()):
+            f.truncate(0)
+        self._counts = dict.fromkeys((None,) + KINDS, 0)
+        entries = []
+        offset = 0
+        self._log.seek(0)
+        for line in self._log:
+            if not line.endswith(b'\n'):
+                break  # A partial last line from an interrupted append
+            try:
+                kind = json.loads(line).get('action_type')
+            except (ValueError, AttributeError):
+                kind = None
+            entries.append((offset, kind))
+            offset += len(line)
+        self._log.truncate(offset)
+        for offset, kind in entries:
+            self._write_index(offset, kind)
+        self._flush()
+
+    def _write_index(self, offset, kind):
+        code = KINDS.index(kind) + 1 if kind in KINDS else 0
+        self._index.seek(0, os.SEEK_END)
+        self._index.write(_ENTRY.pack(offset, code))
+        self._counts[None] += 1
+        if code:
+            self._kind_index[kind].seek(0, os.SEEK_END)
+            self._kind_index[kind].write(_OFFSET.pack(offset))
+            self._counts[kind] += 1
+
+    def _flush(self):
+        for f in [self._log, self._index] + list(self._kind_index.values()):
+            f.flush()
+
+    def _entry(self, position):
+        self._index.seek(position * _ENTRY.size)
+        return _ENTRY.unpack(self._index.read(_ENTRY.size))
+
+    def _position(self, position, kind):
+        count = self.count(kind)
+        if position < 0:
+            position += count
+        if not 0 <= position < count:
+            raise IndexError("history index out of range")
+        return position
+
+    def count(self, kind=None):
+        """Number of entries of one kind, or of all of them"""
+        return self._counts.get(kind, 0)
+
+    def __len__(self):
+        return self._counts[None]
+
+    def __getitem__(self, position):
+        offset, _ = self._entry(self._position(position, None))
+        return _read_line(self._log, offset)
+
+    def __iter__(self):
+        # Stops at the count when iteration started, so entries appended meanwhile are skipped
+        total = len(self)
+        for start in range(0, total, ITER_PAGE):
+            yield from self.page(start, min(ITER_PAGE, total - start))
+
+    def page(self, start, size, kind=None):
+        """Up to size entries of kind (or of any kind), oldest first, from position start"""
+        start = max(start, 0)
+        size = min(size, self.count(kind) - start)
+        if size <= 0:
+            return []
+        if kind is None:
+            self._index.seek(start * _ENTRY.size)
+            offsets = [offset for offset, _ in _ENTRY.iter_unpack(self._index.read(size * _ENTRY.size))]
+        elif kind in self._kind_index:
+            f = self._kind_index[kind]
+            f.seek(start * _OFFSET.size)
+            offsets = [offset for offset, in _OFFSET.iter_unpack(f.read(size * _OFFSET.size))]
+        else:
+            return []
+        return [_read_line(self._log, offset) for offset in offsets]
+
+    def append(self, item):
+        line = (json.dumps(item.to_dict()) + '\n').encode('utf-8')
+        offset = self._size(self._log)
+        self._log.write(line)
+        self._log.flush()
+        # The log line lands first, so a crash can only leave it unindexed
+        self._write_index(offset, item.action_type)
+        self._flush()
+
+    def extend(self, items):
+        for item in items:
+            line = (json.dumps(item.to_dict()) + '\n').encode('utf-8')
+            offset = self._size(self._log)
+            self._log.write(line)
+            self._write_index(offset, item.action_type)
+        self._flush()
+
+    def pop(self):
+        """Remove and return the newest entry"""
+        position = self._position(-1, None)
+        offset, code = self._entry(position)
+        item = _read_line(self._log, offset)
+        # The log shrinks first, so a crash can only leave index entries past its end
+        self._log.truncate(offset)
+        self._index.truncate(position * _ENTRY.size)
+        self._counts[None] -= 1
+        if code:
+            kind = KINDS[code - 1]
+            self._counts[kind] -= 1
+            self._kind_index[kind].truncate(self._counts[kind] * _OFFSET.size)
+        self._flush()
+        return item
+
+    def clear(self):
+        for f in [self._log, self._index] + list(self._kind_index.values()):
+            f.truncate(0)
+        self._counts = dict.fromkeys((None,) + KINDS, 0)
+        self._flush()
+
+    def move_to(self, csv_path):
+        """Follow the session file to a new name"""
+        if csv_path == self.csv_path:
+            return
+        kept = [] if self.csv_path else list(self)  # In-memory entries are written out
+        self.close()
+        if self.csv_path:
+            for old, new in zip(history_files(self.csv_path), history_files(csv_path)):
+                if os.path.exists(old):
+                    os.replace(old, new)
+        self.csv_path = csv_path
+        self._open_files()
+        self.extend(kept)
+
+    def close(self):
+        for f in [self._log, self._index] + list(self._kind_index.values()):
+            f.close()
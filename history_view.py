@@ -0,0 +1,81 @@
+from collections import OrderedDict
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+PAGE_SIZE = 100
+PAGES_CACHED = 8
+
+
+class HistoryListModel(QAbstractListModel):
+    """One kind of history entry, oldest first, read from the history store a page at a time.
+
+    Only rows the view asks for are loaded, and at most PAGES_CACHED pages are
+    held, so a list view over this model stays cheap however long the history
+    grows. Call refresh() after the history changes.
+    """
+
+    def __init__(self, history, kind, parent=None):
+        super().__init__(parent)
+        self._history = history
+        self._kind = kind
+        self._rows = history.count(kind)
+        self._pages = OrderedDict()  # page number -> [HistoryItem]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._rows
+
+    def item_at(self, row):
+        if not 0 <= row < self._rows:
+            return None
+        number = row // PAGE_SIZE
+        page = self._pages.get(number)
+        if page is None:
+            page = self._history.page(number * PAGE_SIZE, PAGE_SIZE, self._kind)
+            self._pages[number] = page
+            if len(self._pages) > PAGES_CACHED:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(number)
+        offset = row % PAGE_SIZE
+        return page[offset] if offset < len(page) else None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self.item_at(index.row())
+        if item is None:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return item.display_text()
+        if role == Qt.ItemDataRole.UserRole:
+            return item
+        return None
+
+    def source(self):
+        return self._history, self._kind
+
+    def set_source(self, history, kind):
+        """Show another history store or another kind of entry"""
+        self.beginResetModel()
+        self._history = history
+        self._kind = kind
+        self._rows = history.count(kind)
+        self._pages.clear()
+        self.endResetModel()
+
+    def refresh(self):
+        """Catch up with entries appended to or popped from the end of the history"""
+        rows = self._history.count(self._kind)
+        if rows == self._rows:
+            return
+        # Pages from the first changed row on are stale
+        first_stale = min(rows, self._rows) // PAGE_SIZE
+        for number in [n for n in self._pages if n >= first_stale]:
+            del self._pages[number]
+        if rows > self._rows:
+            self.beginInsertRows(QModelIndex(), self._rows, rows - 1)
+            self._rows = rows
+            self.endInsertRows()
+        else:
+            self.beginRemoveRows(QModelIndex(), rows, self._rows - 1)
+            self._rows = rows
+            self.endRemoveRows()
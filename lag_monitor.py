@@ -0,0 +1,107 @@
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque, namedtuple
+from speech_stats import percentile
+
+HEARTBEAT_MS = 16  # one frame at 60 Hz
+STALL_MS = 100  # lateness that counts as a stall worth a stack trace
+FRAMES_KEPT = 240
+STALLS_KEPT = 50
+
+Stall = namedtuple('Stall', ['when', 'lag_ms', 'handler', 'stack'])
+
+
+def _handler(summary):
+    """The outermost frame below the module that started the event loop, i.e. the slot Qt called"""
+    frames = [frame for frame in summary if frame.name != '<module>']
+    frame = frames[0] if frames else (summary[-1] if summary else None)
+    return f"{frame.name} ({os.path.basename(frame.filename)}:{frame.lineno})" if frame else "unknown"
+
+
+class LagMonitor:
+    """How late the GUI event loop runs, measured against a fixed heartbeat.
+
+    The GUI thread calls beat() from a timer every interval_ms; the gap
+    between beats is the frame time, and whatever it exceeds the interval
+    by is lag. A watcher thread checks on the heartbeat, and once it is
+    threshold_ms overdue grabs the GUI thread's Python stack, so the stall
+    recorded when the late beat finally arrives says which handler was
+    running. Nothing here needs Qt.
+    """
+
+    def __init__(self, interval_ms=HEARTBEAT_MS, threshold_ms=STALL_MS, clock=time.perf_counter):
+        self._clock = clock
+        self.interval_ms = interval_ms
+        self.threshold_ms = threshold_ms
+        self.frame_times = deque(maxlen=FRAMES_KEPT)  # ms between beats, oldest first
+        self.stalls = deque(maxlen=STALLS_KEPT)
+        self._thread_id = threading.get_ident()  # The GUI thread, which creates the monitor
+        self._lock = threading.Lock()
+        self._last = None
+        self._stack = None  # Captured by the watcher during the current stall
+        self._stop = threading.Event()
+        self._watcher = None
+
+    @property
+    def running(self):
+        return self._watcher is not None
+
+    def start(self):
+        if self.running:
+            return
+        self._last = self._clock()
+        self._stack = None
+        self._stop.clear()
+        self._watcher = threading.Thread(target=self._watch, name="lag-watchdog", daemon=True)
+        self._watcher.start()
+
+    def stop(self):
+        if not self.running:
+            return
+        self._stop.set()
+        self._watcher.join()
+        self._watcher = None
+
+    def beat(self):
+        """Record a heartbeat; returns the Stall it ended, or None"""
+        now = self._clock()
+        with self._lock:
+            elapsed_ms = (now - self._last) * 1000 if self._last is not None else self.interval_ms
+            self._last = now
+            stack, self._stack = self._stack, None
+        self.frame_times.append(elapsed_ms)
+        lag_ms = elapsed_ms - self.interval_ms
+        if lag_ms < self.threshold_ms:
+            return None
+        summary = stack or traceback.StackSummary()
+        stall = Stall(time.time() - elapsed_ms / 1000, lag_ms, _handler(summary) if stack else "unknown",
+                      summary.format())
+        self.stalls.append(stall)
+        return stall
+
+    def _watch(self):
+        limit = (self.interval_ms + self.threshold_ms) / 1000
+        while not self._stop.wait(self.threshold_ms / 4000):
+            with self._lock:
+                if self._stack is not None or self._last is None or self._clock() - self._last < limit:
+                    continue
+                frame = sys._current_frames().get(self._thread_id)
+                if frame is not None:
+                    self._stack = traceback.extract_stack(frame)
+
+    def frame_stats(self):
+        """(p50, p99, max) frame time in ms over the frames kept"""
+        ordered = sorted(self.frame_times)
+        if not ordered:
+            return 0.0, 0.0, 0.0
+        return percentile(ordered, 50), percentile(ordered, 99), ordered[-1]
+
+    @staticmethod
+    def report(stall):
+        lines = [f"Event loop stalled {stall.lag_ms:.0f} ms in {stall.handler} at "
+                 f"{time.strftime('%H:%M:%S', time.localtime(stall.when))}"]
+        lines += [line.rstrip('\n') for line in stall.stack]
+        return "\n".join(lines)
@@ -0,0 +1,75 @@
+from PyQt6.QtCore import QEvent, QRectF, Qt
+from PyQt6.QtGui import QColor, QFont, QPainter, QPen
+from PyQt6.QtWidgets import QWidget
+
+
+class FrameTimeOverlay(QWidget):
+    """A graph of recent frame times from a LagMonitor, floated over a corner of its parent.
+
+    One bar per heartbeat, newest on the right: green within a frame,
+    orange up to the stall threshold, red beyond it. The overlay ignores
+    the mouse, follows its parent's resizes and repaints only itself.
+    """
+    WIDTH = 260
+    HEIGHT = 84
+    MARGIN = 8
+    SCALE_MS = 200  # frame time at the top of the graph; longer bars are clipped
+
+    BACKGROUND = QColor(0, 0, 0, 170)
+    GOOD = QColor("#55FF55")
+    SLOW = QColor("#FF9800")
+    STALL = QColor("#FF5555")
+    TEXT = QColor("white")
+    GUIDE = QColor(255, 255, 255, 90)
+
+    def __init__(self, monitor, parent):
+        super().__init__(parent)
+        self.monitor = monitor
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setFixedSize(self.WIDTH, self.HEIGHT)
+        self._font = QFont(self.font())
+        self._font.setPixelSize(10)
+        parent.installEventFilter(self)
+        self._place()
+
+    def eventFilter(self, watched, event):
+        if watched is self.parent() and event.type() == QEvent.Type.Resize:
+            self._place()
+        return False
+
+    def _place(self):
+        self.move(self.parent().width() - self.WIDTH - self.MARGIN, self.MARGIN)
+        self.raise_()
+
+    def _color(self, ms):
+        if ms >= self.monitor.interval_ms + self.monitor.threshold_ms:
+            return self.STALL
+        if ms > self.monitor.interval_ms * 2:
+            return self.SLOW
+        return self.GOOD
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.BACKGROUND)
+        painter.setFont(self._font)
+        painter.setPen(self.TEXT)
+
+        p50, p99, worst = self.monitor.frame_stats()
+        painter.drawText(QRectF(6, 2, self.WIDTH - 12, 14), Qt.AlignmentFlag.AlignLeft,
+                         f"frame p50 {p50:.0f}  p99 {p99:.0f}  max {worst:.0f} ms")
+        stalls = self.monitor.stalls
+        last = f"last stall {stalls[-1].lag_ms:.0f} ms: {stalls[-1].handler}" if stalls else "no stalls"
+        painter.drawText(QRectF(6, self.HEIGHT - 15, self.WIDTH - 12, 14), Qt.AlignmentFlag.AlignLeft,
+                         painter.fontMetrics().elidedText(last, Qt.TextElideMode.ElideRight, self.WIDTH - 12))
+
+        graph = QRectF(6, 18, self.WIDTH - 12, self.HEIGHT - 36)
+        frames = list(self.monitor.frame_times)[-int(graph.width()):]
+        for x, ms in enumerate(frames, start=int(graph.right()) - len(frames)):
+            height = min(ms, self.SCALE_MS) / self.SCALE_MS * graph.height()
+            painter.fillRect(QRectF(x, graph.bottom() - height, 1, height), self._color(ms))
+
+        # Guides at one frame and at the stall threshold
+        painter.setPen(QPen(self.GUIDE, 1, Qt.PenStyle.DotLine))
+        for ms in (self.monitor.interval_ms, self.monitor.interval_ms + self.monitor.threshold_ms):
+            y = graph.bottom() - min(ms, self.SCALE_MS) / self.SCALE_MS * graph.height()
+            painter.drawLine(int(graph.left()), int(y), int(graph.right()), int(y))
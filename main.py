@@ -1,9 +1,16 @@
-from ui import CongressTracker
-import sys
-from PyQt6.QtWidgets import QApplication
+from startup_trace import StartupTrace
+
+# Started before anything else is imported, so the startup trace covers imports too
+trace = StartupTrace()
+with trace.phase("imports"):
+    from ui import CongressTracker
+    import sys
+    from PyQt6.QtWidgets import QApplication
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    window = CongressTracker()
+    with trace.phase("app"):
+        app = QApplication(sys.argv)
+    with trace.phase("window"):
+        window = CongressTracker(trace)
     window.show()
     sys.exit(app.exec())
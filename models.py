@@ -1,7 +1,118 @@
 import datetime
 import json
+import sys
+
+EPOCH = datetime.datetime(1970, 1, 1)
+MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+def to_epoch_us(text):
+    """Integer microseconds since EPOCH for a naive ISO timestamp, or None.
+
+    None is returned for anything that would not format back to exactly the
+    same string, so callers can keep the original text instead.
+    """
+    if not isinstance(text, str):
+        return None
+    try:
+        moment = datetime.datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if moment.tzinfo is not None or moment.isoformat() != text:
+        return None
+    return (moment - EPOCH) // MICROSECOND
+
+def from_epoch_us(stamp):
+    return (EPOCH + stamp * MICROSECOND).isoformat()
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class SpeechRecord:
+    """One logged speech, stored compactly.
+
+    The timestamp is kept as integer microseconds since EPOCH and the side and
+    resolution strings are interned, since every speech repeats them. Keys
+    this class doesn't know about, and timestamps that aren't plain ISO
+    strings, are kept in extra so to_dict() reproduces the original dict.
+    """
+    __slots__ = ('round', 'side', 'duration', 'stamp', 'resolution', 'extra')
+
+    def __init__(self, round=0, side="", duration=0, stamp=None, resolution="", extra=None):
+        self.round = round
+        self.side = _intern(side)
+        self.duration = duration
+        self.stamp = stamp
+        self.resolution = _intern(resolution)
+        self.extra = extra
+
+    @property
+    def timestamp(self):
+        if self.extra and 'timestamp' in self.extra:
+            return self.extra['timestamp']
+        return from_epoch_us(self.stamp) if self.stamp is not None else ""
+
+    def to_dict(self):
+        data = {'round': self.round, 'side': self.side, 'duration': self.duration}
+        if self.stamp is not None or (self.extra and 'timestamp' in self.extra):
+            data['timestamp'] = self.timestamp
+        data['resolution'] = self.resolution
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        extra = {k: v for k, v in data.items() if k not in ('round', 'side', 'duration', 'timestamp', 'resolution')}
+        stamp = to_epoch_us(data.get('timestamp'))
+        if stamp is None and 'timestamp' in data:
+            extra['timestamp'] = data['timestamp']
+        return cls(data.get('round', 0), data.get('side', ""), data.get('duration', 0),
+                   stamp, data.get('resolution', ""), extra or None)
+
+
+class QuestionRecord:
+    """One logged question; see SpeechRecord for how fields are stored"""
+    __slots__ = ('round', 'stamp', 'extra')
+
+    def __init__(self, round=0, stamp=None, extra=None):
+        self.round = round
+        self.stamp = stamp
+        self.extra = extra
+
+    @property
+    def timestamp(self):
+        if self.extra and 'timestamp' in self.extra:
+            return self.extra['timestamp']
+        return from_epoch_us(self.stamp) if self.stamp is not None else ""
+
+    def to_dict(self):
+        data = {'round': self.round}
+        if self.stamp is not None or (self.extra and 'timestamp' in self.extra):
+            data['timestamp'] = self.timestamp
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        extra = {k: v for k, v in data.items() if k not in ('round', 'timestamp')}
+        stamp = to_epoch_us(data.get('timestamp'))
+        if stamp is None and 'timestamp' in data:
+            extra['timestamp'] = data['timestamp']
+        return cls(data.get('round', 0), stamp, extra or None)
+
+
+def now_epoch_us():
+    return (datetime.datetime.now() - EPOCH) // MICROSECOND
+
 
 class Competitor:
+    __slots__ = ('name', 'speeches', 'questions', 'last_speech_round', 'last_question_round',
+                 'speech_rank', 'question_rank', 'current_side', 'resolution_sides', 'notes',
+                 'speech_records', 'question_records', 'speech_index')
+
     def __init__(self, name):
         self.name = name
         self.speeches = 0
@@ -12,11 +123,11 @@ class Competitor:
         self.question_rank = 0
         self.current_side = ""
         self.resolution_sides = {}
-        self.notes = {
-            'speeches': [],
-            'questions': [],
-            'general': ""
-        }
+        self.speech_records = []
+        self.question_records = []
+        self.speech_index = {}  # resolution -> positions in speech_records
+        # Free-text notes by category ('general', 'speech_1', ...)
+        self.notes = {'general': ""}
         
     def to_dict(self):
         """Convert competitor data to dictionary for serialization"""
@@ -29,31 +140,58 @@ class Competitor:
             'speech_rank': self.speech_rank,
             'question_rank': self.question_rank,
             'current_side': self.current_side,
-            'notes': self.notes  # Store notes directly (will be JSON serialized later)
+            'notes': self.notes_dict()  # Will be JSON serialized later
+        }
+
+    def notes_dict(self):
+        """Notes in the saved format, with speech and question records as dicts"""
+        notes = {
+            'speeches': [record.to_dict() for record in self.speech_records],
+            'questions': [record.to_dict() for record in self.question_records],
         }
+        # A "Questions" text note is saved under the same key as the records and replaces them
+        notes.update(self.notes)
+        return notes
         
     def add_speech(self, round_num, side="", duration=0, resolution=""):
         """Add a speech record with full details"""
-        speech_data = {
-            'round': round_num,
-            'side': side,
-            'duration': duration,
-            'timestamp': datetime.datetime.now().isoformat(),
-            'resolution': resolution
-        }
-        self.notes['speeches'].append(speech_data)
-        self.speeches = len(self.notes['speeches'])
-        self.current_side = side
-        self.last_speech_round = round_num
+        self.add_speech_record(SpeechRecord(round_num, side, duration, now_epoch_us(), resolution))
+
+    def add_speech_record(self, record):
+        self.speech_records.append(record)
+        self.speech_index.setdefault(record.resolution, []).append(len(self.speech_records) - 1)
+        self.speeches = len(self.speech_records)
+        self.current_side = record.side
+        self.last_speech_round = record.round
+
+    def reindex_speeches(self):
+        """Rebuild speech_index after speech_records was filled directly"""
+        self.speech_index = {}
+        for position, record in enumerate(self.speech_records):
+            self.speech_index.setdefault(record.resolution, []).append(position)
+
+    def speeches_for_resolution(self, resolution):
+        return [self.speech_records[i] for i in self.speech_index.get(resolution, ())]
+
+    def last_speech_for_resolution(self, resolution):
+        positions = self.speech_index.get(resolution)
+        return self.speech_records[positions[-1]] if positions else None
+
+    def remove_speeches_from(self, count):
+        """Drop every speech record after the first count and return the dropped ones"""
+        removed = self.speech_records[count:]
+        del self.speech_records[count:]
+        for record in removed:
+            positions = self.speech_index[record.resolution]
+            positions.pop()
+            if not positions:
+                del self.speech_index[record.resolution]
+        return removed
         
     def add_question(self, round_num):
         """Add a question record"""
-        question_data = {
-            'round': round_num,
-            'timestamp': datetime.datetime.now().isoformat()
-        }
-        self.notes['questions'].append(question_data)
-        self.questions = len(self.notes['questions'])
+        self.question_records.append(QuestionRecord(round_num, now_epoch_us()))
+        self.questions = len(self.question_records)
         self.last_question_round = round_num
         
     def reset_side(self):
@@ -86,22 +224,23 @@ class Competitor:
                 notes = json.loads(notes)
             except json.JSONDecodeError:
                 notes = {}
-                
-        # Ensure notes has required structure
-        competitor.notes = {
-            'speeches': notes.get('speeches', []),
-            'questions': notes.get('questions', []),
-            'general': notes.get('general', "")
-        }
-        
-        # Validate speech data
-        for speech in competitor.notes['speeches']:
-            if not isinstance(speech, dict):
-                competitor.notes['speeches'].remove(speech)
-                continue
-            speech.setdefault('resolution', "")
-            speech.setdefault('side', "")
-            speech.setdefault('duration', 0)
+        if not isinstance(notes, dict):
+            notes = {}
+
+        # Validate speech data; records that aren't dicts are dropped
+        for speech in notes.get('speeches', []):
+            if isinstance(speech, dict):
+                speech.setdefault('resolution', "")
+                speech.setdefault('side', "")
+                speech.setdefault('duration', 0)
+                competitor.speech_records.append(SpeechRecord.from_dict(speech))
+        competitor.reindex_speeches()
+        questions = notes.get('questions', [])
+        if isinstance(questions, list):
+            competitor.question_records = [QuestionRecord.from_dict(q) for q in questions if isinstance(q, dict)]
+        competitor.notes = {k: v for k, v in notes.items()
+                            if k != 'speeches' and not (k == 'questions' and isinstance(v, list))}
+        competitor.notes.setdefault('general', "")
             
         return competitor
         
@@ -116,6 +255,58 @@ class Competitor:
         return f"{self.name:<20}{side_display:^6} | Questions: {self.questions:<3} | Rank: {self.question_rank}"
 
 
+class CompetitorRegistry:
+    """Competitors looked up by exact name or case-insensitively"""
+
+    def __init__(self, competitors=()):
+        self.reset(competitors)
+
+    def reset(self, competitors):
+        self._by_name = {}
+        self._by_folded = {}  # casefolded name -> competitors with that name, first added first
+        for competitor in competitors:
+            self.add(competitor)
+
+    def add(self, competitor):
+        if competitor.name in self._by_name:
+            self.remove(competitor.name)
+        self._by_name[competitor.name] = competitor
+        self._by_folded.setdefault(competitor.name.casefold(), []).append(competitor)
+
+    def remove(self, name):
+        competitor = self._by_name.pop(name, None)
+        if competitor is not None:
+            # Names differing only in case share a key; keep the others findable
+            matches = self._by_folded[name.casefold()]
+            matches.remove(competitor)
+            if not matches:
+                del self._by_folded[name.casefold()]
+        return competitor
+
+    def rename(self, old_name, new_name):
+        """Rename a competitor, updating both the object and the lookups"""
+        competitor = self.remove(old_name)
+        if competitor is not None:
+            competitor.name = new_name
+            self.add(competitor)
+        return competitor
+
+    def get(self, name):
+        """Competitor with exactly this name, or None"""
+        return self._by_name.get(name)
+
+    def find(self, name):
+        """Competitor whose name matches ignoring case, or None"""
+        matches = self._by_folded.get(name.casefold())
+        return matches[0] if matches else None
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def __len__(self):
+        return len(self._by_name)
+
+
 class HistoryItem:
     def __init__(self, action_type, competitor_name, count_type, old_value, new_value, timestamp):
         self.action_type = action_type
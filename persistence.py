@@ -1,10 +1,32 @@
 import csv
+import io
 import os
 import json
-from PyQt6.QtWidgets import QMessageBox
+import queue
+import threading
+import time
+import zlib
+from collections import namedtuple
+import sqlite_store
 from models import Competitor
+from precedence import RecencyOrder
 
 MAP_STATE_PATH = 'data/map_state.json'
+JOURNAL_COMPACT_EVERY = 200  # journal entries before the session is rewritten as a snapshot
+
+
+class PersistenceError(Exception):
+    """A session file couldn't be read, written or removed; the message says which and why"""
+
+class SessionLoadError(PersistenceError):
+    pass
+
+class SessionSaveError(PersistenceError):
+    pass
+
+class SessionClearError(PersistenceError):
+    pass
+
 
 def save_map_state(self):
     try:
@@ -15,7 +37,7 @@ def save_map_state(self):
         with open(MAP_STATE_PATH, 'w') as f:
             json.dump(data, f)
     except Exception as e:
-        QMessageBox.warning(None, "Save Error", f"Failed to save map state: {str(e)}")
+        raise SessionSaveError(f"Failed to save map state: {str(e)}") from e
 
 def load_from_csv(file_path):
     competitors = []
@@ -25,8 +47,14 @@ def load_from_csv(file_path):
     resolution_list = []
     current_resolution = ""
     current_side = "Affirmative"
+    journal_seq = 0
     
     try:
+        # Finish any interrupted save and check the sidecars belong together
+        problems = recover_bundle(file_path)
+        for problem in problems:
+            print(f"Session files out of sync: {problem}")
+
         # Load competitors
         with open(file_path, 'r', newline='') as csvfile:
             reader = csv.DictReader(csvfile)
@@ -76,6 +104,7 @@ def load_from_csv(file_path):
                     resolution_list = resolution_data.get('resolution_list', [])
                     current_resolution = resolution_data.get('current_resolution', "")
                     current_side = resolution_data.get('current_side', "Affirmative")
+                    journal_seq = int(resolution_data.get('journal_seq', 0))
             except Exception as e:
                 print(f"Error loading resolution data: {str(e)}")
         
@@ -85,76 +114,272 @@ def load_from_csv(file_path):
         if not question_recency_order:
             question_recency_order = [c.name for c in competitors]
 
+        # A recency sidecar from a different save than the CSV may name people who
+        # are gone or miss new ones; keep whatever order is still usable
+        names = [c.name for c in competitors]
+        if problems or set(speech_recency_order) != set(names) or set(question_recency_order) != set(names):
+            speech_recency_order = reconcile_recency(speech_recency_order, names)
+            question_recency_order = reconcile_recency(question_recency_order, names)
+
+        # Replay anything journaled after the snapshot was written
+        journal_filepath = journal_path(file_path)
+        if os.path.exists(journal_filepath):
+            speech_order = RecencyOrder.from_list(speech_recency_order)
+            question_order = RecencyOrder.from_list(question_recency_order)
+            resolution_state = {
+                'resolution_list': resolution_list,
+                'current_resolution': current_resolution,
+                'current_side': current_side,
+            }
+            by_name = {c.name: c for c in competitors}
+            for event in read_journal(journal_filepath, after_seq=journal_seq):
+                try:
+                    apply_journal_event(event, by_name, history, speech_order, question_order, resolution_state)
+                except Exception as e:
+                    print(f"Error replaying journal entry {event}: {str(e)}")
+            speech_recency_order = speech_order.to_list()
+            question_recency_order = question_order.to_list()
+            resolution_list = resolution_state['resolution_list']
+            current_resolution = resolution_state['current_resolution']
+            current_side = resolution_state['current_side']
+
     except Exception as e:
         print(f"Error loading CSV: {str(e)}")
-        raise
+        raise SessionLoadError(f"Failed to read {os.path.basename(file_path)}: {str(e)}") from e
 
     return competitors, history, speech_recency_order, question_recency_order, resolution_list, current_resolution, current_side
 
-def save_to_csv(filepath, competitors, history=None, speech_recency_order=None, question_recency_order=None, resolution_list=None, current_resolution=None, current_side=None):
+CSV_FIELDNAMES = [
+    'name',
+    'speeches',
+    'questions',
+    'last_speech_round',
+    'last_question_round',
+    'speech_rank',
+    'question_rank',
+    'current_side',
+    'notes',
+]
+
+SessionSnapshot = namedtuple('SessionSnapshot', ['rows', 'history', 'recency', 'resolutions', 'undo'],
+                             defaults=(None,))
+
+def snapshot_session(competitors, history=None, speech_recency_order=None, question_recency_order=None, resolution_list=None, current_resolution=None, current_side=None, journal_seq=None, undo_state=None):
+    """Copy session state into plain data that shares nothing with the live objects.
+
+    The snapshot can be handed to another thread and written later while the
+    GUI keeps changing the competitors.
+    """
+    rows = []
+    for c in competitors:
+        data = c.to_dict()
+        # Notes (including speech and question records) go in the CSV as a JSON string
+        data['notes'] = json.dumps(data['notes'])
+        rows.append(data)
+
+    history_data = None
+    if history is not None:
+        history_data = [item.to_dict() for item in history]
+
+    recency_data = None
+    if speech_recency_order is not None or question_recency_order is not None:
+        recency_data = {}
+        # Recency orders may be RecencyOrder objects; they are stored as plain lists
+        if speech_recency_order is not None:
+            recency_data['speech_recency_order'] = list(speech_recency_order)
+        if question_recency_order is not None:
+            recency_data['question_recency_order'] = list(question_recency_order)
+
+    resolution_data = None
+    if resolution_list is not None or current_resolution is not None or current_side is not None or journal_seq is not None:
+        resolution_data = {}
+        if resolution_list is not None:
+            resolution_data['resolution_list'] = list(resolution_list)
+        if current_resolution is not None:
+            resolution_data['current_resolution'] = current_resolution
+        if current_side is not None:
+            resolution_data['current_side'] = current_side
+        if journal_seq is not None:
+            # Journal entries up to this number are already part of the snapshot
+            resolution_data['journal_seq'] = journal_seq
+
+    # undo_state comes from UndoStack.to_dict(), which already builds fresh data
+    return SessionSnapshot(tuple(rows), history_data, recency_data, resolution_data, undo_state)
+
+def manifest_path(filepath):
+    return filepath.replace('.csv', '_manifest.json')
+
+def undo_path(filepath):
+    return filepath.replace('.csv', '_undo.json')
+
+def bundle_paths(filepath):
+    """Every file a snapshot of this session can write, manifest included"""
+    return [filepath] + [filepath.replace('.csv', suffix) for suffix in
+                         ('_history.json', '_recency.json', '_resolutions.json', '_undo.json', '_manifest.json')]
+
+def _render_snapshot(filepath, snapshot):
+    """Map each file of the bundle to the text it should contain"""
+    buffer = io.StringIO(newline='')
+    if snapshot.rows:
+        writer = csv.DictWriter(buffer, fieldnames=CSV_FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(snapshot.rows)
+    files = {filepath: buffer.getvalue()}
+
+    # History, recency orders and resolution data go in JSON sidecars
+    if snapshot.history is not None:
+        files[filepath.replace('.csv', '_history.json')] = json.dumps(snapshot.history, indent=2)
+    if snapshot.recency is not None:
+        files[filepath.replace('.csv', '_recency.json')] = json.dumps(snapshot.recency, indent=2)
+    if snapshot.resolutions is not None:
+        files[filepath.replace('.csv', '_resolutions.json')] = json.dumps(snapshot.resolutions, indent=2)
+    if snapshot.undo is not None:
+        files[undo_path(filepath)] = json.dumps(snapshot.undo)
+    return files
+
+def _fingerprint(data):
+    return {'size': len(data), 'crc32': zlib.crc32(data)}
+
+def _fsync_directory(directory):
+    # Makes the renames themselves durable; not supported on Windows
+    if os.name == 'nt':
+        return
+    fd = os.open(directory or '.', os.O_RDONLY)
     try:
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        
-        # Save competitors
-        with open(filepath, 'w', newline='', encoding='utf-8') as file:
-            if competitors:
-                fieldnames = [
-                    'name',
-                    'speeches',
-                    'questions',
-                    'last_speech_round',
-                    'last_question_round',
-                    'speech_rank',
-                    'question_rank',
-                    'current_side',
-                    'notes',
-                ]
-                writer = csv.DictWriter(file, fieldnames=fieldnames)
-                writer.writeheader()
-                for c in competitors:
-                    data = c.to_dict()
-                    # Serialize notes to JSON string if they exist
-                    if hasattr(c, 'notes'):
-                        data['notes'] = json.dumps(c.notes)
-                    else:
-                        data['notes'] = json.dumps({'speeches': [], 'questions': []})
-                    writer.writerow(data)
-
-        # Save history separately as JSON
-        if history is not None:
-            history_filepath = filepath.replace('.csv', '_history.json')
-            with open(history_filepath, 'w', encoding='utf-8') as f:
-                history_data = [item.to_dict() for item in history]
-                json.dump(history_data, f, indent=2)
-
-        # Save recency orders separately as JSON
-        if speech_recency_order is not None or question_recency_order is not None:
-            recency_filepath = filepath.replace('.csv', '_recency.json')
-            recency_data = {}
-            if speech_recency_order is not None:
-                recency_data['speech_recency_order'] = speech_recency_order
-            if question_recency_order is not None:
-                recency_data['question_recency_order'] = question_recency_order
-            
-            with open(recency_filepath, 'w', encoding='utf-8') as f:
-                json.dump(recency_data, f, indent=2)
-
-        # Save resolution data separately as JSON
-        if resolution_list is not None or current_resolution is not None or current_side is not None:
-            resolution_filepath = filepath.replace('.csv', '_resolutions.json')
-            resolution_data = {}
-            if resolution_list is not None:
-                resolution_data['resolution_list'] = resolution_list
-            if current_resolution is not None:
-                resolution_data['current_resolution'] = current_resolution
-            if current_side is not None:
-                resolution_data['current_side'] = current_side
-            
-            with open(resolution_filepath, 'w', encoding='utf-8') as f:
-                json.dump(resolution_data, f, indent=2)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
-    except Exception as e:
-        QMessageBox.warning(None, "Save Error", f"Failed to save CSV file: {str(e)}")
+def write_snapshot(filepath, snapshot):
+    """Write a SessionSnapshot as the CSV plus its JSON sidecars, atomically as a group.
+
+    Every file is written to a .tmp sibling first, and the temp files are
+    flushed to disk together in one pass before anything is renamed. The group
+    ends with a manifest of sizes and checksums that load_from_csv uses to
+    finish an interrupted save or to spot sidecars that don't belong together.
+    Raises OSError on failure.
+    """
+    directory = os.path.dirname(filepath)
+    os.makedirs(directory, exist_ok=True)
+
+    files = {path: text.encode('utf-8') for path, text in _render_snapshot(filepath, snapshot).items()}
+    manifest = {
+        'generation': time.time_ns(),
+        'files': {os.path.basename(path): _fingerprint(data) for path, data in files.items()},
+    }
+    files[manifest_path(filepath)] = json.dumps(manifest, indent=2).encode('utf-8')
+
+    # 1) Write every temp file, then sync them as one group
+    handles = []
+    try:
+        for path, data in files.items():
+            f = open(path + '.tmp', 'wb')
+            handles.append(f)
+            f.write(data)
+            f.flush()
+        for f in handles:
+            os.fsync(f.fileno())
+    finally:
+        for f in handles:
+            f.close()
+
+    # 2) Swap them into place; the manifest goes last so it marks a finished group
+    for path in files:
+        os.replace(path + '.tmp', path)
+    _fsync_directory(directory)
+
+def recover_bundle(filepath):
+    """Finish an interrupted save and check that the CSV and its sidecars match.
+
+    Returns a list of human-readable problems; an empty list means the bundle is
+    consistent (or predates manifests).
+    """
+    directory = os.path.dirname(filepath)
+    manifest_file = manifest_path(filepath)
+    problems = []
+
+    # A leftover manifest temp may belong to a group that was cut off before its
+    # temps were synced, so the renames are only completed once every file of
+    # the group checks out against it; otherwise the group is discarded
+    if os.path.exists(manifest_file + '.tmp'):
+        try:
+            with open(manifest_file + '.tmp', 'r', encoding='utf-8') as f:
+                pending = json.load(f)
+            torn = _torn_files(directory, pending.get('files', {}))
+            if torn:
+                problems.append(f"Discarded an interrupted save: {', '.join(torn)} incomplete")
+            else:
+                for name in pending.get('files', {}):
+                    tmp = os.path.join(directory, name) + '.tmp'
+                    if os.path.exists(tmp):
+                        os.replace(tmp, os.path.join(directory, name))
+                os.replace(manifest_file + '.tmp', manifest_file)
+                _fsync_directory(directory)
+                print(f"Completed an interrupted save of {os.path.basename(filepath)}")
+        except (OSError, ValueError, AttributeError) as e:
+            problems.append(f"Could not finish interrupted save: {str(e)}")
+
+    # Any temps still here are from a save that never reached its rename step
+    for path in bundle_paths(filepath):
+        if os.path.exists(path + '.tmp'):
+            try:
+                os.remove(path + '.tmp')
+            except OSError:
+                pass
+
+    if not os.path.exists(manifest_file):
+        return problems
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        return problems + [f"Unreadable manifest: {str(e)}"]
+
+    for name, expected in manifest.get('files', {}).items():
+        path = os.path.join(directory, name)
+        try:
+            with open(path, 'rb') as f:
+                actual = _fingerprint(f.read())
+        except OSError:
+            problems.append(f"{name} is missing")
+            continue
+        if actual != expected:
+            problems.append(f"{name} does not match the last save")
+    return problems
+
+def _torn_files(directory, expected_files):
+    """Names in a pending manifest whose temp (or, once renamed, final file) doesn't match it"""
+    torn = []
+    for name, expected in expected_files.items():
+        path = os.path.join(directory, name)
+        # A crash partway through the renames leaves some files already in place
+        candidate = path + '.tmp' if os.path.exists(path + '.tmp') else path
+        try:
+            with open(candidate, 'rb') as f:
+                actual = _fingerprint(f.read())
+        except OSError:
+            actual = None
+        if actual != expected:
+            torn.append(name)
+    return torn
+
+def reconcile_recency(order, names):
+    """Drop unknown names from a recency list and append competitors it is missing"""
+    known = set(names)
+    kept = [n for n in dict.fromkeys(order) if n in known]
+    seen = set(kept)
+    return kept + [n for n in names if n not in seen]
+
+def save_to_csv(filepath, competitors, history=None, speech_recency_order=None, question_recency_order=None, resolution_list=None, current_resolution=None, current_side=None, journal_seq=None):
+    """Synchronously write the session bundle; raises SessionSaveError if it can't be written"""
+    snapshot = snapshot_session(
+        competitors, history, speech_recency_order, question_recency_order,
+        resolution_list, current_resolution, current_side, journal_seq
+    )
+    try:
+        write_snapshot(filepath, snapshot)
+    except (OSError, ValueError) as e:
+        raise SessionSaveError(f"Failed to save {os.path.basename(filepath)}: {str(e)}") from e
 
 def clear_csv_data(filepath):
     try:
@@ -173,6 +398,331 @@ def clear_csv_data(filepath):
         resolution_filepath = filepath.replace('.csv', '_resolutions.json')
         if os.path.exists(resolution_filepath):
             os.remove(resolution_filepath)
+
+        journal_filepath = journal_path(filepath)
+        if os.path.exists(journal_filepath):
+            os.remove(journal_filepath)
+
+        manifest_filepath = manifest_path(filepath)
+        if os.path.exists(manifest_filepath):
+            os.remove(manifest_filepath)
+
+        undo_filepath = undo_path(filepath)
+        if os.path.exists(undo_filepath):
+            os.remove(undo_filepath)
             
-    except Exception as e:
-        QMessageBox.warning(None, "Clear Error", f"Failed to delete file: {str(e)}")
\ No newline at end of file
+    except OSError as e:
+        raise SessionClearError(f"Failed to delete file: {str(e)}") from e
+
+def journal_path(filepath):
+    return filepath.replace('.csv', '_journal.jsonl')
+
+def snapshot_journal_seq(filepath):
+    """Journal seq recorded by the last snapshot of this session, or 0"""
+    resolution_filepath = filepath.replace('.csv', '_resolutions.json')
+    try:
+        with open(resolution_filepath, 'r', encoding='utf-8') as f:
+            return int(json.load(f).get('journal_seq', 0))
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+def load_undo(file_path):
+    """Saved undo/redo state for a session, plus actions journaled since the snapshot.
+
+    Returns a dict in UndoStack.to_dict() form.
+    """
+    state = {'undo': [], 'redo': []}
+    try:
+        with open(undo_path(file_path), 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        state['undo'] = list(saved.get('undo', []))
+        state['redo'] = list(saved.get('redo', []))
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, AttributeError) as e:
+        print(f"Error loading undo history: {str(e)}")
+
+    journal_filepath = journal_path(file_path)
+    if os.path.exists(journal_filepath):
+        for event in read_journal(journal_filepath, after_seq=snapshot_journal_seq(file_path)):
+            if event.get('action'):
+                # A new action always clears whatever could have been redone
+                state['undo'].append(event['action'])
+                state['redo'] = []
+    return state
+
+def read_journal(journal_filepath, after_seq=0):
+    """Yield journal events newer than after_seq, skipping damaged lines"""
+    with open(journal_filepath, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                # A crash mid-append leaves at most one partial line at the end
+                print(f"Skipping damaged journal line: {line[:80]}")
+                continue
+            if isinstance(event, dict) and event.get('seq', 0) > after_seq:
+                yield event
+
+def apply_journal_event(event, competitors_by_name, history, speech_order, question_order, resolution_state):
+    """Apply one journaled action to loaded session state"""
+    from models import HistoryItem, SpeechRecord # Import here to avoid circular imports
+    op = event.get('op')
+    competitor = competitors_by_name.get(event.get('name'))
+
+    if op == 'speech' and competitor:
+        record = SpeechRecord.from_dict(event['speech'])
+        competitor.add_speech_record(record)
+        if record.resolution:
+            competitor.resolution_sides[record.resolution] = record.side
+        speech_order.move_to_end(competitor.name)
+        resolution_state['current_side'] = event.get('current_side', resolution_state['current_side'])
+    elif op == 'question' and competitor:
+        competitor.questions = event['questions']
+        competitor.last_question_round = event.get('round', 0)
+        question_order.move_to_end(competitor.name)
+    elif op == 'move' and competitor:
+        order = speech_order if event.get('list') == 'speech' else question_order
+        order.swap(competitor.name, event.get('direction', 0))
+    elif op == 'notes' and competitor:
+        competitor.notes[event['category']] = event.get('text', "")
+    elif op == 'resolution':
+        previous = resolution_state['current_resolution']
+        for key in ('resolution_list', 'current_resolution', 'current_side'):
+            if key in event:
+                resolution_state[key] = event[key]
+        if resolution_state['current_resolution'] != previous:
+            # Switching resolution shows the sides taken on the new one, as set_current_resolution does
+            for c in competitors_by_name.values():
+                c.current_side = c.resolution_sides.get(resolution_state['current_resolution'], "")
+
+    if event.get('history'):
+        history.append(HistoryItem.from_dict(event['history']))
+
+
+def append_lines(path, lines):
+    """Append journal lines and sync them with a single fsync"""
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(''.join(lines))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+class SessionJournal:
+    """Append-only log of actions kept next to a CSV save.
+
+    Each action appends one small JSON line instead of rewriting the CSV and its
+    sidecars. The owner writes a full snapshot with save_to_csv once
+    needs_compaction() says so, passing the journal's seq, and then calls
+    truncate(), which only removes entries a snapshot on disk already holds;
+    load_from_csv replays whatever is newer than the snapshot.
+    With a PersistenceWriter attached, appends and truncation go through its
+    queue in order with the snapshots.
+    """
+
+    def __init__(self, csv_path, compact_every=JOURNAL_COMPACT_EVERY, writer=None):
+        self.csv_path = csv_path
+        self.path = journal_path(csv_path)
+        self.writer = writer
+        self.compact_every = compact_every
+        self.seq = snapshot_journal_seq(csv_path)
+        self.entries = 0
+        self._terminate_partial_line = False
+        if os.path.exists(self.path):
+            # Continue numbering after whatever is already on disk
+            for event in read_journal(self.path):
+                self.seq = max(self.seq, event.get('seq', 0))
+                self.entries += 1
+            # Don't glue the next entry onto a line cut short by a crash
+            with open(self.path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell():
+                    f.seek(-1, os.SEEK_END)
+                    self._terminate_partial_line = f.read(1) != b'\n'
+
+    def append(self, op, **fields):
+        self.seq += 1
+        event = {'seq': self.seq, 'op': op, **fields}
+        line = json.dumps(event, separators=(',', ':')) + '\n'
+        if self._terminate_partial_line:
+            line = '\n' + line
+            self._terminate_partial_line = False
+        if self.writer is not None:
+            self.writer.submit_append(self.path, line)
+        else:
+            append_lines(self.path, [line])
+        self.entries += 1
+        return event
+
+    def needs_compaction(self):
+        return self.entries >= self.compact_every
+
+    def covered(self):
+        """Whether the snapshot on disk includes every entry journaled so far"""
+        return snapshot_journal_seq(self.csv_path) >= self.seq
+
+    def truncate(self):
+        """Forget journaled entries once a snapshot containing them has been written.
+
+        If that snapshot didn't make it to disk the journal is kept, since it
+        is then the only copy of those actions.
+        """
+        if self.writer is not None:
+            self.writer.submit_truncate(self.path, self.csv_path, self.seq)
+        elif not self.covered():
+            print(f"Keeping {os.path.basename(self.path)}: the last snapshot was not saved")
+            return
+        elif os.path.exists(self.path):
+            os.remove(self.path)
+        self.entries = 0
+        self._terminate_partial_line = False
+
+
+class PersistenceWriter:
+    """Background thread that performs session writes off the GUI thread.
+
+    Work arrives through a bounded queue: snapshots (from snapshot_session)
+    for a CSV bundle or a database session, journal appends and journal
+    truncations. The thread drains whatever has piled up, drops writes that a
+    later item in the same batch supersedes (an older snapshot of the same
+    file or session, or journal lines that are truncated away) and performs
+    the rest in order. A journal is only truncated once the snapshot holding
+    its entries is on disk; if that snapshot failed, the journal and its
+    pending lines are kept. Databases are written through the thread's own
+    connections, so callers that also use the database must flush() first.
+    Failures are passed to on_error as a message, from the writer thread.
+    """
+
+    def __init__(self, on_error=None, max_pending=64):
+        self.on_error = on_error
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._run, name="persistence-writer", daemon=True)
+        self._closed = False
+        self._stores = {}  # database path -> SQLiteStore, used only by the writer thread
+        self._thread.start()
+
+    def submit_snapshot(self, filepath, snapshot):
+        self._put(('snapshot', filepath, snapshot))
+
+    def submit_store_snapshot(self, database_path, key, snapshot):
+        """Replace the session stored under key in the database at database_path"""
+        self._put(('store', database_path, (key, snapshot)))
+
+    def submit_append(self, path, line):
+        self._put(('append', path, line))
+
+    def submit_truncate(self, path, csv_path, seq):
+        """Remove the journal at path, provided the snapshot of csv_path covers seq by then"""
+        self._put(('truncate', path, (csv_path, seq)))
+
+    def _put(self, task):
+        if self._closed:
+            raise RuntimeError("Persistence writer is closed")
+        # Blocks only if max_pending writes are already outstanding
+        self._queue.put(task)
+
+    def flush(self):
+        """Block until everything submitted so far is on disk (or has failed)"""
+        self._queue.join()
+
+    def close(self):
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = None in batch
+            try:
+                self._write_batch([task for task in batch if task is not None])
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                self._close_stores()
+                return
+
+    def _write_batch(self, batch):
+        last_snapshot = {}
+        for i, (kind, path, payload) in enumerate(batch):
+            if kind == 'snapshot':
+                last_snapshot[path] = i
+            elif kind == 'store':
+                last_snapshot[path, payload[0]] = i
+
+        # Journal lines are held back until the batch ends or a truncate decides
+        # they are already in a snapshot
+        pending_lines = {}
+        for i, (kind, path, payload) in enumerate(batch):
+            if kind == 'append':
+                pending_lines.setdefault(path, []).append(payload)
+            elif kind == 'snapshot':
+                if i < last_snapshot[path]:
+                    continue
+                try:
+                    write_snapshot(path, payload)
+                except Exception as e:
+                    self._report(f"Failed to save {os.path.basename(path)}: {str(e)}")
+            elif kind == 'store':
+                if i < last_snapshot[path, payload[0]]:
+                    continue
+                self._write_store(path, *payload)
+            elif kind == 'truncate':
+                self._truncate(path, *payload, pending_lines)
+        self._flush_lines(pending_lines)
+
+    def _write_store(self, database_path, key, snapshot):
+        try:
+            if database_path not in self._stores:
+                self._stores[database_path] = sqlite_store.SQLiteStore(database_path)
+            self._stores[database_path].save_snapshot(key, snapshot)
+        except Exception as e:
+            self._report(f"Failed to save {key} to the database: {str(e)}")
+
+    def _close_stores(self):
+        for store in self._stores.values():
+            try:
+                store.close()
+            except Exception as e:
+                print(f"Error closing database: {str(e)}")
+        self._stores.clear()
+
+    def _truncate(self, path, csv_path, seq, pending_lines):
+        if snapshot_journal_seq(csv_path) < seq:
+            # The snapshot didn't land; the journal is the only copy of these actions
+            print(f"Keeping {os.path.basename(path)}: the last snapshot was not saved")
+            return
+        pending_lines.pop(path, None)
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except Exception as e:
+            self._report(f"Failed to compact journal {os.path.basename(path)}: {str(e)}")
+
+    def _flush_lines(self, pending_lines):
+        for path, lines in pending_lines.items():
+            try:
+                append_lines(path, lines)
+            except Exception as e:
+                self._report(f"Failed to write journal {os.path.basename(path)}: {str(e)}")
+        pending_lines.clear()
+
+    def _report(self, message):
+        print(message)
+        if self.on_error is not None:
+            try:
+                self.on_error(message)
+            except Exception as e:
+                print(f"Error reporting save failure: {str(e)}")
@@ -0,0 +1,344 @@
+import bisect
+
+
+class RecencyOrder:
+    """Recency order of competitor names as a doubly linked list.
+
+    Moving a name to the end, swapping it with a neighbour and appending are all
+    constant time. Each name also carries a sequence number that increases from
+    front to back, which is what the precedence engine sorts on. Ranks come from
+    a cached index that is only rebuilt after an operation that shifts positions.
+    """
+
+    def __init__(self, names=()):
+        self._prev = {}
+        self._next = {}
+        self._seq = {}
+        self._head = None
+        self._tail = None
+        self._next_seq = 0
+        self._index = {}
+        self._index_valid = True
+        for name in names:
+            if name not in self._seq:
+                self.append(name)
+
+    @classmethod
+    def from_list(cls, data):
+        """Build from the list format stored in _recency.json, skipping bad entries"""
+        return cls(name for name in (data or []) if isinstance(name, str))
+
+    def to_list(self):
+        return list(self)
+
+    def __iter__(self):
+        name = self._head
+        while name is not None:
+            yield name
+            name = self._next[name]
+
+    def __len__(self):
+        return len(self._seq)
+
+    def __contains__(self, name):
+        return name in self._seq
+
+    def __repr__(self):
+        return f"RecencyOrder({self.to_list()!r})"
+
+    def first(self):
+        return self._head
+
+    def neighbour(self, name, direction):
+        """Name directly before (-1) or after (+1) the given name, or None"""
+        return self._prev[name] if direction < 0 else self._next[name]
+
+    def position(self, name):
+        """Sequence number of a name; increases from front to back of the order"""
+        return self._seq[name]
+
+    def rank(self, name):
+        """1-based position in the order, or 0 if the name is not present"""
+        if name not in self._seq:
+            return 0
+        if not self._index_valid:
+            self._index = {n: i for i, n in enumerate(self, start=1)}
+            self._index_valid = True
+        return self._index[name]
+
+    def _link_last(self, name):
+        self._prev[name] = self._tail
+        self._next[name] = None
+        if self._tail is None:
+            self._head = name
+        else:
+            self._next[self._tail] = name
+        self._tail = name
+        self._seq[name] = self._next_seq
+        self._next_seq += 1
+
+    def _unlink(self, name):
+        prev, nxt = self._prev.pop(name), self._next.pop(name)
+        if prev is None:
+            self._head = nxt
+        else:
+            self._next[prev] = nxt
+        if nxt is None:
+            self._tail = prev
+        else:
+            self._prev[nxt] = prev
+        return self._seq.pop(name)
+
+    def append(self, name):
+        if name in self._seq:
+            return
+        self._link_last(name)
+        if self._index_valid:
+            self._index[name] = len(self._seq)
+
+    def remove(self, name):
+        if name not in self._seq:
+            return
+        self._unlink(name)
+        self._index.pop(name, None)
+        self._index_valid = False
+
+    def move_to_end(self, name):
+        """Move a name to the back of the order, appending it if it is new"""
+        if name in self._seq:
+            if name == self._tail:
+                # Still gets a fresh sequence number so it stays strictly last
+                self._seq[name] = self._next_seq
+                self._next_seq += 1
+                return
+            self._unlink(name)
+            self._index_valid = False
+        self._link_last(name)
+        if self._index_valid:
+            self._index[name] = len(self._seq)
+
+    def swap(self, name, direction):
+        """Swap a name with its neighbour (-1 towards the front, +1 towards the back).
+
+        Returns the neighbour's name, or None if there is nobody to swap with.
+        """
+        if name not in self._seq:
+            return None
+        if direction < 0:
+            first, second = self._prev[name], name
+        else:
+            first, second = name, self._next[name]
+        if first is None or second is None:
+            return None
+
+        before, after = self._prev[first], self._next[second]
+        # Relink as: before -> second -> first -> after
+        self._prev[second], self._next[second] = before, first
+        self._prev[first], self._next[first] = second, after
+        if before is None:
+            self._head = second
+        else:
+            self._next[before] = second
+        if after is None:
+            self._tail = first
+        else:
+            self._prev[after] = first
+
+        self._seq[first], self._seq[second] = self._seq[second], self._seq[first]
+        if self._index_valid:
+            self._index[first], self._index[second] = self._index[second], self._index[first]
+        return second if first == name else first
+
+    def insert_after(self, name, after, seq=None):
+        """Put a name directly after another (at the front for None), e.g. to undo a move.
+
+        The name takes seq if that still sorts between its new neighbours;
+        otherwise the whole order is renumbered. Returns True when renumbering
+        happened, since every position then changes.
+        """
+        if name in self._seq:
+            self._unlink(name)
+        if after is not None and after not in self._seq:
+            after = None
+        nxt = self._head if after is None else self._next[after]
+        self._prev[name], self._next[name] = after, nxt
+        if after is None:
+            self._head = name
+        else:
+            self._next[after] = name
+        if nxt is None:
+            self._tail = name
+        else:
+            self._prev[nxt] = name
+        self._index_valid = False
+
+        low = self._seq[after] if after is not None else None
+        high = self._seq[nxt] if nxt is not None else None
+        if seq is not None and (low is None or low < seq) and (high is None or seq < high):
+            self._seq[name] = seq
+            return False
+        if high is None:
+            self._seq[name] = self._next_seq
+            self._next_seq += 1
+            return False
+        self._renumber()
+        return True
+
+    def _renumber(self):
+        for i, n in enumerate(self):
+            self._seq[n] = i
+        self._next_seq = len(self._seq)
+
+    def rename(self, old_name, new_name):
+        if old_name not in self._seq or new_name in self._seq:
+            return
+        prev, nxt = self._prev.pop(old_name), self._next.pop(old_name)
+        self._prev[new_name], self._next[new_name] = prev, nxt
+        self._seq[new_name] = self._seq.pop(old_name)
+        if prev is None:
+            self._head = new_name
+        else:
+            self._next[prev] = new_name
+        if nxt is None:
+            self._tail = new_name
+        else:
+            self._prev[nxt] = new_name
+        if self._index_valid:
+            self._index[new_name] = self._index.pop(old_name)
+
+
+class PrecedenceEngine:
+    """Incrementally maintained precedence order for one list (speeches or questions).
+
+    Competitors are ordered by count first and recency second. Recency lives in a
+    RecencyOrder whose sequence numbers only change for the names that actually
+    moved, so logging one speech re-keys a single competitor and the rest of the
+    ordering stays put.
+    """
+
+    def __init__(self, recency=None, counts=None):
+        self.reset(recency if recency is not None else RecencyOrder(), counts)
+
+    def reset(self, recency, counts=None):
+        """Rebuild the engine around a RecencyOrder and a name -> count mapping.
+
+        Names in the recency order without a count are dropped, and competitors
+        that have a count but no recency position are appended at the back.
+        """
+        counts = counts or {}
+        self.recency = recency
+        for name in [n for n in recency if n not in counts]:
+            recency.remove(name)
+        for name in counts:
+            recency.append(name)
+        self._counts = {name: counts[name] for name in recency}
+        self._keys = sorted((count, recency.position(name), name)
+                            for name, count in self._counts.items())
+
+    def _key(self, name):
+        return (self._counts[name], self.recency.position(name), name)
+
+    def _drop_key(self, name):
+        del self._keys[bisect.bisect_left(self._keys, self._key(name))]
+
+    def __len__(self):
+        return len(self._counts)
+
+    def __contains__(self, name):
+        return name in self._counts
+
+    def add(self, name, count=0):
+        """Add a competitor at the back of the recency order"""
+        if name in self._counts:
+            return
+        self.recency.append(name)
+        self._counts[name] = count
+        bisect.insort(self._keys, self._key(name))
+
+    def remove(self, name):
+        if name not in self._counts:
+            return
+        self._drop_key(name)
+        del self._counts[name]
+        self.recency.remove(name)
+
+    def rename(self, old_name, new_name):
+        if old_name not in self._counts or new_name in self._counts:
+            return
+        self._drop_key(old_name)
+        self.recency.rename(old_name, new_name)
+        self._counts[new_name] = self._counts.pop(old_name)
+        bisect.insort(self._keys, self._key(new_name))
+
+    def set_count(self, name, count):
+        """Change a count without touching recency (e.g. when restoring history)"""
+        if name not in self._counts:
+            self.add(name, count)
+            return
+        if self._counts[name] == count:
+            return
+        self._drop_key(name)
+        self._counts[name] = count
+        bisect.insort(self._keys, self._key(name))
+
+    def log(self, name, count):
+        """Record a new count for a competitor and move them to the back of recency"""
+        if name in self._counts:
+            self._drop_key(name)
+        self.recency.move_to_end(name)
+        self._counts[name] = count
+        bisect.insort(self._keys, self._key(name))
+
+    def restore(self, name, count, after, seq):
+        """Undo a log: set the count back and return the name to its old recency slot"""
+        if name in self._counts:
+            self._drop_key(name)
+        self._counts[name] = count
+        if self.recency.insert_after(name, after, seq):
+            self._keys = sorted(self._key(n) for n in self._counts)
+        else:
+            bisect.insort(self._keys, self._key(name))
+
+    def swap(self, name, direction):
+        """Swap a competitor with their recency neighbour (-1 up, +1 down)"""
+        if name not in self._counts:
+            return False
+        other = self.recency.neighbour(name, direction)
+        if other is None:
+            return False
+        self._drop_key(name)
+        self._drop_key(other)
+        self.recency.swap(name, direction)
+        bisect.insort(self._keys, self._key(name))
+        bisect.insort(self._keys, self._key(other))
+        return True
+
+    def ordered(self, manual=False):
+        """Names in precedence order; manual mode uses the raw recency order"""
+        if manual:
+            return self.recency.to_list()
+        return [name for _, _, name in self._keys]
+
+    def top(self, count, manual=False):
+        """The first count names in precedence order, without building the whole ordering"""
+        if manual:
+            return self.recency.to_list()[:count]
+        return [name for _, _, name in self._keys[:count]]
+
+    def first(self, manual=False):
+        """Name of whoever currently has precedence, or None"""
+        if manual:
+            return self.recency.first()
+        return self._keys[0][2] if self._keys else None
+
+    def rank(self, name, manual=False):
+        """1-based position of a competitor in the ordering, or 0 if unknown"""
+        if name not in self._counts:
+            return 0
+        if manual:
+            return self.recency.rank(name)
+        return bisect.bisect_left(self._keys, self._key(name)) + 1
+
+    def recency_order(self):
+        """Recency order as a plain list of names (the format saved to _recency.json)"""
+        return self.recency.to_list()
@@ -0,0 +1,250 @@
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QSize, QEvent, pyqtSignal
+from PyQt6.QtGui import QColor, QPen
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle, QStyleOptionViewItem, QApplication
+
+
+class PrecedenceListModel(QAbstractListModel):
+    """Rows of the speech or question list, in precedence order.
+
+    The model only stores names; counts, sides and ranks are read from the
+    competitor objects when a row is painted, so refreshing after a log is a
+    row move plus a repaint rather than a rebuild.
+    """
+    CountRole = Qt.ItemDataRole.UserRole + 1
+    SideRole = Qt.ItemDataRole.UserRole + 2
+    RankRole = Qt.ItemDataRole.UserRole + 3
+    SeparatorRole = Qt.ItemDataRole.UserRole + 4
+
+    def __init__(self, list_type, lookup, parent=None):
+        super().__init__(parent)
+        self.list_type = list_type
+        self._lookup = lookup  # name -> Competitor or None
+        self._names = []
+        self.manual = False
+        self.plain = False
+        self.roster_version = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def name_at(self, row):
+        return self._names[row] if 0 <= row < len(self._names) else None
+
+    def _count(self, row):
+        competitor = self._lookup(self._names[row])
+        if competitor is None:
+            return 0
+        return competitor.speeches if self.list_type == 'speech' else competitor.questions
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._names):
+            return None
+        row = index.row()
+        name = self._names[row]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.UserRole):
+            return name
+        if self.plain:
+            return None
+        if role == self.CountRole:
+            return self._count(row)
+        if role == self.SideRole:
+            competitor = self._lookup(name)
+            return competitor.current_side if competitor else ""
+        if role == self.RankRole:
+            return row + 1
+        if role == self.SeparatorRole:
+            return row > 0 and self._count(row) != self._count(row - 1)
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def set_rows(self, names, manual=False, plain=False):
+        """Show the given names in order, with the smallest model change that gets there"""
+        names = list(names)
+        old = self._names
+        if manual != self.manual or plain != self.plain or len(names) != len(old):
+            self._reset(names, manual, plain)
+            return
+
+        # Find the span that differs; one competitor moving is the common case
+        first = 0
+        while first < len(old) and old[first] == names[first]:
+            first += 1
+        if first == len(old):
+            self._refresh_all()
+            return
+        last = len(old) - 1
+        while old[last] == names[last]:
+            last -= 1
+
+        if old[first] == names[last] and old[first + 1:last + 1] == names[first:last]:
+            # Row moved down from first to last
+            self.beginMoveRows(QModelIndex(), first, first, QModelIndex(), last + 1)
+            self._names = names
+            self.endMoveRows()
+        elif names[first] == old[last] and old[first:last] == names[first + 1:last + 1]:
+            # Row moved up from last to first
+            self.beginMoveRows(QModelIndex(), last, last, QModelIndex(), first)
+            self._names = names
+            self.endMoveRows()
+        else:
+            self._reset(names, manual, plain)
+            return
+        self._refresh_all()
+
+    def _reset(self, names, manual, plain):
+        self.beginResetModel()
+        self._names = names
+        self.manual = manual
+        self.plain = plain
+        self.roster_version += 1
+        self.endResetModel()
+
+    def _refresh_all(self):
+        # Counts, sides and ranks can change without the order changing
+        if self._names:
+            self.dataChanged.emit(self.index(0), self.index(len(self._names) - 1))
+
+
+class PrecedenceItemDelegate(QStyledItemDelegate):
+    """Paints a precedence row: name | side | count | recency, plus move arrows in manual mode"""
+    moveRequested = pyqtSignal(str, int)
+
+    MARGIN_X = 8
+    MARGIN_Y = 4
+    SPACING = 6
+    BUTTON_SIZE = 20
+    SEPARATOR_HEIGHT = 3
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._columns = None
+        self._columns_key = None
+        self.separator_color = QColor(255, 255, 255, 38)
+
+    def _column_widths(self, option, model):
+        key = (option.font.key(), model.roster_version)
+        if key != self._columns_key:
+            fm = option.fontMetrics
+            names = [model.name_at(r) for r in range(model.rowCount())]
+            self._columns = {
+                'name': max((fm.horizontalAdvance(n) for n in names), default=0) + 20,
+                'marker': fm.horizontalAdvance("|"),
+                'side': fm.horizontalAdvance("Neg") + 10,
+                'label': fm.horizontalAdvance("Speeches:"),
+                'count': fm.horizontalAdvance("99") + 10,
+            }
+            self._columns_key = key
+        return self._columns
+
+    def _content_rect(self, option, index):
+        # Every row reserves room for a separator so rows stay a uniform height
+        rect = option.rect
+        top = rect.top() + self.SEPARATOR_HEIGHT
+        return QRect(rect.left() + self.MARGIN_X, top + self.MARGIN_Y,
+                     rect.width() - 2 * self.MARGIN_X, rect.bottom() - top - 2 * self.MARGIN_Y + 1)
+
+    def _cells(self, option, index):
+        """(text, width) for each column of a row, left to right"""
+        model = index.model()
+        cols = self._column_widths(option, model)
+        fm = option.fontMetrics
+        name = index.data(Qt.ItemDataRole.UserRole)
+        if model.list_type == 'speech':
+            cells = [
+                (name, cols['name']), ("|", cols['marker']),
+                (index.data(PrecedenceListModel.SideRole) or "—", cols['side']), ("|", cols['marker']),
+                ("Speeches:", cols['label']),
+            ]
+        else:
+            cells = [(name, cols['name']), ("|", cols['marker']), ("Questions:", cols['label'])]
+        rank = str(index.data(PrecedenceListModel.RankRole))
+        cells += [
+            (str(index.data(PrecedenceListModel.CountRole)), cols['count']), ("|", cols['marker']),
+            ("Recency:", fm.horizontalAdvance("Recency:")), (rank, fm.horizontalAdvance(rank)),
+        ]
+        return cells
+
+    def _button_rects(self, option, index, cells=None):
+        """Rects of the up/down arrows, or (None, None) outside manual mode"""
+        model = index.model()
+        if model.plain or not model.manual:
+            return None, None
+        content = self._content_rect(option, index)
+        cells = cells or self._cells(option, index)
+        x = content.left() + sum(width + self.SPACING for _, width in cells)
+        y = content.top() + (content.height() - self.BUTTON_SIZE) // 2
+        up = QRect(x, y, self.BUTTON_SIZE, self.BUTTON_SIZE)
+        down = QRect(x + self.BUTTON_SIZE + self.SPACING, y, self.BUTTON_SIZE, self.BUTTON_SIZE)
+        return up, down
+
+    def sizeHint(self, option, index):
+        model = index.model()
+        height = option.fontMetrics.height()
+        if model.manual and not model.plain:
+            height = max(height, self.BUTTON_SIZE)
+        height += 2 * self.MARGIN_Y + self.SEPARATOR_HEIGHT
+        width = self._column_widths(option, model)['name'] + 2 * self.MARGIN_X
+        return QSize(width, height)
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        widget = opt.widget
+        style = widget.style() if widget else QApplication.style()
+        painter.save()
+
+        # Selection / hover background from the current style sheet
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, opt, painter, widget)
+
+        model = index.model()
+        if index.data(PrecedenceListModel.SeparatorRole):
+            painter.setPen(QPen(self.separator_color, 1))
+            y = option.rect.top() + 1
+            painter.drawLine(option.rect.left() + self.MARGIN_X, y, option.rect.right() - self.MARGIN_X, y)
+
+        text_color = opt.palette.color(opt.palette.ColorRole.Text)
+        painter.setPen(text_color)
+        painter.setFont(opt.font)
+        content = self._content_rect(option, index)
+        align = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        if model.plain:
+            painter.drawText(content, align, index.data(Qt.ItemDataRole.UserRole))
+            painter.restore()
+            return
+
+        cells = self._cells(option, index)
+        x = content.left()
+        for text, width in cells:
+            painter.drawText(QRect(x, content.top(), width, content.height()), align, text)
+            x += width + self.SPACING
+
+        up, down = self._button_rects(option, index, cells)
+        if up is not None:
+            for rect, glyph in ((up, "▲"), (down, "▼")):
+                painter.setPen(QPen(QColor("#666666"), 1))
+                painter.setBrush(QColor("#444444"))
+                painter.drawRoundedRect(rect.adjusted(0, 0, -1, -1), 3, 3)
+                painter.setPen(text_color)
+                painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, glyph)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() not in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease,
+                                QEvent.Type.MouseButtonDblClick):
+            return super().editorEvent(event, model, option, index)
+        up, down = self._button_rects(option, index)
+        if up is None:
+            return super().editorEvent(event, model, option, index)
+        pos = event.position().toPoint()
+        for rect, direction in ((up, -1), (down, 1)):
+            if rect.contains(pos):
+                # Swallow presses and double-clicks so the arrows never start a log
+                if event.type() == QEvent.Type.MouseButtonRelease:
+                    self.moveRequested.emit(index.data(Qt.ItemDataRole.UserRole), direction)
+                return True
+        return super().editorEvent(event, model, option, index)
@@ -0,0 +1,274 @@
+import datetime
+import math
+import random
+from collections import namedtuple
+import persistence
+from history_store import HistoryLog
+from models import EPOCH, MICROSECOND, Competitor, HistoryItem, SpeechRecord
+from precedence import PrecedenceEngine, RecencyOrder
+
+# One thing a chair does. kind is 'roster' (value: names), 'resolution' (name: title),
+# 'next_resolution', 'speech' (value: seconds), 'question' or 'move' (value: (list, direction)).
+Action = namedtuple('Action', ['kind', 'name', 'value'], defaults=(None, None))
+
+SESSION_START = datetime.datetime(2025, 1, 11, 9, 0)
+SPEECH_SECONDS = (172, 18)  # mean and spread of a speech's length
+SPEECH_LIMITS = (45, 230)
+QUESTIONING_SECONDS = 60  # one questioning block after each speech
+PICK_WEIGHTS = (0.6, 0.25, 0.15)  # chance the chair calls the first, second or third in precedence
+
+FIRST_NAMES = (
+    "Avery", "Jordan", "Riley", "Morgan", "Quinn", "Harper", "Rowan", "Emerson", "Parker", "Reese",
+    "Sasha", "Kai", "Elliot", "Dakota", "Skyler", "Hayden", "Jamie", "Casey", "Finley", "Marlowe",
+    "Priya", "Mateo", "Amara", "Noah", "Leila", "Omar", "Mei", "Diego", "Anya", "Tariq",
+)
+LAST_NAMES = (
+    "Chen", "Patel", "Garcia", "Okafor", "Nguyen", "Kowalski", "Haddad", "Silva", "Kim", "Murphy",
+    "Rossi", "Schmidt", "Ivanova", "Mensah", "Tanaka", "Dubois", "Lindqvist", "Reyes", "Ahmed", "Novak",
+    "Brennan", "Costa", "Fischer", "Hughes", "Larsen", "Moreau", "Ortiz", "Sato", "Walsh", "Yilmaz",
+)
+BILL_VERBS = ("Reform", "Fund", "Expand", "Regulate", "Ban", "Protect", "Modernize", "Repeal", "Subsidize", "Audit")
+BILL_SUBJECTS = (
+    "Rural Broadband", "Public Transit", "Student Loans", "Nuclear Energy", "Farm Subsidies", "Social Media",
+    "Carbon Capture", "Veterans' Healthcare", "Civil Asset Forfeiture", "Space Exploration", "Water Rights",
+    "Daylight Saving Time", "Minimum Wage", "Election Security", "Antibiotic Research", "High-Speed Rail",
+)
+
+
+def make_roster(size, rng):
+    """size distinct, plausible competitor names (no commas, so they can be typed as a list)"""
+    names = []
+    seen = set()
+    for _ in range(size):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        candidate, n = name, 1
+        while candidate in seen:
+            n += 1
+            candidate = f"{name} {n}"
+        seen.add(candidate)
+        names.append(candidate)
+    return names
+
+def make_docket(count, rng):
+    titles = []
+    seen = set()
+    for _ in range(count):
+        title = f"A {rng.choice(('Bill', 'Resolution'))} to {rng.choice(BILL_VERBS)} {rng.choice(BILL_SUBJECTS)}"
+        candidate, n = title, 1
+        while candidate in seen:
+            n += 1
+            candidate = f"{title} ({n})"
+        seen.add(candidate)
+        titles.append(candidate)
+    return titles
+
+def speech_seconds(rng):
+    return int(min(SPEECH_LIMITS[1], max(SPEECH_LIMITS[0], rng.gauss(*SPEECH_SECONDS))))
+
+def _pick(engine, rng, exclude=None):
+    """Whom the chair calls: usually the top of precedence, sometimes the next one or two"""
+    candidates = [name for name in engine.top(len(PICK_WEIGHTS) + 1) if name != exclude][:len(PICK_WEIGHTS)]
+    if not candidates:
+        return None
+    return rng.choices(candidates, weights=PICK_WEIGHTS[:len(candidates)])[0]
+
+
+class SessionState:
+    """The session a stream of actions leads to, worked out the way CongressTracker does it.
+
+    Speeches alternate Aff and Neg and switching resolution starts again on
+    Aff; every speech or question moves the competitor to the back of
+    recency and advances the round. Nothing here needs Qt, so a generated
+    session can be written out or inspected without the UI.
+    """
+
+    def __init__(self):
+        self.competitors = []
+        self.by_name = {}
+        self.speech_precedence = PrecedenceEngine()
+        self.question_precedence = PrecedenceEngine()
+        self.resolution_list = []
+        self.current_resolution = ""
+        self.current_side = "Affirmative"
+        self.current_round = 0
+        self.history = []
+        self.now = SESSION_START
+
+    def apply(self, action):
+        getattr(self, f'_apply_{action.kind}')(action)
+
+    def _apply_roster(self, action):
+        for name in action.value:
+            competitor = Competitor(name)
+            self.competitors.append(competitor)
+            self.by_name[name] = competitor
+        names = [c.name for c in self.competitors]
+        self.speech_precedence.reset(RecencyOrder(names), dict.fromkeys(names, 0))
+        self.question_precedence.reset(RecencyOrder(names), dict.fromkeys(names, 0))
+
+    def _apply_resolution(self, action):
+        self.resolution_list.append(action.name)
+        if not self.current_resolution:
+            self.current_resolution = action.name
+
+    def _apply_next_resolution(self, action):
+        self.current_side = "Affirmative"
+        if len(self.resolution_list) < 2:
+            return
+        try:
+            position = (self.resolution_list.index(self.current_resolution) + 1) % len(self.resolution_list)
+        except ValueError:
+            position = 0
+        self.current_resolution = self.resolution_list[position]
+
+    def _apply_speech(self, action):
+        competitor = self.by_name[action.name]
+        side = "Aff" if self.current_side == "Affirmative" else "Neg"
+        old_count = competitor.speeches
+        self.now += datetime.timedelta(seconds=action.value)
+        competitor.add_speech_record(SpeechRecord(self.current_round, side, action.value,
+                                                  (self.now - EPOCH) // MICROSECOND, self.current_resolution))
+        if self.current_resolution:
+            competitor.resolution_sides[self.current_resolution] = side
+        self.speech_precedence.log(competitor.name, competitor.speeches)
+        self._log_history('speech', competitor.name, 'speech_count', old_count, competitor.speeches)
+        self.current_side = "Negative" if self.current_side == "Affirmative" else "Affirmative"
+        self.current_round += 1
+
+    def _apply_question(self, action):
+        competitor = self.by_name[action.name]
+        old_count = competitor.questions
+        competitor.questions += 1
+        competitor.last_question_round = self.current_round
+        self.question_precedence.log(competitor.name, competitor.questions)
+        self._log_history('question', competitor.name, 'question_count', old_count, competitor.questions)
+        self.current_round += 1
+
+    def _apply_move(self, action):
+        list_type, direction = action.value
+        engine = self.speech_precedence if list_type == 'speech' else self.question_precedence
+        engine.swap(action.name, direction)
+
+    def _log_history(self, action_type, name, count_type, old_value, new_value):
+        self.history.append(HistoryItem(action_type, name, count_type, old_value, new_value,
+                                        self.now.strftime("%H:%M:%S")))
+
+    def write(self, csv_path):
+        """Save as the CSV, sidecars and history log that loading a file reads"""
+        # Sides shown are the ones taken on the current resolution, as after switching to it
+        for c in self.competitors:
+            c.current_side = c.resolution_sides.get(self.current_resolution, "")
+        for engine, attribute in ((self.speech_precedence, 'speech_rank'), (self.question_precedence, 'question_rank')):
+            for rank, name in enumerate(engine.ordered(), start=1):
+                setattr(self.by_name[name], attribute, rank)
+        persistence.save_to_csv(csv_path, self.competitors, None, self.speech_precedence.recency_order(),
+                                self.question_precedence.recency_order(), self.resolution_list,
+                                self.current_resolution, self.current_side)
+        history = HistoryLog(csv_path)
+        history.clear()
+        history.extend(self.history)
+        history.close()
+
+
+def generate_actions(size, seed=0, speeches_per_competitor=2.0, questions_per_speech=(2, 4),
+                     speeches_per_resolution=(6, 12), move_rate=0.02):
+    """A seeded, realistic stream of actions for a chamber of size competitors.
+
+    The docket is entered up front, then each resolution gets a run of
+    speeches, each followed by a questioning block, before the chair moves
+    on. Speakers and questioners come from near the top of precedence, and
+    now and then a competitor is nudged up or down by hand. The same size
+    and seed always give the same actions.
+    """
+    rng = random.Random(f"{seed}:{size}")
+    state = SessionState()
+    actions = []
+
+    def emit(action):
+        actions.append(action)
+        state.apply(action)
+
+    emit(Action('roster', value=tuple(make_roster(size, rng))))
+    total = round(size * speeches_per_competitor)
+    mean_run = sum(speeches_per_resolution) / 2
+    for title in make_docket(max(1, math.ceil(total / mean_run)), rng):
+        emit(Action('resolution', title))
+
+    spoken = 0
+    for resolution in range(len(state.resolution_list)):
+        if spoken >= total:
+            break
+        if resolution:
+            emit(Action('next_resolution'))
+        for _ in range(rng.randint(*speeches_per_resolution)):
+            if spoken >= total:
+                break
+            speaker = _pick(state.speech_precedence, rng)
+            emit(Action('speech', speaker, speech_seconds(rng)))
+            spoken += 1
+            for _ in range(rng.randint(*questions_per_speech)):
+                questioner = _pick(state.question_precedence, rng, exclude=speaker)
+                if questioner is not None:
+                    emit(Action('question', questioner))
+            state.now += datetime.timedelta(seconds=QUESTIONING_SECONDS)
+            if size > 1 and rng.random() < move_rate:
+                emit(Action('move', rng.choice(state.competitors).name,
+                            (rng.choice(('speech', 'question')), rng.choice((-1, 1)))))
+    return actions
+
+def build_session(actions):
+    """The SessionState a stream of actions ends in"""
+    state = SessionState()
+    for action in actions:
+        state.apply(action)
+    return state
+
+
+def replay(tracker, actions, csv_path=None, on_action=None):
+    """Drive a CongressTracker through actions by the same methods its buttons use.
+
+    With csv_path the session is saved there rather than to a new file in
+    the documents folder. on_action(action) is called after each one.
+    """
+    for action in actions:
+        if action.kind == 'roster':
+            if csv_path:
+                tracker.csv_file_path = csv_path
+            tracker.name_input.setText(", ".join(action.value))
+            tracker.start_tracking()
+        elif action.kind == 'resolution':
+            tracker.ensure_tab(tracker.settings_tab)
+            tracker.resolution_input.setText(action.name)
+            tracker.add_resolution()
+        elif action.kind == 'next_resolution':
+            tracker.next_resolution()
+        elif action.kind == 'speech':
+            minutes, seconds = divmod(action.value, 60)
+            tracker.open_speech_input(action.name)
+            tracker.minutes_input.setText(str(minutes))
+            tracker.seconds_input.setText(str(seconds))
+            tracker.confirm_log_speech()
+        elif action.kind == 'question':
+            tracker.open_question_input(action.name)
+            tracker.confirm_log_question()
+        elif action.kind == 'move':
+            list_type, direction = action.value
+            tracker.move_competitor(action.name, direction, list_type)
+        if on_action is not None:
+            on_action(action)
+
+
+if __name__ == '__main__':
+    import sys
+    if len(sys.argv) < 2:
+        print("usage: python session_generator.py SESSION.csv [COMPETITORS] [SEED]")
+        sys.exit(2)
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+    generated = generate_actions(size, seed)
+    session = build_session(generated)
+    session.write(sys.argv[1])
+    speeches = sum(c.speeches for c in session.competitors)
+    questions = sum(c.questions for c in session.competitors)
+    print(f"Wrote {sys.argv[1]}: {size} competitors, {len(session.resolution_list)} resolutions, "
+          f"{speeches} speeches, {questions} questions, {len(generated)} actions")
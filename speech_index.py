@@ -0,0 +1,108 @@
+AFF = 'Aff'
+NEG = 'Neg'
+
+
+class SideTally:
+    """Running Aff/Neg speech counts, per resolution and across all resolutions.
+
+    Kept up to date as speeches are added and removed so that working out
+    which side speaks next never has to walk the speech records. rebuild()
+    recomputes everything from the competitors, for freshly loaded sessions.
+    """
+
+    def __init__(self):
+        self._by_resolution = {}  # resolution -> [aff, neg]
+        self._total = [0, 0]
+
+    def rebuild(self, competitors):
+        self._by_resolution = {}
+        self._total = [0, 0]
+        for competitor in competitors:
+            for record in competitor.speech_records:
+                self.add(record)
+
+    def _slot(self, side):
+        if side == AFF:
+            return 0
+        if side == NEG:
+            return 1
+        return None
+
+    def add(self, record):
+        slot = self._slot(record.side)
+        if slot is None:
+            return
+        self._total[slot] += 1
+        self._by_resolution.setdefault(record.resolution, [0, 0])[slot] += 1
+
+    def remove(self, record):
+        slot = self._slot(record.side)
+        if slot is None:
+            return
+        self._total[slot] -= 1
+        counts = self._by_resolution.get(record.resolution)
+        if counts is not None:
+            counts[slot] -= 1
+            if counts == [0, 0]:
+                del self._by_resolution[record.resolution]
+
+    def remove_all(self, records):
+        for record in records:
+            self.remove(record)
+
+    def counts(self, resolution=None):
+        """(aff, neg) for one resolution, or across all of them when resolution is empty"""
+        if not resolution:
+            return tuple(self._total)
+        return tuple(self._by_resolution.get(resolution, (0, 0)))
+
+    def next_side(self, resolution=None):
+        """Side that speaks next: Affirmative unless Aff already has more speeches"""
+        aff, neg = self.counts(resolution)
+        # If equal, Aff goes first; otherwise, the side with fewer speeches goes next
+        return "Affirmative" if aff <= neg else "Negative"
+
+
+class ResolutionSpeakers:
+    """Which competitors have spoken on each resolution, with their speech counts"""
+
+    def __init__(self):
+        self._by_resolution = {}  # resolution -> {competitor: speeches}
+        self._anyone = {}  # competitor -> speeches on any resolution
+
+    def rebuild(self, competitors):
+        self._by_resolution = {}
+        self._anyone = {}
+        for competitor in competitors:
+            for record in competitor.speech_records:
+                self.add(competitor, record)
+
+    def add(self, competitor, record):
+        speakers = self._by_resolution.setdefault(record.resolution, {})
+        speakers[competitor] = speakers.get(competitor, 0) + 1
+        self._anyone[competitor] = self._anyone.get(competitor, 0) + 1
+
+    def remove(self, competitor, record):
+        speakers = self._by_resolution.get(record.resolution)
+        if speakers is None or competitor not in speakers:
+            return
+        self._decrement(speakers, competitor)
+        if not speakers:
+            del self._by_resolution[record.resolution]
+        self._decrement(self._anyone, competitor)
+
+    @staticmethod
+    def _decrement(counts, key):
+        counts[key] -= 1
+        if not counts[key]:
+            del counts[key]
+
+    def remove_all(self, competitor, records):
+        for record in records:
+            self.remove(competitor, record)
+
+    def speakers(self, resolution=None):
+        """Competitors with at least one speech on resolution (or on anything, for None)"""
+        if resolution is None:
+            return self._anyone.keys()
+        return self._by_resolution.get(resolution, {}).keys()
@@ -0,0 +1,335 @@
+from array import array
+from collections import namedtuple
+from speech_index import ResolutionSpeakers
+
+AFF = 'Aff'
+NEG = 'Neg'
+PERCENTILES = (50, 90)
+
+CompetitorStats = namedtuple('CompetitorStats', [
+    'name', 'speeches', 'timed', 'total_time', 'average', 'median', 'percentiles', 'aff', 'neg', 'side'])
+ResolutionStats = namedtuple('ResolutionStats', [
+    'resolution', 'speeches', 'speakers', 'timed', 'total_time', 'average', 'median', 'percentiles',
+    'aff', 'neg', 'balance'])
+SessionStats = namedtuple('SessionStats', ['competitors', 'resolutions'])
+
+
+class _Codes:
+    """Small integer codes for repeated strings, so columns can hold plain numbers"""
+
+    def __init__(self):
+        self.values = []
+        self._ids = {}
+
+    def code(self, value):
+        code = self._ids.get(value)
+        if code is None:
+            code = self._ids[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def find(self, value):
+        return self._ids.get(value)
+
+
+def _as_duration(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+class SpeechColumns:
+    """Every speech of a session as parallel typed arrays.
+
+    Row i is one speech: competitor[i], resolution[i] and side[i] are codes
+    into names, resolutions and sides, and duration[i] is in seconds. Nothing
+    here needs Qt, so reports can be built from a loaded session directly.
+    """
+
+    def __init__(self):
+        self.names = _Codes()
+        self.resolutions = _Codes()
+        self.sides = _Codes()
+        self.competitor = array('I')
+        self.resolution = array('I')
+        self.side = array('I')
+        self.duration = array('i')
+
+    @classmethod
+    def from_competitors(cls, competitors):
+        columns = cls()
+        for competitor in competitors:
+            columns.names.code(competitor.name)  # Keeps roster order, speakers or not
+            for record in competitor.speech_records:
+                columns.add(competitor.name, record)
+        return columns
+
+    def __len__(self):
+        return len(self.duration)
+
+    def add(self, name, record):
+        self.competitor.append(self.names.code(name))
+        self.resolution.append(self.resolutions.code(record.resolution))
+        self.side.append(self.sides.code(record.side))
+        self.duration.append(_as_duration(record.duration))
+
+
+def _most_common(counts):
+    """Key with the highest count, the first one seen on a tie; None if empty"""
+    return max(counts, key=counts.get) if counts else None
+
+
+def percentile(ordered, q):
+    """q-th percentile of an ascending list, interpolating between ranks; None if empty"""
+    if not ordered:
+        return None
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class _Group:
+    __slots__ = ('speeches', 'durations', 'total_time', 'sides', 'speakers')
+
+    def __init__(self):
+        self.speeches = 0
+        self.durations = []  # timed speeches only
+        self.total_time = 0
+        self.sides = {}
+        self.speakers = set()
+
+    def add(self, competitor, side, duration):
+        if duration < 0:
+            return
+        self.speeches += 1
+        self.sides[side] = self.sides.get(side, 0) + 1
+        self.speakers.add(competitor)
+        if duration > 0:
+            self.durations.append(duration)
+            self.total_time += duration
+
+    def summary(self, side_values, percentiles):
+        """(timed, average, median, percentiles, aff, neg, most common side)"""
+        ordered = sorted(self.durations)
+        by_side = {side_values[code]: count for code, count in self.sides.items()}
+        side = _most_common(self.sides)
+        return (len(ordered), self.total_time // self.speeches if self.speeches else 0,
+                percentile(ordered, 50), {q: percentile(ordered, q) for q in percentiles},
+                by_side.get(AFF, 0), by_side.get(NEG, 0), side_values[side] if side is not None else "")
+
+
+def summarize(columns, resolution=None, percentiles=PERCENTILES):
+    """Per-competitor and per-resolution statistics in one pass over the columns.
+
+    With a resolution, competitor rows only count speeches on it; resolution
+    rows always cover every resolution. average is total timed seconds over
+    all speeches, as the Statistics tab has always shown it; median and
+    percentiles are over timed speeches only.
+    """
+    wanted = None
+    if resolution is not None:
+        wanted = columns.resolutions.find(resolution)
+        if wanted is None:
+            wanted = -1  # No speech matches
+    by_competitor = {}
+    by_resolution = {}
+    for competitor, res, side, duration in zip(columns.competitor, columns.resolution, columns.side, columns.duration):
+        group = by_resolution.get(res)
+        if group is None:
+            group = by_resolution[res] = _Group()
+        group.add(competitor, side, duration)
+        if wanted is None or res == wanted:
+            group = by_competitor.get(competitor)
+            if group is None:
+                group = by_competitor[competitor] = _Group()
+            group.add(competitor, side, duration)
+
+    sides = columns.sides.values
+    competitor_rows = []
+    for code in sorted(by_competitor):
+        group = by_competitor[code]
+        if group.speeches:
+            timed, average, median, points, aff, neg, side = group.summary(sides, percentiles)
+            competitor_rows.append(CompetitorStats(columns.names.values[code], group.speeches, timed,
+                                                   group.total_time, average, median, points, aff, neg, side))
+    resolution_rows = []
+    for code in sorted(by_resolution):
+        group = by_resolution[code]
+        if group.speeches:
+            timed, average, median, points, aff, neg, _ = group.summary(sides, percentiles)
+            resolution_rows.append(ResolutionStats(columns.resolutions.values[code], group.speeches,
+                                                   len(group.speakers), timed, group.total_time, average,
+                                                   median, points, aff, neg, aff - neg))
+    return SessionStats(competitor_rows, resolution_rows)
+
+
+class _Tally:
+    """Running count, timed count, total seconds and side histogram for a set of speeches"""
+    __slots__ = ('speeches', 'timed', 'total_time', 'sides')
+
+    def __init__(self):
+        self.speeches = 0
+        self.timed = 0
+        self.total_time = 0
+        self.sides = {}
+
+    def add(self, side, duration, step=1):
+        if duration < 0:
+            return
+        self.speeches += step
+        count = self.sides.get(side, 0) + step
+        if count:
+            self.sides[side] = count
+        else:
+            del self.sides[side]
+        if duration > 0:
+            self.timed += step
+            self.total_time += step * duration
+
+    @property
+    def average(self):
+        # Same figure summarize() reports: timed seconds over all speeches
+        return self.total_time // self.speeches if self.speeches else 0
+
+    @property
+    def side(self):
+        return _most_common(self.sides) or ""
+
+
+class RunningStats:
+    """Per-competitor and per-resolution speech totals, kept current one speech at a time.
+
+    add() and remove() are constant time, so logging or undoing a speech never
+    walks the session. Who has spoken on each resolution is kept in a
+    ResolutionSpeakers index updated alongside. version changes with every
+    update, and take_changes() says which competitors changed, so a view can
+    redraw only what it must.
+    Running totals don't keep individual durations; use summarize() for
+    medians and percentiles.
+    """
+
+    def __init__(self):
+        self._by_competitor = {}  # competitor -> {resolution or None: _Tally}
+        self._by_resolution = {}  # resolution -> _Tally
+        self._speakers = ResolutionSpeakers()
+        self.version = 0
+        self._changed = set()
+        self._all_changed = True
+
+    def rebuild(self, competitors):
+        self._by_competitor = {}
+        self._by_resolution = {}
+        self._speakers = ResolutionSpeakers()
+        for competitor in competitors:
+            for record in competitor.speech_records:
+                self.add(competitor, record)
+        self.changed()
+
+    def changed(self):
+        """Note a change that affects rendered rows without touching the totals, like a rename"""
+        self.version += 1
+        self._all_changed = True
+
+    def take_changes(self):
+        """(competitors updated, whether anything else changed) since the last call"""
+        changes = (self._changed, self._all_changed)
+        self._changed = set()
+        self._all_changed = False
+        return changes
+
+    def _update(self, competitor, record, step):
+        duration = _as_duration(record.duration)
+        tallies = self._by_competitor.setdefault(competitor, {})
+        for key in (None, record.resolution):
+            tallies.setdefault(key, _Tally()).add(record.side, duration, step)
+        self._by_resolution.setdefault(record.resolution, _Tally()).add(record.side, duration, step)
+        # Drop emptied tallies so removed competitors and resolutions don't linger
+        for key in (None, record.resolution):
+            if key in tallies and not tallies[key].speeches:
+                del tallies[key]
+        if not tallies:
+            del self._by_competitor[competitor]
+        if not self._by_resolution[record.resolution].speeches:
+            del self._by_resolution[record.resolution]
+        self._changed.add(competitor)
+        self.version += 1
+
+    def add(self, competitor, record):
+        self._update(competitor, record, 1)
+        if _as_duration(record.duration) >= 0:
+            self._speakers.add(competitor, record)
+
+    def remove(self, competitor, record):
+        self._update(competitor, record, -1)
+        if _as_duration(record.duration) >= 0:
+            self._speakers.remove(competitor, record)
+
+    def remove_all(self, competitor, records):
+        for record in records:
+            self.remove(competitor, record)
+
+    def tally(self, competitor, resolution=None):
+        """Totals for one competitor, on one resolution or (for None) on all of them"""
+        return self._by_competitor.get(competitor, {}).get(resolution)
+
+    def speakers(self, resolution=None):
+        """Competitors with at least one speech on resolution (or on anything, for None)"""
+        return self._speakers.speakers(resolution)
+
+    def competitor_rows(self, competitors, resolution=None):
+        """CompetitorStats for each competitor with speeches, in the order given"""
+        rows = []
+        for competitor in competitors:
+            tally = self.tally(competitor, resolution)
+            if tally is None or not tally.speeches:
+                continue
+            rows.append(CompetitorStats(
+                competitor.name, tally.speeches, tally.timed, tally.total_time, tally.average, None, {},
+                tally.sides.get(AFF, 0), tally.sides.get(NEG, 0), tally.side))
+        return rows
+
+    def resolution_rows(self):
+        rows = []
+        for resolution, tally in self._by_resolution.items():
+            if not tally.speeches:
+                continue
+            speakers = len(self._speakers.speakers(resolution))
+            aff, neg = tally.sides.get(AFF, 0), tally.sides.get(NEG, 0)
+            rows.append(ResolutionStats(resolution, tally.speeches, speakers, tally.timed, tally.total_time,
+                                        tally.average, None, {}, aff, neg, aff - neg))
+        return rows
+
+
+def format_seconds(seconds):
+    """m:ss, or n/a for None"""
+    if seconds is None:
+        return "n/a"
+    mins, secs = divmod(int(round(seconds)), 60)
+    return f"{mins}:{secs:02d}"
+
+
+def report_lines(stats):
+    """Plain-text report of summarize() output"""
+    lines = ["Competitor | Side | Speeches | Avg. Time | Median"]
+    for row in stats.competitors:
+        lines.append(f"{row.name} | {row.side} | {row.speeches} | {format_seconds(row.average)} | "
+                     f"{format_seconds(row.median)}")
+    lines.append("")
+    lines.append("Resolution | Speeches | Speakers | Aff/Neg | Median")
+    for row in stats.resolutions:
+        lines.append(f"{row.resolution or '(none)'} | {row.speeches} | {row.speakers} | {row.aff}/{row.neg} | "
+                     f"{format_seconds(row.median)}")
+    return lines
+
+
+if __name__ == '__main__':
+    import sys
+    import persistence
+    if len(sys.argv) < 2:
+        print("usage: python speech_stats.py SESSION.csv [RESOLUTION]")
+        sys.exit(2)
+    competitors = persistence.load_from_csv(sys.argv[1])[0]
+    session = summarize(SpeechColumns.from_competitors(competitors), sys.argv[2] if len(sys.argv) > 2 else None)
+    print("\n".join(report_lines(session)))
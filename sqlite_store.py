@@ -0,0 +1,539 @@
+import json
+import os
+import sqlite3
+from models import Competitor, HistoryItem, SpeechRecord, QuestionRecord
+from undo import UNDO_LIMIT
+
+DATABASE_NAME = 'congress_tracker.db'
+SCHEMA_VERSION = 1
+
+SPEECH_COLUMNS = ('round', 'side', 'duration', 'timestamp', 'resolution')
+QUESTION_COLUMNS = ('round', 'timestamp')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    updated TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS meta (
+    session_id INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (session_id, key)
+);
+CREATE TABLE IF NOT EXISTS competitors (
+    session_id INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    speeches INTEGER NOT NULL DEFAULT 0,
+    questions INTEGER NOT NULL DEFAULT 0,
+    last_speech_round INTEGER NOT NULL DEFAULT 0,
+    last_question_round INTEGER NOT NULL DEFAULT 0,
+    speech_rank INTEGER NOT NULL DEFAULT 0,
+    question_rank INTEGER NOT NULL DEFAULT 0,
+    current_side TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (session_id, name)
+);
+CREATE TABLE IF NOT EXISTS speeches (
+    id INTEGER PRIMARY KEY,
+    session_id INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    round INTEGER,
+    side TEXT,
+    duration INTEGER,
+    timestamp TEXT,
+    resolution TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS speeches_by_name ON speeches (session_id, name, id);
+CREATE TABLE IF NOT EXISTS questions (
+    id INTEGER PRIMARY KEY,
+    session_id INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    round INTEGER,
+    timestamp TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS questions_by_name ON questions (session_id, name, id);
+CREATE TABLE IF NOT EXISTS notes (
+    session_id INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    category TEXT NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (session_id, name, category)
+);
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY,
+    session_id INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    action_type TEXT,
+    competitor_name TEXT,
+    count_type TEXT,
+    old_value INTEGER,
+    new_value INTEGER,
+    timestamp TEXT
+);
+CREATE INDEX IF NOT EXISTS history_by_session ON history (session_id, id);
+CREATE INDEX IF NOT EXISTS history_by_type ON history (session_id, action_type, id);
+CREATE TABLE IF NOT EXISTS recency (
+    session_id INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    list_type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (session_id, list_type, name)
+);
+CREATE INDEX IF NOT EXISTS recency_by_position ON recency (session_id, list_type, position);
+CREATE TABLE IF NOT EXISTS undo_actions (
+    id INTEGER PRIMARY KEY,
+    session_id INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    stack TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS undo_by_session ON undo_actions (session_id, stack, id);
+"""
+
+SESSION_TABLES = ('meta', 'competitors', 'speeches', 'questions', 'notes', 'history', 'recency', 'undo_actions')
+
+
+def database_path(csv_path):
+    """Database shared by every session saved in the same folder as csv_path"""
+    return os.path.join(os.path.dirname(csv_path), DATABASE_NAME)
+
+def session_key(csv_path):
+    return os.path.basename(csv_path)
+
+def _split_record(record, columns):
+    """Known fields of a speech/question dict as column values, the rest as JSON"""
+    values = [record.get(column) for column in columns]
+    extra = {k: v for k, v in record.items() if k not in columns}
+    return values + [json.dumps(extra) if extra else None]
+
+def _join_record(row, columns):
+    record = dict(zip(columns, row))
+    extra = row[len(columns)]
+    if extra:
+        record.update(json.loads(extra))
+    return record
+
+
+class SQLiteStore:
+    """Session storage in a single SQLite database running in WAL mode.
+
+    Holds the same state as the CSV bundle (competitors, speech and question
+    records, notes, history, recency orders and resolution state) for any
+    number of sessions, keyed by the CSV file name. apply_event() takes the
+    journal's event format and commits each action as one small transaction;
+    save_snapshot() replaces a whole session from a SessionSnapshot.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        # In WAL mode NORMAL only syncs at checkpoints, and a crash can at worst
+        # lose the last few commits, never corrupt the database
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+            self.conn.execute("PRAGMA user_version=%d" % SCHEMA_VERSION)
+
+    def close(self):
+        self.conn.close()
+
+    # Sessions
+
+    def sessions(self):
+        """Keys of every stored session, most recently updated first"""
+        rows = self.conn.execute("SELECT key FROM sessions ORDER BY updated DESC, id DESC")
+        return [key for key, in rows]
+
+    def has_session(self, key):
+        return self._session_id(key) is not None
+
+    def _session_id(self, key, create=False):
+        row = self.conn.execute("SELECT id FROM sessions WHERE key = ?", (key,)).fetchone()
+        if row:
+            return row[0]
+        if not create:
+            return None
+        return self.conn.execute("INSERT INTO sessions (key) VALUES (?)", (key,)).lastrowid
+
+    def _touch(self, session_id):
+        self.conn.execute("UPDATE sessions SET updated = CURRENT_TIMESTAMP WHERE id = ?", (session_id,))
+
+    def rename_session(self, old_key, new_key):
+        with self.conn:
+            self.conn.execute("DELETE FROM sessions WHERE key = ?", (new_key,))
+            self.conn.execute("UPDATE sessions SET key = ? WHERE key = ?", (new_key, old_key))
+
+    def delete_session(self, key):
+        with self.conn:
+            self.conn.execute("DELETE FROM sessions WHERE key = ?", (key,))
+
+    # Whole-session writes and reads
+
+    def save_snapshot(self, key, snapshot):
+        """Replace a session with the contents of a SessionSnapshot"""
+        with self.conn:
+            session_id = self._session_id(key, create=True)
+            for table in SESSION_TABLES:
+                if snapshot.history is None and table == 'history':
+                    continue
+                if snapshot.recency is None and table == 'recency':
+                    continue
+                if snapshot.resolutions is None and table == 'meta':
+                    continue
+                if snapshot.undo is None and table == 'undo_actions':
+                    continue
+                self.conn.execute(f"DELETE FROM {table} WHERE session_id = ?", (session_id,))
+
+            for position, row in enumerate(snapshot.rows):
+                self._insert_competitor(session_id, position, row)
+
+            if snapshot.history is not None:
+                for item in snapshot.history:
+                    self._insert_history(session_id, item)
+
+            if snapshot.recency is not None:
+                for list_type in ('speech', 'question'):
+                    order = snapshot.recency.get(f'{list_type}_recency_order', [])
+                    self.conn.executemany(
+                        "INSERT OR IGNORE INTO recency (session_id, list_type, name, position) VALUES (?, ?, ?, ?)",
+                        [(session_id, list_type, name, position) for position, name in enumerate(order)])
+
+            if snapshot.undo is not None:
+                for stack in ('undo', 'redo'):
+                    self.conn.executemany(
+                        "INSERT INTO undo_actions (session_id, stack, data) VALUES (?, ?, ?)",
+                        [(session_id, stack, json.dumps(action)) for action in snapshot.undo.get(stack, [])])
+
+            if snapshot.resolutions is not None:
+                for meta_key, value in snapshot.resolutions.items():
+                    if meta_key != 'journal_seq':
+                        self._set_meta(session_id, meta_key, value)
+            self._touch(session_id)
+
+    def _insert_competitor(self, session_id, position, row):
+        name = row['name']
+        notes = row.get('notes', {})
+        if isinstance(notes, str):
+            notes = json.loads(notes) if notes else {}
+        self.conn.execute(
+            "INSERT INTO competitors (session_id, name, position, speeches, questions, last_speech_round,"
+            " last_question_round, speech_rank, question_rank, current_side) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (session_id, name, position, int(row.get('speeches', 0)), int(row.get('questions', 0)),
+             int(row.get('last_speech_round', 0)), int(row.get('last_question_round', 0)),
+             int(row.get('speech_rank', 0)), int(row.get('question_rank', 0)), row.get('current_side', "")))
+        for speech in notes.get('speeches', []):
+            self._insert_speech(session_id, name, speech)
+        for question in notes.get('questions', []):
+            if isinstance(question, dict):
+                self._insert_question(session_id, name, question)
+        for category, text in notes.items():
+            if category not in ('speeches', 'questions'):
+                self._set_note(session_id, name, category, text)
+
+    def _insert_speech(self, session_id, name, speech):
+        self.conn.execute(
+            "INSERT INTO speeches (session_id, name, round, side, duration, timestamp, resolution, extra)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [session_id, name] + _split_record(speech, SPEECH_COLUMNS))
+
+    def _insert_question(self, session_id, name, question):
+        self.conn.execute(
+            "INSERT INTO questions (session_id, name, round, timestamp, extra) VALUES (?, ?, ?, ?, ?)",
+            [session_id, name] + _split_record(question, QUESTION_COLUMNS))
+
+    def _insert_history(self, session_id, item):
+        self.conn.execute(
+            "INSERT INTO history (session_id, action_type, competitor_name, count_type, old_value, new_value, timestamp)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (session_id, item.get('action_type', ''), item.get('competitor_name', ''), item.get('count_type', ''),
+             item.get('old_value', 0), item.get('new_value', 0), item.get('timestamp', '')))
+
+    def _set_note(self, session_id, name, category, text):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO notes (session_id, name, category, text) VALUES (?, ?, ?, ?)",
+            (session_id, name, category, text if isinstance(text, str) else json.dumps(text)))
+
+    def _set_meta(self, session_id, key, value):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta (session_id, key, value) VALUES (?, ?, ?)",
+            (session_id, key, json.dumps(value)))
+
+    def load_session(self, key):
+        """Session state in the same shape load_from_csv returns.
+
+        History stays in the database and is read through SQLiteHistory, so the
+        history list returned here is always empty.
+        """
+        session_id = self._session_id(key)
+        if session_id is None:
+            raise KeyError(f"No saved session named {key}")
+        execute = self.conn.execute
+
+        competitors = []
+        by_name = {}
+        for row in execute(
+                "SELECT name, speeches, questions, last_speech_round, last_question_round, speech_rank,"
+                " question_rank, current_side FROM competitors WHERE session_id = ? ORDER BY position", (session_id,)):
+            competitor = Competitor(row[0])
+            (competitor.speeches, competitor.questions, competitor.last_speech_round, competitor.last_question_round,
+             competitor.speech_rank, competitor.question_rank, competitor.current_side) = row[1:]
+            competitors.append(competitor)
+            by_name[competitor.name] = competitor
+
+        for row in execute("SELECT name, round, side, duration, timestamp, resolution, extra FROM speeches"
+                           " WHERE session_id = ? ORDER BY id", (session_id,)):
+            if row[0] in by_name:
+                by_name[row[0]].speech_records.append(SpeechRecord.from_dict(_join_record(row[1:], SPEECH_COLUMNS)))
+        for competitor in competitors:
+            competitor.reindex_speeches()
+        for row in execute("SELECT name, round, timestamp, extra FROM questions WHERE session_id = ? ORDER BY id",
+                           (session_id,)):
+            if row[0] in by_name:
+                by_name[row[0]].question_records.append(QuestionRecord.from_dict(_join_record(row[1:], QUESTION_COLUMNS)))
+        for name, category, text in execute("SELECT name, category, text FROM notes WHERE session_id = ?",
+                                            (session_id,)):
+            if name in by_name:
+                by_name[name].notes[category] = text
+
+        speech_order = self._recency(session_id, 'speech')
+        question_order = self._recency(session_id, 'question')
+
+        meta = {k: json.loads(v) for k, v in execute("SELECT key, value FROM meta WHERE session_id = ?", (session_id,))}
+        return (competitors, [], speech_order, question_order, meta.get('resolution_list', []),
+                meta.get('current_resolution', ""), meta.get('current_side', "Affirmative"))
+
+    def load_undo(self, key):
+        """Undo/redo state of a session in UndoStack.to_dict() form"""
+        state = {'undo': [], 'redo': []}
+        session_id = self._session_id(key)
+        if session_id is not None:
+            for stack, data in self.conn.execute(
+                    "SELECT stack, data FROM undo_actions WHERE session_id = ? ORDER BY id", (session_id,)):
+                state.setdefault(stack, []).append(json.loads(data))
+        return state
+
+    def _recency(self, session_id, list_type):
+        rows = self.conn.execute(
+            "SELECT name FROM recency WHERE session_id = ? AND list_type = ? ORDER BY position",
+            (session_id, list_type))
+        return [name for name, in rows]
+
+    # Per-action writes
+
+    def apply_event(self, key, op, history_items=(), **fields):
+        """Commit one action, in the journal's event format, as a single transaction.
+
+        history_items are history entries (as dicts) logged by the action,
+        written in the same transaction so neither can land without the other.
+        """
+        with self.conn:
+            session_id = self._session_id(key, create=True)
+            name = fields.get('name')
+            if op == 'speech':
+                speech = fields['speech']
+                self._insert_speech(session_id, name, speech)
+                self.conn.execute(
+                    "UPDATE competitors SET speeches = speeches + 1, current_side = ?, last_speech_round = ?"
+                    " WHERE session_id = ? AND name = ?",
+                    (speech.get('side', ""), speech.get('round', 0), session_id, name))
+                self._move_to_end(session_id, 'speech', name)
+                if 'current_side' in fields:
+                    self._set_meta(session_id, 'current_side', fields['current_side'])
+            elif op == 'question':
+                self.conn.execute(
+                    "UPDATE competitors SET questions = ?, last_question_round = ? WHERE session_id = ? AND name = ?",
+                    (fields['questions'], fields.get('round', 0), session_id, name))
+                self._move_to_end(session_id, 'question', name)
+            elif op == 'move':
+                self._swap(session_id, fields.get('list', 'speech'), name, fields.get('direction', 0))
+            elif op == 'notes':
+                self._set_note(session_id, name, fields['category'], fields.get('text', ""))
+            elif op == 'resolution':
+                for meta_key in ('resolution_list', 'current_resolution', 'current_side'):
+                    if meta_key in fields:
+                        self._set_meta(session_id, meta_key, fields[meta_key])
+            if fields.get('history'):
+                self._insert_history(session_id, fields['history'])
+            for item in history_items:
+                self._insert_history(session_id, item)
+            if fields.get('action'):
+                self._push_undo(session_id, fields['action'])
+            self._touch(session_id)
+
+    def _push_undo(self, session_id, action):
+        self.conn.execute("DELETE FROM undo_actions WHERE session_id = ? AND stack = 'redo'", (session_id,))
+        self.conn.execute("INSERT INTO undo_actions (session_id, stack, data) VALUES (?, 'undo', ?)",
+                          (session_id, json.dumps(action)))
+        # Trim to the same limit the in-memory ring buffer keeps
+        self.conn.execute(
+            "DELETE FROM undo_actions WHERE session_id = ? AND stack = 'undo' AND id NOT IN"
+            " (SELECT id FROM undo_actions WHERE session_id = ? AND stack = 'undo' ORDER BY id DESC LIMIT ?)",
+            (session_id, session_id, UNDO_LIMIT))
+
+    def _move_to_end(self, session_id, list_type, name):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO recency (session_id, list_type, name, position) VALUES (?, ?, ?,"
+            " (SELECT COALESCE(MAX(position), -1) + 1 FROM recency WHERE session_id = ? AND list_type = ?))",
+            (session_id, list_type, name, session_id, list_type))
+
+    def _swap(self, session_id, list_type, name, direction):
+        row = self.conn.execute(
+            "SELECT position FROM recency WHERE session_id = ? AND list_type = ? AND name = ?",
+            (session_id, list_type, name)).fetchone()
+        if row is None or not direction:
+            return
+        position = row[0]
+        comparison, ordering = ('<', 'DESC') if direction < 0 else ('>', 'ASC')
+        other = self.conn.execute(
+            f"SELECT name, position FROM recency WHERE session_id = ? AND list_type = ? AND position {comparison} ?"
+            f" ORDER BY position {ordering} LIMIT 1",
+            (session_id, list_type, position)).fetchone()
+        if other is None:
+            return
+        update = "UPDATE recency SET position = ? WHERE session_id = ? AND list_type = ? AND name = ?"
+        self.conn.execute(update, (other[1], session_id, list_type, name))
+        self.conn.execute(update, (position, session_id, list_type, other[0]))
+
+
+HISTORY_COLUMNS = "action_type, competitor_name, count_type, old_value, new_value, timestamp"
+
+
+class SQLiteHistory:
+    """A session's history table, with the same interface as history_store.HistoryLog.
+
+    Counts are kept in memory and pages are read with the (session, type, id)
+    index, so the full history never has to be loaded. Entries appended with
+    commit=False are held in memory, visible to reads, until the owner writes
+    them in the same transaction as the action that logged them
+    (SQLiteStore.apply_event) and calls mark_written().
+    """
+
+    def __init__(self, store, key):
+        self.store = store
+        self.key = key
+        self._pending = []
+        self._counts = {None: 0}
+        session_id = store._session_id(key)
+        if session_id is not None:
+            for kind, count in store.conn.execute(
+                    "SELECT action_type, COUNT(*) FROM history WHERE session_id = ? GROUP BY action_type",
+                    (session_id,)):
+                self._counts[kind] = count
+                self._counts[None] += count
+
+    def _select(self, kind, order, limit, offset):
+        session_id = self.store._session_id(self.key)
+        if session_id is None:
+            return []
+        where, params = "session_id = ?", [session_id]
+        if kind is not None:
+            where += " AND action_type = ?"
+            params.append(kind)
+        rows = self.store.conn.execute(
+            f"SELECT {HISTORY_COLUMNS} FROM history WHERE {where} ORDER BY id {order} LIMIT ? OFFSET ?",
+            params + [limit, offset])
+        return [HistoryItem(*row) for row in rows]
+
+    def count(self, kind=None):
+        return self._counts.get(kind, 0)
+
+    def _pending_of(self, kind):
+        return [item for item in self._pending if kind is None or item.action_type == kind]
+
+    def __len__(self):
+        return self._counts[None]
+
+    def __getitem__(self, position):
+        total = len(self)
+        if position < 0:
+            position += total
+        if not 0 <= position < total:
+            raise IndexError("history index out of range")
+        count = total - len(self._pending)
+        if position >= count:
+            return self._pending[position - count]
+        # Read from whichever end is closer
+        if position >= count // 2:
+            return self._select(None, 'DESC', 1, count - 1 - position)[0]
+        return self._select(None, 'ASC', 1, position)[0]
+
+    def __iter__(self):
+        session_id = self.store._session_id(self.key)
+        if session_id is None:
+            return
+        for row in self.store.conn.execute(
+                f"SELECT {HISTORY_COLUMNS} FROM history WHERE session_id = ? ORDER BY id", (session_id,)):
+            yield HistoryItem(*row)
+        yield from list(self._pending)
+
+    def page(self, start, size, kind=None):
+        start = max(start, 0)
+        if size <= 0:
+            return []
+        pending = self._pending_of(kind)
+        stored = self.count(kind) - len(pending)
+        items = self._select(kind, 'ASC', size, start) if start < stored else []
+        skip = max(start - stored, 0)
+        return items + pending[skip:skip + size - len(items)]
+
+    def append(self, item, commit=True):
+        if commit:
+            self.extend([item])
+            return
+        self._pending.append(item)
+        self._counts[item.action_type] = self._counts.get(item.action_type, 0) + 1
+        self._counts[None] += 1
+
+    def pending(self):
+        """Entries appended with commit=False and not yet in the database"""
+        return list(self._pending)
+
+    def mark_written(self):
+        """The pending entries were written by the caller's own transaction"""
+        self._pending = []
+
+    def commit_pending(self):
+        """Write the pending entries in a transaction of their own"""
+        if self._pending:
+            with self.store.conn:
+                session_id = self.store._session_id(self.key, create=True)
+                for item in self._pending:
+                    self.store._insert_history(session_id, item.to_dict())
+            self._pending = []
+
+    def extend(self, items):
+        with self.store.conn:
+            session_id = self.store._session_id(self.key, create=True)
+            for item in items:
+                self.store._insert_history(session_id, item.to_dict())
+                self._counts[item.action_type] = self._counts.get(item.action_type, 0) + 1
+                self._counts[None] += 1
+
+    def pop(self):
+        item = self[-1]
+        if self._pending:
+            self._pending.pop()
+        else:
+            with self.store.conn:
+                self.store.conn.execute(
+                    "DELETE FROM history WHERE id = (SELECT MAX(id) FROM history WHERE session_id = ?)",
+                    (self.store._session_id(self.key),))
+        self._counts[item.action_type] -= 1
+        self._counts[None] -= 1
+        return item
+
+    def clear(self):
+        session_id = self.store._session_id(self.key)
+        if session_id is not None:
+            with self.store.conn:
+                self.store.conn.execute("DELETE FROM history WHERE session_id = ?", (session_id,))
+        self._pending = []
+        self._counts = {None: 0}
+
+    def close(self):
+        self.commit_pending()  # The store owns the connection
@@ -0,0 +1,61 @@
+import time
+from contextlib import contextmanager
+
+
+class StartupTrace:
+    """Where the time goes between launch and the window's first paint.
+
+    phase() times one step of startup on time.perf_counter(); steps can
+    nest, and a nested step's time also counts toward its parent. Times are
+    measured from when the trace was created, so creating it first thing in
+    main.py covers imports too. Nothing here needs Qt.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        self.origin = clock()
+        self.phases = []  # (name, depth, seconds), in the order they started
+        self.first_paint = None  # seconds from origin, once painted
+        self._depth = 0
+
+    def now(self):
+        """Seconds since the trace was created"""
+        return self._clock() - self.origin
+
+    @contextmanager
+    def phase(self, name):
+        slot = len(self.phases)
+        self.phases.append((name, self._depth, None))  # Filled in when the phase ends
+        self._depth += 1
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.phases[slot] = (name, self._depth, self._clock() - start)
+
+    def mark_first_paint(self):
+        """Record the first paint; returns False if one was already recorded"""
+        if self.first_paint is not None:
+            return False
+        self.first_paint = self.now()
+        return True
+
+    def cost(self, name):
+        """Total seconds spent in phases with this name"""
+        return sum(seconds or 0 for phase, _, seconds in self.phases if phase == name)
+
+    def summary(self):
+        """One line: time to first paint and the top-level phases"""
+        parts = [f"{name} {seconds * 1000:.0f} ms" for name, depth, seconds in self.phases
+                 if depth == 0 and seconds is not None]
+        paint = "not yet painted" if self.first_paint is None else f"first paint at {self.first_paint * 1000:.0f} ms"
+        return f"Startup: {paint} ({', '.join(parts)})" if parts else f"Startup: {paint}"
+
+    def report_lines(self):
+        """The summary, then every finished phase indented under the one it ran in"""
+        lines = [self.summary()]
+        for name, depth, seconds in self.phases:
+            if seconds is not None:
+                lines.append(f"{'  ' * (depth + 1)}{name}: {seconds * 1000:.1f} ms")
+        return lines
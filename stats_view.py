@@ -0,0 +1,113 @@
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from speech_stats import format_seconds
+
+
+class StatsTableModel(QAbstractTableModel):
+    """One row per competitor, with figures read live from a RunningStats.
+
+    Rows only change when the roster does; a logged or undone speech is a
+    dataChanged on that competitor's row, and switching resolution is a
+    dataChanged over the figures. StatsFilterProxy hides competitors with no
+    speeches on the selected resolution and does the sorting.
+    """
+    HEADERS = ("Name", "Side", "Speech Count", "Avg. Time")
+    SortRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, stats, parent=None):
+        super().__init__(parent)
+        self._stats = stats
+        self._competitors = []
+        self._rows = {}  # competitor -> row
+        self.resolution = None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._competitors)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def tally(self, row):
+        return self._stats.tally(self._competitors[row], self.resolution)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role not in (Qt.ItemDataRole.DisplayRole, self.SortRole):
+            return None
+        competitor = self._competitors[index.row()]
+        column = index.column()
+        if column == 0:
+            return competitor.name if role == Qt.ItemDataRole.DisplayRole else competitor.name.casefold()
+        tally = self.tally(index.row())
+        if column == 1:
+            return tally.side if tally else ""
+        if column == 2:
+            speeches = tally.speeches if tally else 0
+            return str(speeches) if role == Qt.ItemDataRole.DisplayRole else speeches
+        average = tally.average if tally else 0
+        return format_seconds(average) if role == Qt.ItemDataRole.DisplayRole else average
+
+    def set_resolution(self, resolution):
+        if resolution != self.resolution:
+            self.resolution = resolution
+            self._figures_changed(0, len(self._competitors) - 1)
+
+    def sync(self, competitors):
+        """Catch up with the roster and with whatever the stats say changed"""
+        self._sync_roster(competitors)
+        changed, everything = self._stats.take_changes()
+        if everything:
+            if self._competitors:
+                self.dataChanged.emit(self.index(0, 0), self.index(len(self._competitors) - 1, len(self.HEADERS) - 1))
+            return
+        for competitor in changed:
+            row = self._rows.get(competitor)
+            if row is not None:
+                self._figures_changed(row, row)
+
+    def _figures_changed(self, first, last):
+        if first <= last:
+            self.dataChanged.emit(self.index(first, 1), self.index(last, len(self.HEADERS) - 1))
+
+    def _sync_roster(self, competitors):
+        old = self._competitors
+        if len(competitors) == len(old) and all(a is b for a, b in zip(competitors, old)):
+            return
+        if len(competitors) > len(old) and all(a is b for a, b in zip(competitors, old)):
+            # Competitors added at the end
+            self.beginInsertRows(QModelIndex(), len(old), len(competitors) - 1)
+            self._set_competitors(competitors)
+            self.endInsertRows()
+            return
+        if len(competitors) == len(old) - 1:
+            # One competitor removed
+            row = next((i for i, (a, b) in enumerate(zip(competitors, old)) if a is not b), len(competitors))
+            if all(a is b for a, b in zip(competitors[row:], old[row + 1:])):
+                self.beginRemoveRows(QModelIndex(), row, row)
+                self._set_competitors(competitors)
+                self.endRemoveRows()
+                return
+        self.beginResetModel()
+        self._set_competitors(competitors)
+        self.endResetModel()
+
+    def _set_competitors(self, competitors):
+        self._competitors = list(competitors)
+        self._rows = {competitor: row for row, competitor in enumerate(self._competitors)}
+
+
+class StatsFilterProxy(QSortFilterProxyModel):
+    """Competitors with speeches on the selected resolution, sortable on any column"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSortRole(StatsTableModel.SortRole)
+        self.setDynamicSortFilter(True)
+        self.setFilterKeyColumn(-1)  # Figures changing in any column can show or hide a row
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        tally = self.sourceModel().tally(source_row)
+        return tally is not None and tally.speeches > 0
@@ -0,0 +1,79 @@
+import os
+import persistence
+from session_generator import SessionState, generate_actions
+
+
+def journal_session(csv_path, actions):
+    """Apply actions live while journaling them the way CongressTracker.record_action does.
+
+    The snapshot is written once, right after the roster is entered, so
+    everything else has to come back from the journal.
+    """
+    state = SessionState()
+    journal = None
+    for action in actions:
+        state.apply(action)
+        if action.kind == 'roster':
+            persistence.save_to_csv(csv_path, state.competitors, None, state.speech_precedence.recency_order(),
+                                    state.question_precedence.recency_order(), [], "", state.current_side,
+                                    journal_seq=0)
+            journal = persistence.SessionJournal(csv_path)
+        elif action.kind in ('resolution', 'next_resolution'):
+            journal.append('resolution', resolution_list=list(state.resolution_list),
+                           current_resolution=state.current_resolution, current_side=state.current_side)
+        elif action.kind == 'speech':
+            competitor = state.by_name[action.name]
+            journal.append('speech', name=action.name, speech=competitor.speech_records[-1].to_dict(),
+                           current_side=state.current_side)
+        elif action.kind == 'question':
+            competitor = state.by_name[action.name]
+            journal.append('question', name=action.name, questions=competitor.questions,
+                           round=competitor.last_question_round)
+        elif action.kind == 'move':
+            list_type, direction = action.value
+            journal.append('move', list=list_type, name=action.name, direction=direction)
+    return state, journal
+
+
+def test_replay_matches_live_state(tmp_path):
+    csv_path = str(tmp_path / 'session.csv')
+    live, _ = journal_session(csv_path, generate_actions(12, seed=3))
+
+    competitors, _, speech_order, question_order, resolutions, current, side = persistence.load_from_csv(csv_path)
+
+    assert speech_order == live.speech_precedence.recency_order()
+    assert question_order == live.question_precedence.recency_order()
+    assert (resolutions, current, side) == (live.resolution_list, live.current_resolution, live.current_side)
+    assert [c.name for c in competitors] == [c.name for c in live.competitors]
+    for replayed, expected in zip(competitors, live.competitors):
+        assert [r.to_dict() for r in replayed.speech_records] == [r.to_dict() for r in expected.speech_records]
+        assert replayed.questions == expected.questions
+        assert replayed.last_question_round == expected.last_question_round
+        assert replayed.resolution_sides == expected.resolution_sides
+        # The side shown is the one taken on the current resolution
+        assert replayed.current_side == expected.resolution_sides.get(live.current_resolution, "")
+
+
+def test_speech_replay_sets_resolution_side(tmp_path):
+    csv_path = str(tmp_path / 'session.csv')
+    journal_session(csv_path, generate_actions(4, seed=1))
+    competitors = persistence.load_from_csv(csv_path)[0]
+    for competitor in competitors:
+        for record in competitor.speech_records:
+            assert record.resolution in competitor.resolution_sides
+        if competitor.speech_records:
+            last = competitor.speech_records[-1]
+            assert competitor.resolution_sides[last.resolution] == last.side
+
+
+def test_truncate_keeps_journal_without_a_snapshot(tmp_path):
+    csv_path = str(tmp_path / 'session.csv')
+    live, journal = journal_session(csv_path, generate_actions(4, seed=2))
+
+    # The snapshot on disk still stops at seq 0, so the journal is the only copy
+    journal.truncate()
+    assert os.path.exists(journal.path)
+
+    persistence.save_to_csv(csv_path, live.competitors, None, journal_seq=journal.seq)
+    journal.truncate()
+    assert not os.path.exists(journal.path)
@@ -0,0 +1,9 @@
+import os
+import traceback
+from lag_monitor import _handler
+
+
+def test_handler_names_the_slot_by_file_name():
+    path = os.path.join(os.sep, 'home', 'chair', 'tracker', 'ui.py')
+    summary = traceback.StackSummary.from_list([(path, 10, '<module>', ''), (path, 2750, 'confirm_log_speech', '')])
+    assert _handler(summary) == "confirm_log_speech (ui.py:2750)"
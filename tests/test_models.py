@@ -0,0 +1,29 @@
+from models import Competitor, CompetitorRegistry
+
+
+def test_registry_finds_names_ignoring_case():
+    registry = CompetitorRegistry([Competitor("Avery Chen")])
+    assert registry.find("avery chen").name == "Avery Chen"
+    assert registry.get("avery chen") is None
+
+
+def test_registry_keeps_case_twins_findable():
+    upper, lower = Competitor("Avery Chen"), Competitor("avery chen")
+    registry = CompetitorRegistry([upper, lower])
+    assert registry.find("AVERY CHEN") is upper
+
+    registry.remove("Avery Chen")
+    assert registry.find("Avery Chen") is lower
+
+    registry.rename("avery chen", "Avery Chen-Patel")
+    assert registry.find("avery chen") is None
+    assert registry.find("avery chen-patel") is lower
+
+
+def test_registry_rename_to_case_twin_of_another():
+    first, second = Competitor("Jordan Kim"), Competitor("Riley Sato")
+    registry = CompetitorRegistry([first, second])
+    registry.rename("Riley Sato", "jordan kim")
+    registry.remove("Jordan Kim")
+    assert registry.find("JORDAN KIM") is second
+    assert len(registry) == 1
@@ -0,0 +1,105 @@
+import os
+import pytest
+import persistence
+from models import Competitor
+
+
+def competitors(*names):
+    return [Competitor(name) for name in names]
+
+
+@pytest.fixture
+def writer():
+    writer = persistence.PersistenceWriter(on_error=lambda message: None)
+    yield writer
+    writer.close()
+
+
+def journaled_save(writer, csv_path, roster):
+    """Journal two actions and compact them into a snapshot, through the writer"""
+    persistence.save_to_csv(csv_path, roster, journal_seq=0)
+    journal = persistence.SessionJournal(csv_path, writer=writer)
+    journal.append('question', name=roster[0].name, questions=1, round=0)
+    journal.append('question', name=roster[1].name, questions=1, round=1)
+    writer.submit_snapshot(csv_path, persistence.snapshot_session(roster, journal_seq=journal.seq))
+    journal.truncate()
+    writer.flush()
+    return journal
+
+
+def test_failed_snapshot_keeps_the_journal(tmp_path, writer, monkeypatch):
+    csv_path = str(tmp_path / 'session.csv')
+    roster = competitors("Avery Chen", "Jordan Patel")
+    persistence.save_to_csv(csv_path, roster, journal_seq=0)
+
+    # As when the CSV is open in Excel on Windows
+    def locked(filepath, snapshot):
+        raise PermissionError(13, "Permission denied", filepath)
+    monkeypatch.setattr(persistence, 'write_snapshot', locked)
+
+    roster[0].questions = 1
+    journal = persistence.SessionJournal(csv_path, writer=writer)
+    journal.append('question', name="Avery Chen", questions=1, round=0)
+    writer.submit_snapshot(csv_path, persistence.snapshot_session(roster, journal_seq=journal.seq))
+    journal.truncate()
+    writer.flush()
+
+    assert [e['name'] for e in persistence.read_journal(journal.path)] == ["Avery Chen"]
+    monkeypatch.undo()
+    loaded = persistence.load_from_csv(csv_path)[0]
+    assert [c.questions for c in loaded] == [1, 0]
+
+
+def test_successful_snapshot_truncates_the_journal(tmp_path, writer):
+    csv_path = str(tmp_path / 'session.csv')
+    journal = journaled_save(writer, csv_path, competitors("Avery Chen", "Jordan Patel"))
+    assert not os.path.exists(journal.path)
+    assert persistence.snapshot_journal_seq(csv_path) == journal.seq
+
+
+def interrupted_save(monkeypatch, csv_path, roster):
+    """Write a snapshot's temp files, then crash before the first rename"""
+    def power_cut(src, dst):
+        raise OSError("power cut")
+    monkeypatch.setattr(os, 'replace', power_cut)
+    with pytest.raises(OSError):
+        persistence.write_snapshot(csv_path, persistence.snapshot_session(roster, resolution_list=["A Bill"]))
+    monkeypatch.undo()
+
+
+def test_recover_bundle_completes_a_synced_save(tmp_path, monkeypatch):
+    csv_path = str(tmp_path / 'session.csv')
+    persistence.save_to_csv(csv_path, competitors("Avery Chen"), resolution_list=[])
+    interrupted_save(monkeypatch, csv_path, competitors("Avery Chen", "Jordan Patel"))
+
+    assert persistence.recover_bundle(csv_path) == []
+    loaded = persistence.load_from_csv(csv_path)
+    assert [c.name for c in loaded[0]] == ["Avery Chen", "Jordan Patel"]
+    assert loaded[4] == ["A Bill"]
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+
+def test_recover_bundle_discards_torn_temps(tmp_path, monkeypatch):
+    csv_path = str(tmp_path / 'session.csv')
+    persistence.save_to_csv(csv_path, competitors("Avery Chen"), resolution_list=[])
+    interrupted_save(monkeypatch, csv_path, competitors("Avery Chen", "Jordan Patel"))
+    # The power went before the temps were synced: one of them is cut short
+    with open(csv_path + '.tmp', 'r+b') as f:
+        f.truncate(10)
+
+    problems = persistence.recover_bundle(csv_path)
+    assert problems and 'session.csv' in problems[0]
+    assert persistence.recover_bundle(csv_path) == []  # The previous save is intact
+    loaded = persistence.load_from_csv(csv_path)
+    assert [c.name for c in loaded[0]] == ["Avery Chen"]
+    assert loaded[4] == []
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+
+def test_recover_bundle_leaves_other_sessions_temps(tmp_path):
+    csv_path = str(tmp_path / 'congress_tracker_data.csv')
+    persistence.save_to_csv(csv_path, competitors("Avery Chen"))
+    other = tmp_path / 'congress_tracker_data1.csv.tmp'
+    other.write_text("name\n")
+    persistence.recover_bundle(csv_path)
+    assert other.exists()
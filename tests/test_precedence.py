@@ -0,0 +1,98 @@
+import random
+from precedence import PrecedenceEngine, RecencyOrder
+
+
+class NaiveOrder:
+    """Counts and a plain recency list, sorted from scratch every time"""
+
+    def __init__(self, names):
+        self.recency = list(names)
+        self.counts = dict.fromkeys(names, 0)
+
+    def ordered(self):
+        return sorted(self.recency, key=lambda name: (self.counts[name], self.recency.index(name)))
+
+    def log(self, name, count):
+        self.recency.remove(name)
+        self.recency.append(name)
+        self.counts[name] = count
+
+    def swap(self, name, direction):
+        i = self.recency.index(name)
+        j = i + direction
+        if 0 <= j < len(self.recency):
+            self.recency[i], self.recency[j] = self.recency[j], self.recency[i]
+
+    def restore(self, name, count, after):
+        self.recency.remove(name)
+        self.recency.insert(self.recency.index(after) + 1 if after is not None else 0, name)
+        self.counts[name] = count
+
+
+def assert_same(engine, naive):
+    expected = naive.ordered()
+    assert engine.ordered() == expected
+    assert engine.ordered(manual=True) == naive.recency
+    assert engine.first() == expected[0]
+    assert engine.top(3) == expected[:3]
+    for rank, name in enumerate(expected, start=1):
+        assert engine.rank(name) == rank
+        assert engine.rank(name, manual=True) == naive.recency.index(name) + 1
+
+
+def test_engine_matches_a_naive_sort():
+    rng = random.Random(11)
+    names = [f"Competitor {i}" for i in range(12)]
+    engine = PrecedenceEngine(RecencyOrder(names), dict.fromkeys(names, 0))
+    naive = NaiveOrder(names)
+    undo = []
+    for _ in range(400):
+        name = rng.choice(naive.recency)
+        roll = rng.random()
+        if roll < 0.5:
+            slot = (name, naive.counts[name], engine.recency.neighbour(name, -1), engine.recency.position(name))
+            count = naive.counts[name] + 1
+            engine.log(name, count)
+            naive.log(name, count)
+            undo.append(slot)
+        elif roll < 0.7:
+            direction = rng.choice((-1, 1))
+            engine.swap(name, direction)
+            naive.swap(name, direction)
+            undo.clear()  # A swap moves the neighbours a restore would slot back next to
+        elif undo:
+            name, count, after, seq = undo.pop()
+            engine.restore(name, count, after, seq)
+            naive.restore(name, count, after)
+        assert_same(engine, naive)
+
+
+def test_rename_and_remove_keep_the_order():
+    names = ["Avery Chen", "Jordan Patel", "Riley Nguyen", "Sam Okafor"]
+    engine = PrecedenceEngine(RecencyOrder(names), dict.fromkeys(names, 0))
+    naive = NaiveOrder(names)
+    for name in ("Avery Chen", "Riley Nguyen", "Avery Chen"):
+        count = naive.counts[name] + 1
+        engine.log(name, count)
+        naive.log(name, count)
+
+    engine.rename("Riley Nguyen", "Riley Tran")
+    naive.recency[naive.recency.index("Riley Nguyen")] = "Riley Tran"
+    naive.counts["Riley Tran"] = naive.counts.pop("Riley Nguyen")
+    assert_same(engine, naive)
+
+    engine.remove("Jordan Patel")
+    naive.recency.remove("Jordan Patel")
+    del naive.counts["Jordan Patel"]
+    assert_same(engine, naive)
+    assert engine.rank("Jordan Patel") == 0
+
+
+def test_restore_renumbers_when_the_old_slot_is_gone():
+    order = RecencyOrder(["A", "B", "C"])
+    order.move_to_end("A")
+    order.swap("B", 1)
+    # A's old sequence number no longer sorts between its old neighbours
+    assert order.insert_after("A", "C", 0)
+    assert order.to_list() == ["C", "A", "B"]
+    assert [order.position(name) for name in order] == [0, 1, 2]
@@ -0,0 +1,23 @@
+import time
+import pytest
+from session_generator import build_session, generate_actions
+
+
+@pytest.fixture
+def new_york(monkeypatch):
+    if not hasattr(time, 'tzset'):
+        pytest.skip("needs time.tzset")
+    monkeypatch.setenv('TZ', 'America/New_York')
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_speech_times_match_their_history(new_york):
+    state = build_session(generate_actions(6, seed=2))
+    speeches = [item for item in state.history if item.action_type == 'speech']
+    records = sorted((r for c in state.competitors for r in c.speech_records), key=lambda r: r.stamp)
+    assert len(records) == len(speeches)
+    for record, item in zip(records, speeches):
+        assert record.timestamp[11:19] == item.timestamp
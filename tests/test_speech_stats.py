@@ -0,0 +1,45 @@
+import random
+from models import Competitor, SpeechRecord
+from speech_stats import RunningStats, SpeechColumns, summarize
+
+RESOLUTIONS = ("A Bill to Fund Public Transit", "A Resolution to Ban Social Media", "")
+
+
+def random_session(rng, size=8, speeches=40):
+    competitors = [Competitor(f"Competitor {i}") for i in range(size)]
+    for round_num in range(speeches):
+        rng.choice(competitors).add_speech_record(SpeechRecord(
+            round_num, rng.choice(("Aff", "Neg")), rng.choice((0, 95, 180, 201)), None, rng.choice(RESOLUTIONS)))
+    return competitors
+
+
+def naive_speakers(competitors, resolution):
+    return {c for c in competitors if any(resolution is None or r.resolution == resolution for r in c.speech_records)}
+
+
+def test_running_stats_match_a_full_summary():
+    competitors = random_session(random.Random(5))
+    stats = RunningStats()
+    stats.rebuild(competitors)
+    expected = {row.resolution: row for row in summarize(SpeechColumns.from_competitors(competitors)).resolutions}
+    for row in stats.resolution_rows():
+        full = expected[row.resolution]
+        assert (row.speeches, row.speakers, row.total_time, row.aff, row.neg) == \
+               (full.speeches, full.speakers, full.total_time, full.aff, full.neg)
+
+
+def test_speakers_index_follows_adds_and_removes():
+    rng = random.Random(9)
+    competitors = random_session(rng)
+    stats = RunningStats()
+    stats.rebuild(competitors)
+    for _ in range(30):
+        competitor = rng.choice(competitors)
+        if competitor.speech_records and rng.random() < 0.5:
+            removed = competitor.remove_speeches_from(len(competitor.speech_records) - 1)
+            stats.remove_all(competitor, removed)
+        else:
+            competitor.add_speech_record(SpeechRecord(0, "Aff", 120, None, rng.choice(RESOLUTIONS)))
+            stats.add(competitor, competitor.speech_records[-1])
+        for resolution in RESOLUTIONS + (None,):
+            assert set(stats.speakers(resolution)) == naive_speakers(competitors, resolution)
@@ -0,0 +1,70 @@
+import threading
+import pytest
+import persistence
+import sqlite_store
+from models import Competitor, HistoryItem
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = sqlite_store.SQLiteStore(str(tmp_path / sqlite_store.DATABASE_NAME))
+    names = ["Avery Chen", "Jordan Patel"]
+    store.save_snapshot('session', persistence.snapshot_session(
+        [Competitor(name) for name in names], None, names, names, [], "", "Affirmative"))
+    yield store
+    store.close()
+
+
+def question_item(name, old_value):
+    return HistoryItem('question', name, 'question_count', old_value, old_value + 1, "09:00:00")
+
+
+def test_history_is_committed_with_its_action(store):
+    history = sqlite_store.SQLiteHistory(store, 'session')
+    history.append(question_item("Avery Chen", 0), commit=False)
+    # Held entries are visible before they are written
+    assert len(history) == 1
+    assert history[-1].competitor_name == "Avery Chen"
+    assert [item.competitor_name for item in history.page(0, 10, 'question')] == ["Avery Chen"]
+
+    store.apply_event('session', 'question', history_items=[item.to_dict() for item in history.pending()],
+                      name="Avery Chen", questions=1, round=0)
+    history.mark_written()
+
+    reopened = sqlite_store.SQLiteHistory(store, 'session')
+    assert [item.to_dict() for item in reopened] == [question_item("Avery Chen", 0).to_dict()]
+    assert store.load_session('session')[0][0].questions == 1
+
+
+def test_failed_action_writes_no_history(store):
+    # The undo entry can't be stored, so the action fails after its history row went in
+    with pytest.raises(TypeError):
+        store.apply_event('session', 'question', history_items=[question_item("Avery Chen", 0).to_dict()],
+                          name="Avery Chen", questions=1, round=0, action=object())
+    assert len(sqlite_store.SQLiteHistory(store, 'session')) == 0
+    assert store.load_session('session')[0][0].questions == 0
+
+
+def test_writer_saves_session_snapshots_on_its_own_thread(tmp_path, monkeypatch):
+    path = str(tmp_path / sqlite_store.DATABASE_NAME)
+    threads = []
+    save_snapshot = sqlite_store.SQLiteStore.save_snapshot
+
+    def recorded(store, key, snapshot):
+        threads.append(threading.get_ident())
+        save_snapshot(store, key, snapshot)
+    monkeypatch.setattr(sqlite_store.SQLiteStore, 'save_snapshot', recorded)
+
+    writer = persistence.PersistenceWriter(on_error=lambda message: None)
+    roster = [Competitor("Avery Chen"), Competitor("Jordan Patel")]
+    writer.submit_store_snapshot(path, 'session', persistence.snapshot_session(roster))
+    roster[1].questions = 2
+    writer.submit_store_snapshot(path, 'session', persistence.snapshot_session(roster))
+    writer.close()
+
+    assert threads and threading.get_ident() not in threads
+    store = sqlite_store.SQLiteStore(path)
+    try:
+        assert [c.questions for c in store.load_session('session')[0]] == [0, 2]
+    finally:
+        store.close()
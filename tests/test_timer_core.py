@@ -0,0 +1,68 @@
+import random
+from timer_core import SpeechClock
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def run(clock, timer, steps):
+    """Tick after each step of fake time, as the QTimer would, collecting the signals fired"""
+    fired = []
+    for step in steps:
+        timer.next_wakeup_ms()
+        clock.now += step
+        fired += timer.tick()
+    return fired
+
+
+def test_signals_fire_once_under_late_ticks():
+    clock = FakeClock()
+    timer = SpeechClock(180, (60, 30, 10), clock=clock)
+    timer.start()
+    rng = random.Random(4)
+    # Mostly a little late, sometimes several seconds late
+    steps = [rng.choice((1.02, 1.3, 0.97, 4.5, 11.0)) for _ in range(120)]
+    fired = run(clock, timer, steps)
+    assert fired == [60, 30, 10]
+    assert timer.expired
+
+
+def test_one_late_tick_fires_every_signal_it_skipped():
+    clock = FakeClock()
+    timer = SpeechClock(180, (60, 30, 10), clock=clock)
+    timer.start()
+    assert run(clock, timer, [1.0, 170.5]) == [60, 30, 10]
+    assert run(clock, timer, [1.0, 1.0]) == []
+    report = timer.drift_report()
+    assert report.ticks == 4
+    assert report.skipped_seconds == 169
+    assert round(report.max_ms) == 169500  # Woke at 171.5 s aiming for 2 s
+
+
+def test_pause_and_reconfigure_do_not_refire():
+    clock = FakeClock()
+    timer = SpeechClock(180, (60, 30), clock=clock)
+    timer.start()
+    assert run(clock, timer, [121.0]) == [60]
+    timer.pause()
+    clock.now += 50  # Paused time doesn't count
+    assert timer.tick() == []
+    timer.resume()
+    # Signals already passed stay fired when the settings change mid-speech
+    timer.configure(180, (90, 60, 30))
+    assert run(clock, timer, [1.0] * 40) == [30]
+    assert timer.seconds() == 161
+
+
+def test_stopwatch_mode_has_no_signals():
+    clock = FakeClock()
+    timer = SpeechClock(180, (60, 30), countdown=False, clock=clock)
+    timer.start()
+    assert run(clock, timer, [100.0, 100.0]) == []
+    assert timer.display_seconds() == 200
+    assert not timer.expired
@@ -0,0 +1,157 @@
+import pytest
+from types import SimpleNamespace
+from models import Competitor, CompetitorRegistry, HistoryItem, SpeechRecord
+from precedence import PrecedenceEngine, RecencyOrder
+from speech_index import SideTally
+from speech_stats import RunningStats
+from undo import MoveAction, QuestionAction, SpeechAction, UndoError, UndoStack
+
+NAMES = ["Avery Chen", "Jordan Patel", "Riley Nguyen"]
+RESOLUTION = "A Bill to Fund Public Transit"
+
+
+def new_session():
+    """The parts of CongressTracker that undo actions read and write"""
+    competitors = [Competitor(name) for name in NAMES]
+    return SimpleNamespace(
+        registry=CompetitorRegistry(competitors),
+        speech_precedence=PrecedenceEngine(RecencyOrder(NAMES), dict.fromkeys(NAMES, 0)),
+        question_precedence=PrecedenceEngine(RecencyOrder(NAMES), dict.fromkeys(NAMES, 0)),
+        side_tally=SideTally(), running_stats=RunningStats(), history=[],
+        current_side="Affirmative", current_round=0, current_resolution=RESOLUTION,
+        manual_reordering_speech_enabled=True, manual_reordering_question_enabled=True)
+
+
+def log_speech(session, name, duration=120):
+    """Log a speech the way CongressTracker.confirm_log_speech does"""
+    competitor = session.registry.get(name)
+    action = SpeechAction.capture(session, competitor)
+    side = "Aff" if session.current_side == "Affirmative" else "Neg"
+    old_count = competitor.speeches
+    competitor.current_side = side
+    competitor.resolution_sides[session.current_resolution] = side
+    competitor.add_speech_record(SpeechRecord(session.current_round, side, duration, 1, session.current_resolution))
+    session.side_tally.add(competitor.speech_records[-1])
+    session.running_stats.add(competitor, competitor.speech_records[-1])
+    session.speech_precedence.log(name, competitor.speeches)
+    session.history.append(HistoryItem('speech', name, 'speech_count', old_count, competitor.speeches, "09:00:00"))
+    session.current_side = "Negative" if session.current_side == "Affirmative" else "Affirmative"
+    session.current_round += 1
+    session.manual_reordering_speech_enabled = False
+    return action.finish(session, competitor)
+
+
+def log_question(session, name):
+    competitor = session.registry.get(name)
+    action = QuestionAction.capture(session, competitor)
+    old_count = competitor.questions
+    competitor.questions += 1
+    competitor.last_question_round = session.current_round
+    session.question_precedence.log(name, competitor.questions)
+    session.current_round += 1
+    session.history.append(HistoryItem('question', name, 'question_count', old_count, competitor.questions,
+                                       "09:00:00"))
+    session.manual_reordering_question_enabled = False
+    return action.finish(session, competitor)
+
+
+def move(session, name, direction):
+    session.speech_precedence.swap(name, direction)
+    return MoveAction('speech', name, direction)
+
+
+def state(session):
+    competitors = []
+    for name in NAMES:
+        c = session.registry.get(name)
+        index = {resolution: list(positions) for resolution, positions in c.speech_index.items()}
+        competitors.append((c.to_dict(), dict(c.resolution_sides), index))
+    return {
+        'competitors': competitors,
+        'speech': (session.speech_precedence.ordered(), session.speech_precedence.recency_order()),
+        'question': (session.question_precedence.ordered(), session.question_precedence.recency_order()),
+        'sides': session.side_tally.counts(RESOLUTION),
+        'stats': session.running_stats.resolution_rows(),
+        'speakers': set(session.running_stats.speakers(RESOLUTION)),
+        'history': [item.to_dict() for item in session.history],
+        'session': (session.current_side, session.current_round),
+    }
+
+
+def play(session, stack):
+    """Push a mixed run of actions, returning the state before each one and after the last"""
+    steps = [lambda: log_speech(session, "Jordan Patel"),
+             lambda: log_question(session, "Avery Chen"),
+             lambda: move(session, "Riley Nguyen", -1),
+             lambda: log_speech(session, "Riley Nguyen", 95),
+             lambda: log_question(session, "Avery Chen"),
+             lambda: log_speech(session, "Jordan Patel", 180)]
+    states = []
+    for step in steps:
+        states.append(state(session))
+        stack.push(step())
+    states.append(state(session))
+    return states
+
+
+def test_undo_and_redo_round_trip():
+    session = new_session()
+    stack = UndoStack()
+    states = play(session, stack)
+    for expected in reversed(states[:-1]):
+        stack.undo(session)
+        assert state(session) == expected
+    assert not stack.can_undo()
+    for expected in states[1:]:
+        stack.redo(session)
+        assert state(session) == expected
+    assert not stack.can_redo()
+
+
+def test_undo_restores_manual_reordering():
+    session = new_session()
+    stack = UndoStack()
+    stack.push(log_speech(session, "Avery Chen"))
+    stack.undo(session)
+    assert session.manual_reordering_speech_enabled
+    stack.redo(session)
+    assert not session.manual_reordering_speech_enabled
+
+
+def test_saved_stack_undoes_like_the_live_one():
+    session = new_session()
+    stack = UndoStack()
+    states = play(session, stack)
+    stack.undo(session)
+
+    saved = UndoStack.from_dict(stack.to_dict())
+    assert saved.to_dict() == stack.to_dict()
+    saved.redo(session)
+    assert state(session) == states[-1]
+    for expected in reversed(states[:-1]):
+        saved.undo(session)
+        assert state(session) == expected
+
+
+def test_stack_forgets_the_oldest_action():
+    session = new_session()
+    stack = UndoStack(limit=2)
+    for name in NAMES:
+        stack.push(log_question(session, name))
+    assert len(stack) == 2
+    stack.undo(session)
+    stack.undo(session)
+    assert not stack.can_undo()
+    assert [c.questions for c in map(session.registry.get, NAMES)] == [1, 0, 0]
+
+
+def test_stale_undo_changes_nothing():
+    session = new_session()
+    stack = UndoStack()
+    stack.push(log_speech(session, "Avery Chen"))
+    session.registry.get("Avery Chen").remove_speeches_from(0)
+    before = state(session)
+    with pytest.raises(UndoError):
+        stack.undo(session)
+    assert state(session) == before
+    assert stack.can_undo()
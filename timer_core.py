@@ -0,0 +1,120 @@
+import math
+import time
+from collections import namedtuple
+
+DriftReport = namedtuple('DriftReport', ['ticks', 'mean_ms', 'max_ms', 'total_ms', 'skipped_seconds'])
+
+
+class SpeechClock:
+    """Speech timer state on time.monotonic(), with no Qt in it.
+
+    Elapsed time is measured from a monotonic reference, never by counting
+    ticks, so a late tick only delays the display and can't make it drift.
+    next_wakeup_ms() gives the delay to the next whole second, and tick()
+    returns the time signals passed since the previous tick. Signals come
+    from a schedule built up front and each fires exactly once per run,
+    however late or early the ticks arrive. How late ticks land relative
+    to their second boundaries is recorded for drift_report().
+    """
+
+    def __init__(self, limit=180, signals=(), countdown=True, clock=time.monotonic):
+        self._clock = clock
+        self.limit = limit
+        self.countdown = countdown
+        self._signals = ()
+        self._schedule = []  # (elapsed second, remaining seconds), soonest first
+        self.reset()
+        self.configure(limit, signals, countdown)
+
+    def configure(self, limit, signals, countdown=True):
+        """Set the limit and signal points; signals already passed this run stay fired"""
+        self.limit = limit
+        self.countdown = countdown
+        self._signals = tuple(signals)
+        remaining = sorted({int(s) for s in self._signals if 0 <= int(s) < limit}, reverse=True)
+        self._schedule = [(limit - r, r) for r in remaining] if countdown else []
+        done = self.seconds() if self.started else -1
+        self._next_signal = 0
+        while self._next_signal < len(self._schedule) and self._schedule[self._next_signal][0] <= done:
+            self._next_signal += 1
+
+    def reset(self):
+        self._base = 0.0  # elapsed seconds banked before the current run
+        self._started = None  # monotonic time the current run began, None when stopped
+        self._target = None  # elapsed second the pending wakeup is aiming for
+        self._next_signal = 0
+        self._ticks = 0
+        self._late_total = 0.0
+        self._late_max = 0.0
+        self._skipped = 0
+
+    @property
+    def running(self):
+        return self._started is not None
+
+    @property
+    def started(self):
+        """True once the clock has run, including while paused"""
+        return self.running or self._base > 0
+
+    def start(self):
+        self.reset()
+        self._started = self._clock()
+
+    def pause(self):
+        if self.running:
+            self._base = self.elapsed()
+            self._started = None
+            self._target = None
+
+    def resume(self):
+        if not self.running:
+            self._started = self._clock()
+
+    def elapsed(self):
+        """Seconds run so far, excluding pauses"""
+        if self._started is None:
+            return self._base
+        return self._base + (self._clock() - self._started)
+
+    def seconds(self):
+        """Whole seconds run so far"""
+        return int(self.elapsed())
+
+    def display_seconds(self):
+        """What the display shows: seconds left in countdown mode, seconds run in stopwatch mode"""
+        if self.countdown:
+            return max(0, self.limit - self.seconds())
+        return self.seconds()
+
+    @property
+    def expired(self):
+        return self.countdown and self.seconds() >= self.limit
+
+    def next_wakeup_ms(self):
+        """Milliseconds until the next whole second of elapsed time"""
+        elapsed = self.elapsed()
+        self._target = math.floor(elapsed) + 1
+        return max(1, math.ceil((self._target - elapsed) * 1000))
+
+    def tick(self):
+        """Advance to now; returns the remaining-seconds values of signals that are now due"""
+        elapsed = self.elapsed()
+        second = int(elapsed)
+        if self._target is not None and second >= self._target:
+            late = elapsed - self._target
+            self._ticks += 1
+            self._late_total += late
+            self._late_max = max(self._late_max, late)
+            self._skipped += second - self._target  # Whole seconds the display never showed
+
+        due = []
+        while self._next_signal < len(self._schedule) and self._schedule[self._next_signal][0] <= second:
+            due.append(self._schedule[self._next_signal][1])
+            self._next_signal += 1
+        return due
+
+    def drift_report(self):
+        """How far behind their second boundaries ticks have landed this run"""
+        mean = self._late_total / self._ticks if self._ticks else 0.0
+        return DriftReport(self._ticks, mean * 1000, self._late_max * 1000, self._late_total * 1000, self._skipped)
@@ -0,0 +1,108 @@
+from PyQt6.QtCore import Qt, QRectF, QSize, QTimer
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+
+
+class TimerDisplay(QWidget):
+    """The speech timer readout, painted directly instead of styled with CSS.
+
+    Each state is a precomputed (background, text) colour pair, so a time
+    signal or a flash step is a state change plus one repaint of this widget;
+    no style sheet is parsed or polished along the way.
+    """
+    NORMAL = 'normal'
+    WARNING = 'warning'
+    EXPIRED = 'expired'
+
+    COLORS = {
+        NORMAL: (QColor("#2a2a2a"), QColor("white")),
+        WARNING: (QColor("#ff9800"), QColor("black")),
+        EXPIRED: (QColor("#ff0000"), QColor("black")),
+    }
+    WARNING_MS = 500  # how long a time signal stays highlighted
+    FLASH_MS = 500  # half-period of the flashing at zero
+
+    PADDING_X = 10
+    PADDING_Y = 4
+    RADIUS = 4
+    MIN_WIDTH = 80
+
+    def __init__(self, text="", parent=None):
+        super().__init__(parent)
+        self._text = text
+        self._state = self.NORMAL
+        self._flash_on = False
+        self._font = QFont(self.font())
+        self._font.setPixelSize(24)
+        self._font.setBold(True)
+        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+
+        self._warning_timer = QTimer(self)
+        self._warning_timer.setSingleShot(True)
+        self._warning_timer.setInterval(self.WARNING_MS)
+        self._warning_timer.timeout.connect(lambda: self.set_state(self.NORMAL))
+
+        self._flash_timer = QTimer(self)
+        self._flash_timer.setInterval(self.FLASH_MS)
+        self._flash_timer.timeout.connect(self._toggle_flash)
+
+    def text(self):
+        return self._text
+
+    def setText(self, text):
+        if text != self._text:
+            self._text = text
+            self.update()
+
+    def set_state(self, state):
+        if state != self._state:
+            self._state = state
+            self.update()
+
+    def show_warning(self):
+        """Highlight a time signal briefly; ignored while flashing at zero"""
+        if self.is_flashing():
+            return
+        self.set_state(self.WARNING)
+        self._warning_timer.start()
+
+    def start_flashing(self):
+        if not self.is_flashing():
+            self._warning_timer.stop()
+            self._flash_on = False
+            self._flash_timer.start()
+            self._toggle_flash()
+
+    def is_flashing(self):
+        return self._flash_timer.isActive()
+
+    def stop(self):
+        """Back to the normal look, with no warning or flash pending"""
+        self._warning_timer.stop()
+        self._flash_timer.stop()
+        self._flash_on = False
+        self.set_state(self.NORMAL)
+
+    def _toggle_flash(self):
+        self._flash_on = not self._flash_on
+        self.set_state(self.EXPIRED if self._flash_on else self.NORMAL)
+
+    def sizeHint(self):
+        metrics = QFontMetrics(self._font)
+        width = max(self.MIN_WIDTH, metrics.horizontalAdvance("00:00")) + 2 * self.PADDING_X
+        return QSize(width, metrics.height() + 2 * self.PADDING_Y)
+
+    def minimumSizeHint(self):
+        return self.sizeHint()
+
+    def paintEvent(self, event):
+        background, foreground = self.COLORS[self._state]
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(background)
+        painter.drawRoundedRect(QRectF(self.rect()), self.RADIUS, self.RADIUS)
+        painter.setPen(foreground)
+        painter.setFont(self._font)
+        painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self._text)
+        painter.end()
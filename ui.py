@@ -6,14 +6,29 @@ import traceback
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QLabel, QPushButton,
     QLineEdit, QMessageBox, QHBoxLayout, QComboBox, QCompleter,
-    QListWidget, QTabWidget, QListWidgetItem, QInputDialog, QFileDialog,
+    QListWidget, QListView, QTabWidget, QListWidgetItem, QInputDialog, QFileDialog,
     QGridLayout, QGroupBox, QSpinBox, QScrollArea, QFrame, QMenu, QTextEdit, QDialog
 )
-from PyQt6.QtCore import Qt, QPropertyAnimation, QPoint, QTimer, QSize, QModelIndex, QParallelAnimationGroup
+from PyQt6.QtCore import Qt, QPropertyAnimation, QPoint, QTimer, QSize, QModelIndex, QParallelAnimationGroup, QObject, pyqtSignal
 from PyQt6.QtGui import QColor, QPalette, QFont, QKeySequence, QShortcut, QAction
-from models import Competitor, HistoryItem
+from models import Competitor, CompetitorRegistry, HistoryItem
 import persistence
-from PyQt6.QtWidgets import QTabBar, QCheckBox, QStylePainter, QStyleOptionTab, QStyle, QSizePolicy, QTableWidget, QHeaderView, QTableWidgetItem
+import sqlite_store
+from precedence import PrecedenceEngine, RecencyOrder
+from precedence_view import PrecedenceListModel, PrecedenceItemDelegate
+from speech_index import SideTally
+from timer_core import SpeechClock
+from timer_view import TimerDisplay
+from startup_trace import StartupTrace
+from action_timing import ActionTimer
+from lag_monitor import LagMonitor
+from lag_view import FrameTimeOverlay
+from speech_stats import RunningStats
+from stats_view import StatsTableModel, StatsFilterProxy
+from history_store import HistoryLog, log_path as history_log_path, remove_history_files
+from history_view import HistoryListModel
+from undo import UndoStack, UndoError, SpeechAction, QuestionAction, MoveAction
+from PyQt6.QtWidgets import QTabBar, QCheckBox, QStylePainter, QStyleOptionTab, QStyle, QSizePolicy, QTableView, QHeaderView
 
 class ExpandingTabBar(QTabBar):
     def tabSizeHint(self, index):
@@ -39,24 +54,53 @@ class ExpandingTabBar(QTabBar):
             painter.drawControl(QStyle.ControlElement.CE_TabBarTabShape, option)
             painter.drawControl(QStyle.ControlElement.CE_TabBarTabLabel, option)
 
+class PersistenceErrorRelay(QObject):
+    """Carries save failures from the writer thread to the GUI thread"""
+    failed = pyqtSignal(str)
+
 class CongressTracker(QWidget):
+    RESIZE_REFLOW_MS = 16  # about one frame at 60 Hz
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        # Always reflow both lists
-        self.update_lists()
-        # Also refresh the tab bar sizing
+        # Dragging the window edge sends a burst of resize events; coalesce them
+        # into at most one reflow per frame. The list views re-lay out on their own
+        # and precedence only changes when data does, so nothing is rebuilt here.
+        timer = getattr(self, 'resize_reflow_timer', None)
+        if timer is not None and not timer.isActive():
+            timer.start()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        # Shown on the Status tab, which is built after the first paint
+        self.startup_trace.mark_first_paint()
+
+    def reflow_after_resize(self):
+        """Refresh the tab bar sizing after the window has been resized"""
         tb = self.tabs.tabBar()
         tb.updateGeometry()
         tb.update()
         self.tabs.updateGeometry()
 
-    def __init__(self):
+    def __init__(self, startup_trace=None):
         super().__init__()
-        self.load_config()
+        # Per-phase startup cost and time to first paint; main.py passes one in to include imports
+        self.startup_trace = startup_trace or StartupTrace()
+        trace = self.startup_trace
+        # Rolling per-action latency, shown on the Status tab
+        self.action_timer = ActionTimer()
+        with trace.phase("config"):
+            self.load_config()
+
+        self.resize_reflow_timer = QTimer(self)
+        self.resize_reflow_timer.setSingleShot(True)
+        self.resize_reflow_timer.setInterval(self.RESIZE_REFLOW_MS)
+        self.resize_reflow_timer.timeout.connect(self.reflow_after_resize)
 
 
         # Window settings
-        self.setup_fonts()
+        with trace.phase("fonts"):
+            self.setup_fonts()
         self.setWindowTitle("Congress Tracker")
         self.setGeometry(100, 100, 600, 400)
 
@@ -66,10 +110,21 @@ class CongressTracker(QWidget):
         self.pending_speech_competitor = None
         self.pending_question_competitor = None
         self.csv_file_path = None
+        self.journal = None
+        self.store = None
+        self.persistence_errors = PersistenceErrorRelay(self)
+        self.persistence_errors.failed.connect(self.on_persistence_error)
+        self.writer = persistence.PersistenceWriter(on_error=self.persistence_errors.failed.emit)
         self.current_round = 0
-        self.history = []
-        self.speech_recency_order = []
-        self.question_recency_order = []
+        self.history = HistoryLog()  # In memory until a session file exists
+        self.undo_stack = UndoStack()
+        self.speech_recency_order = RecencyOrder()
+        self.question_recency_order = RecencyOrder()
+        self.speech_precedence = PrecedenceEngine(self.speech_recency_order)
+        self.question_precedence = PrecedenceEngine(self.question_recency_order)
+        self.registry = CompetitorRegistry()
+        self.side_tally = SideTally()
+        self.running_stats = RunningStats()
 
         # Resolution system initialization
         self.current_resolution = ""
@@ -84,18 +139,24 @@ class CongressTracker(QWidget):
         self.resolution_header = None
 
         # Initialize UI
-        
-        self.init_ui()
-        self.apply_dark_mode()
-        self.setup_timer()
-
-        self.update_lists()
+        with trace.phase("ui"):
+            self.init_ui()
+        with trace.phase("style"):
+            self.apply_dark_mode()
+        with trace.phase("timer"):
+            self.setup_timer()
+        with trace.phase("lists"):
+            self.update_lists()
         self.setup_keyboard_shortcuts()
+        # Event-loop watchdog and frame-time overlay, off unless enabled in settings
+        self.lag_monitor = None
+        self.lag_overlay = None
+        self.set_lag_monitor(self.config.get('lag_monitor', False))
 
         # Initial updates
-        self.load_resolution_state_on_startup()
+        with trace.phase("resolution state"):
+            self.load_resolution_state_on_startup()
         self.update_status(loaded=False)
-        self.timer_checkbox.stateChanged.connect(self.on_timer_toggle)
 
         # Connect signals
         self.speech_log_button.clicked.connect(self.on_speech_log_button_clicked)
@@ -108,30 +169,25 @@ class CongressTracker(QWidget):
         self.question_list.doubleClicked.connect(self._on_question_index_double_clicked)
 
     def _on_speech_index_double_clicked(self, index: QModelIndex):
-        """Adapter from QListView's doubleClicked to your existing handler."""
+        """Adapter from QListView's doubleClicked to the speech input row."""
         # FIX #3: Only allow double-click after tracking has started
         if not self.tracking_started:
             return
-            
-        item = self.speech_list.item(index.row())
-        if item:
-            self.on_speech_list_double_clicked(item)
+
+        self.open_speech_input(index.data(Qt.ItemDataRole.UserRole))
 
     def _on_question_index_double_clicked(self, index: QModelIndex):
         # FIX #3: Only allow double-click after tracking has started
         if not self.tracking_started:
             return
-            
-        item = self.question_list.item(index.row())
-        if item:
-            self.on_question_list_double_clicked(item)
 
-    def on_speech_list_double_clicked(self, item):
+        self.open_question_input(index.data(Qt.ItemDataRole.UserRole))
+
+    def open_speech_input(self, name):
         # 1) Get competitor
-        name = item.data(Qt.ItemDataRole.UserRole) or item.text()
         if not name:
             return
-        comp = next((c for c in self.competitors if c.name == name), None)
+        comp = self.registry.get(name)
         if not comp:
             return
         self.pending_speech_competitor = comp
@@ -234,12 +290,11 @@ class CongressTracker(QWidget):
 
 
 
-    def on_question_list_double_clicked(self, item):
+    def open_question_input(self, name):
         # 1) Get competitor
-        name = item.data(Qt.ItemDataRole.UserRole) or item.text()
         if not name:
             return
-        comp = next((c for c in self.competitors if c.name == name), None)
+        comp = self.registry.get(name)
         if not comp:
             return
         self.pending_question_competitor = comp
@@ -371,7 +426,7 @@ class CongressTracker(QWidget):
                     self.set_current_resolution(text)
                     
                 self.resolution_input.clear()
-                self.save_to_csv()
+                self.record_action('resolution', **self.resolution_state())
                 self.update_resolution_combos()
             else:
                 QMessageBox.warning(self, "Duplicate", "This resolution already exists.")
@@ -392,44 +447,33 @@ class CongressTracker(QWidget):
         for c in self.competitors:
             if self.current_resolution in c.resolution_sides:
                 c.current_side = c.resolution_sides[self.current_resolution]
-            elif hasattr(c, 'notes') and 'speeches' in c.notes:
+            else:
                 # Determine side from speech history
-                resolution_speeches = [s for s in c.notes['speeches'] 
-                                    if isinstance(s, dict) and s.get('resolution') == self.current_resolution]
-                if resolution_speeches:
-                    c.current_side = resolution_speeches[-1].get('side', '')
+                last_speech = c.last_speech_for_resolution(self.current_resolution)
+                if last_speech:
+                    c.current_side = last_speech.side
                     c.resolution_sides[self.current_resolution] = c.current_side
                 else:
                     c.current_side = ""
-            else:
-                c.current_side = ""
-        
+
         self.set_current_resolution(self.current_resolution)
     
 
     def move_competitor(self, name, direction, list_type):
-        """Move competitor up (-1) or down (+1) in the given recency list, and update rank in model."""
-        order = self.speech_recency_order if list_type == 'speech' else self.question_recency_order
+        """Move competitor up (-1) or down (+1) in the given recency list; update_lists reassigns ranks."""
+        with self.action_timer.action('move_competitor'):
+            engine = self.speech_precedence if list_type == 'speech' else self.question_precedence
+            if name not in engine:
+                print(f"Competitor {name} not found in {list_type} list.")
+                return
 
-        try:
-            idx = order.index(name)
-            new_idx = idx + direction
-            if 0 <= new_idx < len(order):
-                order[idx], order[new_idx] = order[new_idx], order[idx]
-
-                # Update rank in each Competitor
-                for i, n in enumerate(order):
-                    comp = next((c for c in self.competitors if c.name == n), None)
-                    if comp:
-                        if list_type == 'speech':
-                            comp.speech_rank = i + 1
-                        else:
-                            comp.question_rank = i + 1
+            with self.action_timer.phase('precedence'):
+                moved = engine.swap(name, direction)
 
+            if moved:
                 self.update_lists()
-                self.save_to_csv()  # This will now save the recency orders too!
-        except ValueError:
-            print(f"Competitor {name} not found in {list_type} list.")
+                self.record_undoable(MoveAction(list_type, name, direction), 'move',
+                                     list=list_type, name=name, direction=direction)
 
 
     def remove_resolution(self):
@@ -479,7 +523,6 @@ class CongressTracker(QWidget):
                 
                 self.update_resolution_display()
                 self.update_lists()  # Update the lists to reflect cleared sides
-                self.save_to_csv()
                 self.update_resolution_combos()
 
     def determine_next_speaker_side(self, resolution):
@@ -487,67 +530,35 @@ class CongressTracker(QWidget):
         Determine which side should speak next for a given resolution.
         Returns "Affirmative" or "Negative"
         """
-        if not resolution:
-            # No specific resolution - count all speeches
-            total_aff = 0
-            total_neg = 0
-            
-            for c in self.competitors:
-                if hasattr(c, 'notes') and 'speeches' in c.notes:
-                    for speech in c.notes['speeches']:
-                        if isinstance(speech, dict):
-                            side = speech.get('side', '')
-                            if side == 'Aff':
-                                total_aff += 1
-                            elif side == 'Neg':
-                                total_neg += 1
-            
-            # If equal, Aff goes first; otherwise, the side with fewer speeches goes next
-            return "Affirmative" if total_aff <= total_neg else "Negative"
-        
-        else:
-            # Specific resolution - only count speeches for this resolution
-            aff_count = 0
-            neg_count = 0
-            
-            for c in self.competitors:
-                if hasattr(c, 'notes') and 'speeches' in c.notes:
-                    for speech in c.notes['speeches']:
-                        if isinstance(speech, dict) and speech.get('resolution') == resolution:
-                            side = speech.get('side', '')
-                            if side == 'Aff':
-                                aff_count += 1
-                            elif side == 'Neg':
-                                neg_count += 1
-            
-            # If equal, Aff goes first; otherwise, the side with fewer speeches goes next
-            return "Affirmative" if aff_count <= neg_count else "Negative"
+        # With no specific resolution the tally counts every speech
+        return self.side_tally.next_side(resolution)
 
     def update_resolution_display(self):
         """Update all resolution-related UI elements safely."""
-        # 1) Resolution label (Speech tab)
-        if hasattr(self, 'current_resolution_label') and self.current_resolution_label:
-            res_text = f"Resolution: {self.current_resolution}" if self.current_resolution else "Resolution: None"
-            self.current_resolution_label.setText(res_text)
-
-        # 2) Next speaker label (Speech tab)
-        if hasattr(self, 'next_speaker_label') and self.next_speaker_label:
-            side_abbrev = "Aff" if self.current_side == "Affirmative" else "Neg"
-            self.next_speaker_label.setText(f"Next Speaker: {side_abbrev}")
-
-        # 3) Side indicator (in the input container)
-        if hasattr(self, 'side_indicator') and self.side_indicator:
-            self.side_indicator.setText("Aff" if self.current_side == "Affirmative" else "Neg")
-
-        # 4) Question tab resolution label - FIX: Update question tab labels too
-        if hasattr(self, 'q_current_resolution_label') and self.q_current_resolution_label:
-            res_text = f"Resolution: {self.current_resolution}" if self.current_resolution else "Resolution: None"
-            self.q_current_resolution_label.setText(res_text)
+        with self.action_timer.phase('rendering'):
+            # 1) Resolution label (Speech tab)
+            if hasattr(self, 'current_resolution_label') and self.current_resolution_label:
+                res_text = f"Resolution: {self.current_resolution}" if self.current_resolution else "Resolution: None"
+                self.current_resolution_label.setText(res_text)
+
+            # 2) Next speaker label (Speech tab)
+            if hasattr(self, 'next_speaker_label') and self.next_speaker_label:
+                side_abbrev = "Aff" if self.current_side == "Affirmative" else "Neg"
+                self.next_speaker_label.setText(f"Next Speaker: {side_abbrev}")
+
+            # 3) Side indicator (in the input container)
+            if hasattr(self, 'side_indicator') and self.side_indicator:
+                self.side_indicator.setText("Aff" if self.current_side == "Affirmative" else "Neg")
+
+            # 4) Question tab resolution label - FIX: Update question tab labels too
+            if hasattr(self, 'q_current_resolution_label') and self.q_current_resolution_label:
+                res_text = f"Resolution: {self.current_resolution}" if self.current_resolution else "Resolution: None"
+                self.q_current_resolution_label.setText(res_text)
             
-        # 5) Question tab next speaker label - FIX: Update question tab next speaker
-        if hasattr(self, 'q_next_speaker_label') and self.q_next_speaker_label:
-            side_abbrev = "Aff" if self.current_side == "Affirmative" else "Neg"
-            self.q_next_speaker_label.setText(f"Next Speaker: {side_abbrev}")
+            # 5) Question tab next speaker label - FIX: Update question tab next speaker
+            if hasattr(self, 'q_next_speaker_label') and self.q_next_speaker_label:
+                side_abbrev = "Aff" if self.current_side == "Affirmative" else "Neg"
+                self.q_next_speaker_label.setText(f"Next Speaker: {side_abbrev}")
 
     def get_speech_duration(self):
         """Calculate speech duration from input fields"""
@@ -561,88 +572,104 @@ class CongressTracker(QWidget):
     def log_history(self, action_type, competitor_name, count_type, old_value, new_value):
         """Log an action to history"""
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        self.history.append(HistoryItem(
+        item = HistoryItem(
             action_type=action_type,
             competitor_name=competitor_name,
             count_type=count_type,
             old_value=old_value,
             new_value=new_value,
             timestamp=timestamp
-        ))
-        # Keep only last 15 items (5 speeches + 10 questions)
-        self.history = self.history[-15:]
+        )
+        if isinstance(self.history, sqlite_store.SQLiteHistory):
+            # Written by record_action in the same transaction as the action itself
+            self.history.append(item, commit=False)
+        else:
+            self.history.append(item)
         self.update_history_tab()
 
     def update_history_tab(self):
-        self.history_list.clear()
-        show_speeches = self.history_toggle.currentText() == "Show Speeches History"
-        
-        filtered_history = [h for h in self.history if 
-                        (show_speeches and h.action_type == 'speech') or
-                        (not show_speeches and h.action_type == 'question')]
-            
-        # Show last 5 speeches or last 10 questions
-        max_items = 5 if show_speeches else 10
-        for item in filtered_history[-max_items:]:
-            self.history_list.addItem(item.display_text())
+        if not hasattr(self, 'history_model'):
+            return
+        with self.action_timer.phase('rendering'):
+            kind = 'speech' if self.history_toggle.currentText() == "Show Speeches History" else 'question'
+            if self.history_model.source() != (self.history, kind):
+                self.history_model.set_source(self.history, kind)
+            else:
+                self.history_model.refresh()
+            self.history_list.scrollToBottom()
 
-    def restore_history_item(self, item):
+    def open_history(self, imported=()):
+        """History for the current file: its table in sqlite mode, otherwise the log beside the CSV.
+
+        imported seeds a history that doesn't exist yet, for sessions saved
+        before history was kept on disk.
+        """
+        self.history.close()
+        store = self.get_store()
+        if store is not None:
+            history = sqlite_store.SQLiteHistory(store, sqlite_store.session_key(self.csv_file_path))
+            new = not len(history)
+        else:
+            new = not os.path.exists(history_log_path(self.csv_file_path))
+            history = HistoryLog(self.csv_file_path)
+        if new and imported:
+            history.extend(imported)
+        return history
+
+    def record_undoable(self, action, op, **fields):
+        """Push an action onto the undo stack and persist it along with the change"""
+        self.undo_stack.push(action)
+        self.update_undo_buttons()
+        self.record_action(op, action=action.to_dict(), **fields)
+
+    def undo_last_action(self):
+        if self.undo_stack.can_undo():
+            self.step_undo_stack(self.undo_stack.undo)
+
+    def redo_last_action(self):
+        if self.undo_stack.can_redo():
+            self.step_undo_stack(self.undo_stack.redo)
+
+    def step_undo_stack(self, step, times=1):
         try:
-            text = item.text()
-            # Extract the competitor name from the history text
-            parts = text.split(": ")
-            if len(parts) < 2:
-                raise ValueError("Invalid history item format")
-            
-            timestamp = parts[0]
-            rest = parts[1]
-            
-            # Determine if this is a speech or question history item
-            if "gave speech" in rest:
-                action_type = 'speech'
-                name_part = rest.split(" gave speech")[0]
-            elif "asked question" in rest:
-                action_type = 'question'
-                name_part = rest.split(" asked question")[0]
-            else:
-                raise ValueError("Unknown action type in history")
-            
-            # Find the values to restore
-            values_part = rest.split("(was ")[1].split(")")[0]
-            old_value = int(values_part.split(", now ")[0])
-            
-            # Find the matching competitor
-            competitor = next((c for c in self.competitors if c.name == name_part), None)
-            if not competitor:
-                raise ValueError("Competitor not found")
-            
-            # Restore the values
-            if action_type == 'speech':
-                competitor.speeches = old_value
-                # Find the most recent speech round for this competitor
-                if old_value == 0:
-                    competitor.last_speech_round = 0
-                else:
-                    # This is a simplified approach - you might need more sophisticated logic
-                    # to properly restore the last_speech_round
-                    competitor.last_speech_round = self.current_round - 1
-            else:
-                competitor.questions = old_value
-                if old_value == 0:
-                    competitor.last_question_round = 0
-                else:
-                    competitor.last_question_round = self.current_round - 1
-            
-            # Update the UI and save
-            self.update_lists()
-            self.save_to_csv()
-            QMessageBox.information(self, "Restored", 
-                                f"Successfully restored {name_part}'s {action_type} count to {old_value}")
-            
-        except Exception as e:
-            print(f"Error restoring history item: {str(e)}")
-            QMessageBox.warning(self, "Error", 
-                            f"Could not restore this version. Error: {str(e)}")
+            for _ in range(times):
+                step(self)
+        except UndoError as e:
+            QMessageBox.warning(self, "Undo", str(e))
+        # Undo and redo are rare, so they persist with a full snapshot
+        self.after_session_change()
+        self.save_to_csv()
+
+    def after_session_change(self):
+        """Refresh everything that shows counts, sides or history"""
+        self.update_resolution_display()
+        self.update_lists()
+        self.update_history_tab()
+        self.update_stats_display()
+        self.update_undo_buttons()
+
+    def update_undo_buttons(self):
+        if hasattr(self, 'undo_button'):
+            self.undo_button.setEnabled(self.undo_stack.can_undo())
+            self.redo_button.setEnabled(self.undo_stack.can_redo())
+
+    def restore_history_item(self, index):
+        """Undo everything back to and including the double-clicked history entry"""
+        history_item = index.data(Qt.ItemDataRole.UserRole)
+        depth = self.undo_stack.depth_of(history_item) if history_item else 0
+        if not depth:
+            QMessageBox.information(self, "Undo", "This entry is too old to be undone.")
+            return
+        reply = QMessageBox.question(
+            self,
+            "Undo",
+            f"Undo the last {depth} action(s), back to and including this one?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            with self.action_timer.action('restore_history'):
+                self.step_undo_stack(self.undo_stack.undo, depth)
 
     def get_unique_file_path(self):
         base_dir = os.path.expanduser("~/Documents/CongressTracker")
@@ -664,12 +691,13 @@ class CongressTracker(QWidget):
 
 
     def setup_timer(self):
+        # One precise single shot per second boundary; the clock decides how long to wait
         self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.timer.timeout.connect(self.update_timer)
-        self.start_time = None
-        self.elapsed_seconds = 0
-        self.is_paused = False
-        self.pause_start_time = None
+        self.clock = SpeechClock(self.config['speech_time_limit'], self.config['time_signals'],
+                                 self.config['timer_mode'] == 'countdown')
 
         # Timer container exposed for resize detection
         self.timer_container = QWidget()
@@ -678,16 +706,7 @@ class CongressTracker(QWidget):
         timer_layout.setSpacing(8)
 
         # Timer display
-        self.timer_label = QLabel("03:00")
-        self.timer_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.timer_label.setStyleSheet("""
-            font-size: 24px;
-            font-weight: bold;
-            background: #2a2a2a;
-            padding: 4px 10px;
-            border-radius: 4px;
-            min-width: 80px;
-        """)
+        self.timer_label = TimerDisplay("03:00")
         timer_layout.addWidget(self.timer_label)
 
         # Button styling helper
@@ -733,55 +752,22 @@ class CongressTracker(QWidget):
         self.start_pause_button.clicked.connect(self.toggle_timer_state)
         self.reset_timer_button.clicked.connect(self.reset_timer)
 
-        # Timer flashing setup
-        self.flash_timer = QTimer(self)
-        self.flash_timer.timeout.connect(self.toggle_flash)
-        self.flash_state = False
-
         # Initial visibility setup
         self.update_timer_visibility()
 
 
     def toggle_timer_state(self):
         """Toggle between start, pause, and resume states"""
-        if not self.timer.isActive() and not self.is_paused:
+        if not self.clock.started:
             # Start the timer
             self.start_timer()
-        elif self.timer.isActive() and not self.is_paused:
+        elif self.clock.running:
             # Pause the timer
             self.pause_timer()
-        elif self.is_paused:
+        else:
             # Resume the timer
             self.resume_timer()
 
-    def toggle_flash(self):
-        """Toggle between red and normal background for 0-second flashing"""
-        self.flash_state = not self.flash_state
-        if self.flash_state:
-            self.timer_label.setStyleSheet("""
-                QLabel {
-                    font-size: 24px;
-                    font-weight: bold;
-                    qproperty-alignment: AlignCenter;
-                    padding: 2px 5px;
-                    background-color: #ff0000;
-                    border-radius: 3px;
-                    color: black;
-                }
-            """)
-        else:
-            self.timer_label.setStyleSheet("""
-                QLabel {
-                    font-size: 24px;
-                    font-weight: bold;
-                    qproperty-alignment: AlignCenter;
-                    padding: 2px 5px;
-                    background-color: #2a2a2a;
-                    border-radius: 3px;
-                    color: white;
-                }
-            """)
-
     def update_timer_visibility(self):
         """Update visibility based on current config"""
         visible = self.config.get('enable_timer', True)
@@ -789,14 +775,13 @@ class CongressTracker(QWidget):
         self.start_pause_button.setVisible(visible)
         self.reset_timer_button.setVisible(visible)
         # Update checkbox to match
-        self.timer_checkbox.setChecked(visible)
+        if hasattr(self, 'timer_checkbox'):
+            self.timer_checkbox.setChecked(visible)
     def start_timer(self):
         """Start the timer from the beginning"""
-        self.start_time = datetime.datetime.now()
-        self.elapsed_seconds = 0
-        self.is_paused = False
-        self.pause_start_time = None
-        self.timer.start(1000)
+        self.configure_clock()
+        self.clock.start()
+        self.timer.start(self.clock.next_wakeup_ms())
         self.start_pause_button.setText("⏸")  # Pause symbol
         self.start_pause_button.setStyleSheet("""
             QPushButton {
@@ -813,11 +798,11 @@ class CongressTracker(QWidget):
         """)
     def pause_timer(self):
         """Pause the timer"""
-        if self.timer.isActive():
+        if self.clock.running:
             self.timer.stop()
-            self.pause_start_time = datetime.datetime.now()
-            self.is_paused = True
-            self.flash_timer.stop()  # Stop flashing when paused
+            self.clock.pause()
+            self.show_timer_drift()
+            self.timer_label.stop()  # Stop flashing when paused
             self.start_pause_button.setText("▶")  # Play symbol
             self.start_pause_button.setStyleSheet("""
                 QPushButton {
@@ -834,14 +819,10 @@ class CongressTracker(QWidget):
             """)
     def resume_timer(self):
         """Resume the timer from where it was paused"""
-        if self.is_paused and self.pause_start_time:
-            # Calculate how long we were paused and adjust start time
-            pause_duration = datetime.datetime.now() - self.pause_start_time
-            self.start_time += pause_duration
-            
-            self.is_paused = False
-            self.pause_start_time = None
-            self.timer.start(1000)
+        if self.clock.started and not self.clock.running:
+            # The clock banks elapsed time across the pause itself
+            self.clock.resume()
+            self.timer.start(self.clock.next_wakeup_ms())
             self.start_pause_button.setText("⏸")  # Pause symbol
             self.start_pause_button.setStyleSheet("""
                 QPushButton {
@@ -860,11 +841,10 @@ class CongressTracker(QWidget):
     def reset_timer(self):
         """Reset the timer to initial state"""
         self.timer.stop()
-        self.flash_timer.stop()  # Stop flashing when timer is reset
-        self.start_time = None
-        self.elapsed_seconds = 0
-        self.is_paused = False
-        self.pause_start_time = None
+        self.timer_label.stop()  # Stop flashing when timer is reset
+        if self.clock.started:
+            self.show_timer_drift()
+        self.clock.reset()
         
         # Reset display
         if self.config['timer_mode'] == 'countdown':
@@ -889,86 +869,207 @@ class CongressTracker(QWidget):
             QPushButton:hover { background: #66bb6a; }
             QPushButton:pressed { background: #1b5e20; }
         """)
-        
-        # Reset to normal style
-        self.timer_label.setStyleSheet("""
-            QLabel {
-                font-size: 24px;
-                font-weight: bold;
-                qproperty-alignment: AlignCenter;
-                padding: 2px 5px;
-                background-color: #2a2a2a;
-                border-radius: 3px;
-                color: white;
-            }
-        """)
+
+    def configure_clock(self):
+        self.clock.configure(self.config['speech_time_limit'], self.config['time_signals'],
+                             self.config['timer_mode'] == 'countdown')
 
     def update_timer(self):
-        if self.start_time:
-            now = datetime.datetime.now()
-            elapsed = int((now - self.start_time).total_seconds())
-            
-            if self.config['timer_mode'] == 'countdown':
-                remaining = max(0, self.config['speech_time_limit'] - elapsed)
-                mins = remaining // 60
-                secs = remaining % 60
-                self.timer_label.setText(f"{mins:02}:{secs:02}")
-                
-                # Check for signals
-                if remaining in self.config['time_signals']:
-                    self.show_time_signal(remaining)
-                
-                # Handle 0 seconds separately - start flashing
-                if remaining == 0 and not self.flash_timer.isActive():
-                    self.flash_timer.start(500)  # Flash every 500ms
-            else:  # stopwatch mode
-                mins = elapsed // 60
-                secs = elapsed % 60
-                self.timer_label.setText(f"{mins:02}:{secs:02}")
+        if not self.clock.running:
+            return
+        # Each scheduled signal comes back from tick() exactly once, even after a stall
+        due = self.clock.tick()
+        mins, secs = divmod(self.clock.display_seconds(), 60)
+        self.timer_label.setText(f"{mins:02}:{secs:02}")
+
+        if due:
+            self.show_time_signal(due[-1])  # After a stall, only the latest one is worth showing
+
+        # Handle 0 seconds separately - start flashing
+        if self.clock.expired:
+            self.timer_label.start_flashing()
+
+        self.timer.start(self.clock.next_wakeup_ms())
+
+    def show_timer_drift(self):
+        """Summarize how late this run's ticks were, on the timer's tooltip"""
+        report = self.clock.drift_report()
+        self.timer_label.setToolTip(
+            f"Timer ticks: {report.ticks}, average {report.mean_ms:.1f} ms late, worst {report.max_ms:.1f} ms"
+            + (f", {report.skipped_seconds} s skipped" if report.skipped_seconds else ""))
 
     def show_time_signal(self, seconds_remaining):
-        # Visual flash effect - keep same font size and padding as normal state
-        self.timer_label.setStyleSheet("""
-            QLabel {
-                font-size: 24px;
-                font-weight: bold;
-                qproperty-alignment: AlignCenter;
-                padding: 2px 5px;
-                background-color: #ff9800;
-                border-radius: 3px;
-                color: black;
-            }
-        """)
-        QTimer.singleShot(500, lambda: self.timer_label.setStyleSheet("""
-            QLabel {
-                font-size: 24px;
-                font-weight: bold;
-                qproperty-alignment: AlignCenter;
-                padding: 2px 5px;
-                background-color: #2a2a2a;
-                border-radius: 3px;
-                color: white;
-            }
-        """))
+        self.timer_label.show_warning()
 
     def save_to_csv(self):
-        # Only save if we have competitors and a valid file path
-        if not self.competitors or not self.csv_file_path:
+        """Write a full snapshot (CSV plus sidecars); this also compacts the journal"""
+        with self.action_timer.phase('persistence'):
+            # Only save if we have competitors and a valid file path
+            if not self.competitors or not self.csv_file_path:
+                return
+
+            journal = self.get_journal()
+            database = self.database_path()
+            try:
+                # Copy the state now; the writer thread does the disk work
+                # History is already on disk (or in the database) entry by entry
+                snapshot = persistence.snapshot_session(
+                    self.competitors, 
+                    None,
+                    self.speech_recency_order,
+                    self.question_recency_order,
+                    self.resolution_list,  # Add resolutions
+                    self.current_resolution,  # Add current resolution
+                    self.current_side,  # Add current side
+                    journal_seq=journal.seq if journal else None,
+                    undo_state=self.undo_stack.to_dict()
+                )
+                if database is not None:
+                    self.writer.submit_store_snapshot(database, sqlite_store.session_key(self.csv_file_path),
+                                                      snapshot)
+                self.writer.submit_snapshot(self.csv_file_path, snapshot)
+                if journal:
+                    journal.truncate()
+            except Exception as e:
+                print(f"Error saving CSV: {e}")
+
+    def flush_saves(self):
+        """Wait for queued saves to reach the disk"""
+        self.writer.flush()
+
+    def on_persistence_error(self, message):
+        QMessageBox.warning(self, "Save Error", message)
+
+    def database_path(self):
+        """Path of the SQLite database for the current file's folder, or None outside sqlite mode"""
+        if self.config.get('persistence_mode', 'journal') != 'sqlite' or not self.csv_file_path:
+            return None
+        return sqlite_store.database_path(self.csv_file_path)
+
+    def get_store(self):
+        """SQLite database for the current file's folder, or None outside sqlite mode"""
+        path = self.database_path()
+        if path is None:
+            return None
+        # Session snapshots are written from the writer thread; let queued ones land first
+        self.flush_saves()
+        if self.store is None or self.store.path != path:
+            if self.store is not None:
+                self.store.close()
+            self.store = sqlite_store.SQLiteStore(path)
+        return self.store
+
+    def move_stored_session(self, old_path):
+        """Keep the database copy and the history of the session under the file's new name"""
+        if self.store is None:
+            self.history.move_to(self.csv_file_path)
             return
-            
+        self.flush_saves()
+        if self.store.path == sqlite_store.database_path(self.csv_file_path):
+            self.store.rename_session(sqlite_store.session_key(old_path), sqlite_store.session_key(self.csv_file_path))
+            self.history = self.open_history()
+        else:
+            # Moved to another folder, which has its own database
+            entries = list(self.history)
+            self.store.delete_session(sqlite_store.session_key(old_path))
+            self.history = self.open_history(entries)
+            self.save_to_csv()
+        self.update_history_tab()
+
+    def get_journal(self):
+        """Session journal for the current file, or None when journaling is off"""
+        if self.config.get('persistence_mode', 'journal') != 'journal' or not self.csv_file_path:
+            return None
+        if self.journal is None or self.journal.path != persistence.journal_path(self.csv_file_path):
+            # The new journal reads its file, so let queued writes land first
+            self.flush_saves()
+            self.journal = persistence.SessionJournal(self.csv_file_path, writer=self.writer)
+        return self.journal
+
+    def record_action(self, op, **fields):
+        """Persist one action: a journal append, a database transaction, or a full save in CSV mode"""
+        with self.action_timer.phase('persistence'):
+            if not self.competitors or not self.csv_file_path:
+                return
+            store = self.get_store()
+            if store is not None:
+                sqlite_history = isinstance(self.history, sqlite_store.SQLiteHistory)
+                pending = self.history.pending() if sqlite_history else []
+                try:
+                    store.apply_event(sqlite_store.session_key(self.csv_file_path), op,
+                                      history_items=[item.to_dict() for item in pending], **fields)
+                    if sqlite_history:
+                        self.history.mark_written()
+                except Exception as e:
+                    print(f"Error writing to database: {e}")
+                    if sqlite_history:
+                        try:
+                            self.history.commit_pending()
+                        except Exception as e:
+                            print(f"Error writing history to database: {e}")
+                    self.save_to_csv()
+                return
+            journal = self.get_journal()
+            if journal is None:
+                self.save_to_csv()
+                return
+            try:
+                journal.append(op, **fields)
+            except Exception as e:
+                print(f"Error writing journal: {e}")
+                self.save_to_csv()
+                return
+            if journal.needs_compaction():
+                self.save_to_csv()
+
+    def resolution_state(self):
+        """Resolution fields as stored in _resolutions.json and in journal entries"""
+        return {
+            'resolution_list': list(self.resolution_list),
+            'current_resolution': self.current_resolution,
+            'current_side': self.current_side,
+        }
+
+    def export_csv(self):
+        """Write the session as a standalone CSV bundle wherever the user chooses"""
+        if not self.competitors:
+            QMessageBox.information(self, "Export CSV", "There is no session data to export yet.")
+            return
+        default_dir = os.path.dirname(self.csv_file_path) if self.csv_file_path else os.path.expanduser("~/Documents/CongressTracker")
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export CSV File", default_dir, "CSV Files (*.csv)")
+        if not file_path:
+            return
+        if not file_path.lower().endswith('.csv'):
+            file_path += '.csv'
         try:
             persistence.save_to_csv(
-                self.csv_file_path, 
-                self.competitors, 
+                file_path,
+                self.competitors,
                 self.history,
                 self.speech_recency_order,
                 self.question_recency_order,
-                self.resolution_list,  # Add resolutions
-                self.current_resolution,  # Add current resolution
-                self.current_side  # Add current side
+                self.resolution_list,
+                self.current_resolution,
+                self.current_side
             )
+        except persistence.PersistenceError as e:
+            QMessageBox.warning(self, "Export Error", str(e))
         except Exception as e:
-            print(f"Error saving CSV: {e}")
+            QMessageBox.warning(self, "Export Error", f"Failed to export CSV file: {str(e)}")
+
+    def closeEvent(self, event):
+        self.set_lag_monitor(False)
+        # Fold any journaled actions into the CSV so the file on disk is complete
+        if self.journal is not None and self.journal.entries:
+            self.save_to_csv()
+        elif self.store is not None:
+            # The database is current; refresh the CSV export alongside it
+            self.save_to_csv()
+        self.writer.close()
+        self.history.close()
+        if self.store is not None:
+            self.store.close()
+        super().closeEvent(event)
 
     def clear_csv_data(self):
         reply = QMessageBox.question(
@@ -981,13 +1082,26 @@ class CongressTracker(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             self.competitors = []
             self.entered_names = []
-            self.history = []  # Clear history as well
+            self.history.clear()  # Clear history as well
+            self.history.close()
+            self.history = HistoryLog()
+            self.undo_stack.clear()
+            self.update_undo_buttons()
+            self.journal = None
+            self.rebuild_indexes()
+            self.flush_saves()  # Queued writes would otherwise recreate the files
             if self.csv_file_path and os.path.exists(self.csv_file_path):
-                persistence.clear_csv_data(self.csv_file_path)
-                # Also remove history file
+                try:
+                    persistence.clear_csv_data(self.csv_file_path)
+                except persistence.SessionClearError as e:
+                    QMessageBox.warning(self, "Clear Error", str(e))
+                if self.get_store() is not None:
+                    self.store.delete_session(sqlite_store.session_key(self.csv_file_path))
+                # Also remove history files
                 history_filepath = self.csv_file_path.replace('.csv', '_history.json')
                 if os.path.exists(history_filepath):
                     os.remove(history_filepath)
+                remove_history_files(self.csv_file_path)
             self.reset_ui_to_initial_state()
             self.update_lists()
             self.update_history_tab()  # Update history display
@@ -999,6 +1113,86 @@ class CongressTracker(QWidget):
             self.update_status(loaded=True, filepath=self.csv_file_path)
         else:
             self.update_status(loaded=False)
+        self.update_latency_display()
+        self.update_stall_display()
+
+    def update_latency_display(self):
+        """p50/p99 of each timed action; p99 turns red past the latency budget"""
+        if not hasattr(self, 'latency_label'):
+            return
+        rows = self.action_timer.rows()
+        if not rows:
+            self.latency_label.setText("No actions timed yet.")
+            return
+        html = ["<table cellspacing='6'><tr><th align='left'>Action</th><th>Runs</th><th>p50</th>"
+                "<th>p99</th><th>Max</th><th align='left'>Slowest phase (p99)</th></tr>"]
+        for row in rows:
+            phase, (_, phase_p99) = max(row.phases.items(), key=lambda item: item[1][1])
+            color = "#FF5555" if row.p99_ms > self.action_timer.budget_ms else "#55FF55"
+            html.append(f"<tr><td>{row.action.replace('_', ' ')}</td><td align='right'>{row.count}</td>"
+                        f"<td align='right'>{row.p50_ms:.1f} ms</td>"
+                        f"<td align='right' style='color: {color};'>{row.p99_ms:.1f} ms</td>"
+                        f"<td align='right'>{row.max_ms:.1f} ms</td><td>{phase} {phase_p99:.1f} ms</td></tr>")
+        html.append("</table>")
+        self.latency_label.setText("".join(html))
+        self.latency_label.setToolTip("\n".join(self.action_timer.report_lines()))
+
+    def set_lag_monitor(self, enabled):
+        """Start or stop the event-loop watchdog and its frame-time overlay"""
+        if enabled and self.lag_monitor is None:
+            self.lag_monitor = LagMonitor()
+            self.lag_heartbeat = QTimer(self)
+            self.lag_heartbeat.setTimerType(Qt.TimerType.PreciseTimer)
+            self.lag_heartbeat.setInterval(self.lag_monitor.interval_ms)
+            self.lag_heartbeat.timeout.connect(self.on_heartbeat)
+            self.lag_overlay = FrameTimeOverlay(self.lag_monitor, self)
+            self.lag_overlay.show()
+            self.lag_monitor.start()
+            self.lag_heartbeat.start()
+        elif not enabled and self.lag_monitor is not None:
+            self.lag_heartbeat.stop()
+            self.lag_monitor.stop()
+            self.lag_overlay.deleteLater()
+            self.lag_monitor = None
+            self.lag_overlay = None
+        self.update_stall_display()
+
+    def on_heartbeat(self):
+        stall = self.lag_monitor.beat()
+        if stall is not None:
+            # Kept in the monitor; the Status tab lists it with the stack of the handler that held the GUI thread
+            self.update_stall_display()
+        self.lag_overlay.update()
+
+    def update_stall_display(self):
+        """The most recent event-loop stalls and the handler each one was in"""
+        if not hasattr(self, 'stall_label'):
+            return
+        if self.lag_monitor is None:
+            self.stall_label.setText("Lag monitor is off. Enable the frame-time overlay in Settings.")
+            self.stall_label.setToolTip("")
+            return
+        stalls = list(self.lag_monitor.stalls)[-5:]
+        if not stalls:
+            self.stall_label.setText(f"No stalls over {self.lag_monitor.threshold_ms} ms.")
+            self.stall_label.setToolTip("")
+            return
+        self.stall_label.setText("\n".join(
+            f"{datetime.datetime.fromtimestamp(stall.when).strftime('%H:%M:%S')}  {stall.lag_ms:.0f} ms  {stall.handler}"
+            for stall in reversed(stalls)))
+        self.stall_label.setToolTip("\n\n".join(LagMonitor.report(stall) for stall in reversed(stalls)))
+
+    def export_latency(self):
+        default_dir = os.path.dirname(self.csv_file_path) if self.csv_file_path else os.path.expanduser("~/Documents/CongressTracker")
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Export Action Latency", os.path.join(default_dir, "latency.csv"),
+            "CSV Files (*.csv);;JSON Files (*.json)")
+        if not file_path:
+            return
+        try:
+            self.action_timer.export(file_path)
+        except OSError as e:
+            QMessageBox.warning(self, "Export Error", f"Failed to export latency: {str(e)}")
 
     def edit_file_path(self):
         if not self.csv_file_path:
@@ -1019,15 +1213,23 @@ class CongressTracker(QWidget):
                 if not os.path.exists(dir_path):
                     os.makedirs(dir_path)
                 
+                # Fold journaled actions into the CSV before it moves
+                self.save_to_csv()
+                self.flush_saves()
+
                 # Rename the file
+                old_path = self.csv_file_path
                 os.rename(self.csv_file_path, new_path)
                 self.csv_file_path = new_path
+                self.move_stored_session(old_path)
                 self.update_status(loaded=True, filepath=new_path)
                 QMessageBox.information(self, "Success", "File path updated successfully.")
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Could not update file path: {str(e)}")
 
     def update_status(self, loaded=False, filepath=None):
+        if not hasattr(self, 'status_indicator'):
+            return  # The Status tab reads the current file when it's first shown
         try:
             if loaded and filepath:
                 # Only try to get file stats if we have a valid path
@@ -1090,7 +1292,8 @@ class CongressTracker(QWidget):
         self.speech_name_input.setEnabled(False)
         self.question_log_button.setEnabled(False)
         self.question_name_input.setEnabled(False)
-        self.add_competitor_button.setEnabled(False)
+        if hasattr(self, 'add_competitor_button'):
+            self.add_competitor_button.setEnabled(False)
         self.clear_log_inputs()
 
     def set_current_resolution(self, resolution):
@@ -1113,7 +1316,7 @@ class CongressTracker(QWidget):
         
         # FIX: Make sure to update all resolution displays
         self.update_resolution_display()
-        self.save_to_csv()
+        self.record_action('resolution', **self.resolution_state())
 
     def eventFilter(self, obj, event):
         if event.type() == QEvent.Type.Resize and hasattr(self, 'timer_container'):
@@ -1140,6 +1343,7 @@ class CongressTracker(QWidget):
         # Initialize tabs with the custom expanding tab bar
         self.tabs = QTabWidget()
         self.tabs.setTabBar(ExpandingTabBar(self.tabs))
+        self.lazy_tabs = {}  # page -> builder, for tabs not built yet
         self.tabs.currentChanged.connect(self.on_tab_changed)
         self.layout.addWidget(self.tabs)
 
@@ -1213,7 +1417,7 @@ class CongressTracker(QWidget):
         speech_right_layout.addWidget(speech_header)
 
         # ---- Speech list ----
-        self.speech_list = QListWidget()
+        self.speech_list = self.make_precedence_view('speech')
         speech_right_layout.addWidget(self.speech_list)
 
         # ---- Speech input container (hidden by default) ----
@@ -1326,7 +1530,7 @@ class CongressTracker(QWidget):
         question_right_layout.addWidget(question_header)
 
         # Question list
-        self.question_list = QListWidget()
+        self.question_list = self.make_precedence_view('question')
         question_right_layout.addWidget(self.question_list)
 
         # Question input container
@@ -1367,7 +1571,38 @@ class CongressTracker(QWidget):
 
 
 
-        # ===== SETTINGS TAB =====
+        # The remaining tabs are built the first time they're shown
+        self.settings_tab = self.add_lazy_tab("Settings", self.build_settings_tab)
+        self.history_tab = self.add_lazy_tab("History", self.build_history_tab)
+        self.status_tab = self.add_lazy_tab("● Status", self.build_status_tab)
+        self.stats_tab = self.add_lazy_tab("Statistics", self.build_stats_tab)
+        self.credits_tab = self.add_lazy_tab("Credits", self.build_credits_tab)
+
+        # Set up context menus
+        for list_widget in [self.speech_list, self.question_list]:
+            list_widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+            list_widget.customContextMenuRequested.connect(self.show_context_menu)
+
+        # Styling, status and resolution state are applied once, by __init__
+        self.setLayout(self.layout)
+        self.update_resolution_display()
+        self.update_tab_indicators()
+
+    def add_lazy_tab(self, title, builder):
+        """Add an empty page that builder fills in the first time it's shown"""
+        page = QWidget()
+        self.lazy_tabs[page] = builder
+        self.tabs.addTab(page, title)
+        return page
+
+    def ensure_tab(self, page):
+        """Build a lazy tab now if it hasn't been yet"""
+        builder = self.lazy_tabs.pop(page, None)
+        if builder is not None:
+            with self.startup_trace.phase(f"{self.tabs.tabText(self.tabs.indexOf(page))} tab"):
+                builder()
+
+    def build_settings_tab(self):
         settings_scroll = QScrollArea()
         settings_scroll.setWidgetResizable(True)
         settings_scroll.setFrameShape(QFrame.Shape.NoFrame)
@@ -1509,7 +1744,7 @@ class CongressTracker(QWidget):
         self.timer_group.setVisible(False)
         self.manage_layout.addWidget(self.timer_group)
 
-# Accessibility settings toggle
+        # Accessibility settings toggle
         self.accessibility_toggle = QPushButton("▼ Accessibility Settings")
         self.accessibility_toggle.setCheckable(True)
         self.accessibility_toggle.setChecked(False)
@@ -1549,6 +1784,11 @@ Keyboard Shortcuts:
         self.large_text_checkbox.setChecked(self.config.get('large_text', False))
         accessibility_layout.addWidget(self.large_text_checkbox)
 
+        # Lag monitor checkbox
+        self.lag_monitor_checkbox = QCheckBox("Show Frame-Time Overlay (logs event-loop stalls)")
+        self.lag_monitor_checkbox.setChecked(self.config.get('lag_monitor', False))
+        accessibility_layout.addWidget(self.lag_monitor_checkbox)
+
         # Save accessibility settings button
         save_accessibility_btn = QPushButton("Save Accessibility Settings")
         save_accessibility_btn.clicked.connect(self.save_accessibility_settings)
@@ -1559,10 +1799,20 @@ Keyboard Shortcuts:
         self.manage_layout.addWidget(self.accessibility_group)
 
         settings_scroll.setWidget(settings_container)
-        self.tabs.addTab(settings_scroll, "Settings")
+        page_layout = QVBoxLayout(self.settings_tab)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        page_layout.addWidget(settings_scroll)
 
-        # ===== HISTORY TAB =====
-        self.history_tab = QWidget()
+        self.manage_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.manage_list.customContextMenuRequested.connect(self.show_context_menu)
+
+        # Catch up with whatever happened before the tab was first shown
+        self.fill_manage_list()
+        self.add_competitor_button.setEnabled(self.tracking_started)
+        self.resolution_list_widget.addItems(self.resolution_list)
+        self.resolution_settings_label.setText(f"Current: {self.current_resolution or 'None'}")
+
+    def build_history_tab(self):
         history_layout = QVBoxLayout(self.history_tab)
         
         self.history_toggle = QComboBox()
@@ -1570,14 +1820,28 @@ Keyboard Shortcuts:
         self.history_toggle.currentIndexChanged.connect(self.update_history_tab)
         history_layout.addWidget(self.history_toggle)
         
-        self.history_list = QListWidget()
-        self.history_list.itemDoubleClicked.connect(self.restore_history_item)
+        # A virtualized view over the full history; rows are read from disk as they scroll into view
+        self.history_list = QListView()
+        self.history_list.setUniformItemSizes(True)
+        self.history_model = HistoryListModel(self.history, 'speech', self)
+        self.history_list.setModel(self.history_model)
+        self.history_list.doubleClicked.connect(self.restore_history_item)
         history_layout.addWidget(self.history_list)
-        
-        self.tabs.addTab(self.history_tab, "History")
 
-        # ===== STATUS TAB =====
-        self.status_tab = QWidget()
+        undo_layout = QHBoxLayout()
+        self.undo_button = QPushButton("↶ Undo")
+        self.undo_button.setToolTip("Undo the last speech, question or move (Ctrl+Z)")
+        self.undo_button.clicked.connect(self.undo_last_action)
+        undo_layout.addWidget(self.undo_button)
+        self.redo_button = QPushButton("↷ Redo")
+        self.redo_button.setToolTip("Redo the last undone action (Ctrl+Shift+Z)")
+        self.redo_button.clicked.connect(self.redo_last_action)
+        undo_layout.addWidget(self.redo_button)
+        history_layout.addLayout(undo_layout)
+        self.update_undo_buttons()
+        self.update_history_tab()
+
+    def build_status_tab(self):
         self.status_layout = QVBoxLayout(self.status_tab)
         self.status_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
 
@@ -1636,6 +1900,13 @@ Keyboard Shortcuts:
         self.stats_label.setWordWrap(True)
         grid.addWidget(self.stats_label, 3, 0, 1, 2)
 
+        # How long the window took to come up, with the cost of each step on hover
+        trace = self.startup_trace
+        paint = "N/A" if trace.first_paint is None else f"{trace.first_paint * 1000:.0f} ms"
+        self.startup_label = QLabel(f"<b>Time to First Paint:</b> {paint}")
+        self.startup_label.setToolTip("\n".join(trace.report_lines()))
+        grid.addWidget(self.startup_label, 4, 0, 1, 2)
+
         self.status_layout.addLayout(grid)
 
         # Buttons
@@ -1648,48 +1919,78 @@ Keyboard Shortcuts:
         self.open_folder_button.clicked.connect(self.open_data_folder)
         button_layout.addWidget(self.open_folder_button)
 
+        self.export_csv_button = QPushButton("💾 Export CSV")
+        self.export_csv_button.clicked.connect(self.export_csv)
+        button_layout.addWidget(self.export_csv_button)
+
         self.status_layout.addLayout(button_layout)
-        self.tabs.addTab(self.status_tab, "● Status")
 
-        # ===== STATISTICS TAB =====
-        self.stats_tab = QWidget()
+        # Action latency
+        latency_title = QLabel("Action Latency")
+        latency_title.setStyleSheet("font-size: 14px; font-weight: bold; margin-top: 10px;")
+        self.status_layout.addWidget(latency_title)
+        self.latency_label = QLabel()
+        self.latency_label.setTextFormat(Qt.TextFormat.RichText)
+        self.latency_label.setWordWrap(True)
+        self.status_layout.addWidget(self.latency_label)
+        self.export_latency_button = QPushButton("📈 Export Latency")
+        self.export_latency_button.clicked.connect(self.export_latency)
+        self.status_layout.addWidget(self.export_latency_button)
+
+        # Event-loop stalls caught by the lag monitor
+        stall_title = QLabel("Event Loop Stalls")
+        stall_title.setStyleSheet("font-size: 14px; font-weight: bold; margin-top: 10px;")
+        self.status_layout.addWidget(stall_title)
+        self.stall_label = QLabel()
+        self.stall_label.setWordWrap(True)
+        self.status_layout.addWidget(self.stall_label)
+        self.refresh_status()
+
+    def build_stats_tab(self):
         stats_layout = QVBoxLayout(self.stats_tab)
         
         # Create resolution combo
         self.stats_resolution_combo = QComboBox()
+        self.stats_resolution_combo.currentTextChanged.connect(self.update_stats_display)
         stats_layout.addWidget(QLabel("Select Resolution:"))
         stats_layout.addWidget(self.stats_resolution_combo)
         
-        self.stats_table = QTableWidget()
-        self.stats_table.setColumnCount(4)
-        self.stats_table.setHorizontalHeaderLabels(["Name", "Side", "Speech Count", "Avg. Time"])
+        self.stats_empty_label = QLabel("No statistics available. Please log speeches to view statistics.")
+        self.stats_empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        stats_layout.addWidget(self.stats_empty_label)
+
+        # The model reads the running stats; the proxy hides non-speakers and sorts
+        self.stats_model = StatsTableModel(self.running_stats, self)
+        self.stats_proxy = StatsFilterProxy(self)
+        self.stats_proxy.setSourceModel(self.stats_model)
+        self.stats_table = QTableView()
+        self.stats_table.setModel(self.stats_proxy)
+        self.stats_table.verticalHeader().setVisible(False)
+        self.stats_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.stats_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        # No sort column until a header is clicked, so rows start in roster order
+        self.stats_table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.stats_table.setSortingEnabled(True)
         stats_layout.addWidget(self.stats_table)
-        
-        self.tabs.addTab(self.stats_tab, "Statistics")
 
-        # ===== CREDITS TAB =====
-        self.credits_tab = QWidget()
+    def build_credits_tab(self):
         credits_layout = QVBoxLayout(self.credits_tab)
         credits_label = QLabel("Credits:\n\nDeveloped by mrogenmoser\n\nCourtesy of PHS Debate")
         credits_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         credits_label.setStyleSheet("font-size: 16pt;")
         credits_layout.addWidget(credits_label)
-        self.tabs.addTab(self.credits_tab, "Credits")
-
-        # Set up context menus
-        for list_widget in [self.speech_list, self.question_list, self.manage_list]:
-            list_widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-            list_widget.customContextMenuRequested.connect(self.show_context_menu)
-
-        self.setLayout(self.layout)
-        self.apply_dark_mode()
-        self.update_status(loaded=False)
-        self.update_resolution_display()
-        self.load_resolution_state_on_startup()
-        self.tabs.currentChanged.connect(self.on_tab_changed)
-        self.update_tab_indicators()
 
+    def make_precedence_view(self, list_type):
+        """Speech/question list: a model over the precedence order plus a painting delegate"""
+        view = QListView()
+        view.setUniformItemSizes(True)
+        view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        model = PrecedenceListModel(list_type, lambda name: self.registry.get(name), view)
+        delegate = PrecedenceItemDelegate(view)
+        delegate.moveRequested.connect(lambda name, direction: self.move_competitor(name, direction, list_type))
+        view.setModel(model)
+        view.setItemDelegate(delegate)
+        return view
 
     def toggle_timer_settings(self):
         visible = not self.timer_group.isVisible()
@@ -1697,96 +1998,28 @@ Keyboard Shortcuts:
         self.timer_toggle.setText("▲ Timer Settings" if visible else "▼ Timer Settings")
 
     def update_stats_display(self):
-        # Clear previous content
-        self.stats_table.setRowCount(0)
-        
-        # Add "All" option to resolutions
-        all_resolutions = ["All"] + self.resolution_list
-        current_resolution = self.stats_resolution_combo.currentText()
-        self.stats_resolution_combo.clear()
-        self.stats_resolution_combo.addItems(all_resolutions)
-        
-        # Restore selection if possible
-        if current_resolution in all_resolutions:
-            self.stats_resolution_combo.setCurrentText(current_resolution)
-        else:
-            self.stats_resolution_combo.setCurrentText("All")
-        
-        resolution = self.stats_resolution_combo.currentText()
-        
-        # Check if we have any speech data
-        has_data = False
-        for competitor in self.competitors:
-            res_speeches = self._get_speeches_for_resolution(competitor, resolution)
-            if res_speeches:
-                has_data = True
-                break
-        
-        if not has_data:
-            # Show "no data" message
-            self.stats_table.setRowCount(1)
-            self.stats_table.setColumnCount(1)
-            self.stats_table.setItem(0, 0, QTableWidgetItem("No statistics available. Please log speeches to view statistics."))
-            self.stats_table.setSpan(0, 0, 1, 4)  # Merge cells for the message
-            return
-        
-        # Restore column count if it was changed
-        self.stats_table.setColumnCount(4)
-        self.stats_table.setHorizontalHeaderLabels(["Name", "Side", "Speech Count", "Avg. Time"])
-        
-        # Populate statistics
-        for competitor in self.competitors:
-            res_speeches = self._get_speeches_for_resolution(competitor, resolution)
-            if res_speeches:
-                row = self.stats_table.rowCount()
-                self.stats_table.insertRow(row)
-                
-                timed_speeches = [s for s in res_speeches if s.get('duration', 0) > 0]
-
-                total_time = sum(s['duration'] for s in timed_speeches)
-                speech_count = len([s for s in res_speeches if s.get('duration', 0) >= 0])
-
-                if speech_count > 0:
-                    avg_seconds = total_time // speech_count
-                    mins, secs = divmod(avg_seconds, 60)
-                    time_str = f"{mins}:{secs:02d}"
-                else:
-                    time_str = "n/a"
-                
-                # Get side (use the most common side if multiple)
-                sides = [s.get('side', '') for s in res_speeches]
-                side = max(set(sides), key=sides.count) if sides else ""
-                
-                self.stats_table.setItem(row, 0, QTableWidgetItem(competitor.name))
-                self.stats_table.setItem(row, 1, QTableWidgetItem(side))
-                self.stats_table.setItem(row, 2, QTableWidgetItem(str(speech_count)))
-                self.stats_table.setItem(row, 3, QTableWidgetItem(time_str))
-
-    def _get_speeches_for_resolution(self, competitor, resolution):
-        """Get speeches for a competitor filtered by resolution"""
-        # Make sure we have the speeches list
-        if not hasattr(competitor, 'notes') or 'speeches' not in competitor.notes:
-            return []
-        
-        speeches = competitor.notes['speeches']
-        
-        # Filter for specific resolution if not "All"
-        if resolution != "All":
-            return [s for s in speeches if isinstance(s, dict) and s.get('resolution') == resolution]
-        return speeches
+        """Bring the Statistics table up to date if it's on screen; only changed rows are redrawn"""
+        if not hasattr(self, 'stats_tab') or self.tabs.currentWidget() is not self.stats_tab:
+            return  # Drawn when the tab is next shown
+
+        with self.action_timer.phase('stats'):
+            self.fill_stats_resolution_combo()
+            resolution = self.stats_resolution_combo.currentText()
+            resolution = None if resolution == "All" else resolution
+            self.stats_model.set_resolution(resolution)
+            self.stats_model.sync(self.competitors)
+            empty = not self.running_stats.speakers(resolution)
+            self.stats_empty_label.setVisible(empty)
+            self.stats_table.setVisible(not empty)
 
     def show_context_menu(self, position):
         sender = self.sender()
-        item = sender.itemAt(position)
-        if not item:
-            return
-
-        # Skip separators (they have no selectable/enabled flags)
-        if not (item.flags() & (Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)):
+        index = sender.indexAt(position)
+        if not index.isValid():
             return
 
         # Pull the competitor name from UserRole
-        name = item.data(Qt.ItemDataRole.UserRole)
+        name = index.data(Qt.ItemDataRole.UserRole)
         if not name:
             return
 
@@ -1800,13 +2033,27 @@ Keyboard Shortcuts:
         if action == notes_action:
             self.show_notes_dialog(competitor)
 
+    def fill_stats_resolution_combo(self):
+        """"All" plus the resolution list, refilled only when the list differs and without redrawing"""
+        all_resolutions = ["All"] + self.resolution_list
+        current_resolution = self.stats_resolution_combo.currentText()
+        if [self.stats_resolution_combo.itemText(i) for i in range(self.stats_resolution_combo.count())] != all_resolutions:
+            self.stats_resolution_combo.blockSignals(True)
+            self.stats_resolution_combo.clear()
+            self.stats_resolution_combo.addItems(all_resolutions)
+            # Restore selection if possible
+            if current_resolution in all_resolutions:
+                self.stats_resolution_combo.setCurrentText(current_resolution)
+            else:
+                self.stats_resolution_combo.setCurrentText("All")
+            self.stats_resolution_combo.blockSignals(False)
+
     def update_resolution_combos(self):
         """Update all resolution combo boxes in the app"""
-        # Update statistics tab
-        self.stats_resolution_combo.clear()
-        self.stats_resolution_combo.addItems(self.resolution_list)
-        if self.current_resolution:
-            self.stats_resolution_combo.setCurrentText(self.current_resolution)
+        # Update statistics tab; the table itself is redrawn when next shown
+        if not hasattr(self, 'stats_resolution_combo'):
+            return
+        self.fill_stats_resolution_combo()
 
     def show_notes_dialog(self, competitor):
         dialog = QDialog(self)
@@ -1877,9 +2124,15 @@ Keyboard Shortcuts:
                 # First delete the old file if it exists
                 if os.path.exists(new_path):
                     os.remove(new_path)
+
+                # Fold journaled actions into the CSV before it moves
+                self.save_to_csv()
+                self.flush_saves()
                     
+                old_path = self.csv_file_path
                 os.rename(self.csv_file_path, new_path)
                 self.csv_file_path = new_path
+                self.move_stored_session(old_path)
                 self.update_status(loaded=True, filepath=new_path)
                 QMessageBox.information(self, "Success", "File renamed successfully")
                 
@@ -1910,69 +2163,64 @@ Keyboard Shortcuts:
     def next_resolution(self):
         """Handle next resolution logic based on current state"""
         
-        if not self.resolution_list:
-            # No resolutions added - reset to Affirmative and clear all current sides
-            self.current_side = "Affirmative"
-            # Clear all current sides since there's no resolution
-            for c in self.competitors:
-                c.current_side = ""
-            self.update_resolution_display()
-            self.update_lists()  # Refresh to show cleared sides
-            return
-        
-        if len(self.resolution_list) == 1:
-            # Only one resolution - reset to Affirmative (don't allow switching to None)
-            self.current_side = "Affirmative"
-            self.update_resolution_display()
-            return
+        with self.action_timer.action('next_resolution'):
+            if not self.resolution_list:
+                # No resolutions added - reset to Affirmative and clear all current sides
+                self.current_side = "Affirmative"
+                # Clear all current sides since there's no resolution
+                for c in self.competitors:
+                    c.current_side = ""
+                self.update_resolution_display()
+                self.update_lists()  # Refresh to show cleared sides
+                return
         
-        # Multiple resolutions - cycle through them
-        try:
-            current_idx = self.resolution_list.index(self.current_resolution)
-            next_idx = (current_idx + 1) % len(self.resolution_list)
-        except ValueError:
-            # Current resolution not in list, start from beginning
-            next_idx = 0
+            if len(self.resolution_list) == 1:
+                # Only one resolution - reset to Affirmative (don't allow switching to None)
+                self.current_side = "Affirmative"
+                self.update_resolution_display()
+                return
         
-        # Save current sides for the current resolution before switching
-        if self.current_resolution:
-            for c in self.competitors:
-                if c.current_side:
-                    c.resolution_sides[self.current_resolution] = c.current_side
+            # Multiple resolutions - cycle through them
+            try:
+                current_idx = self.resolution_list.index(self.current_resolution)
+                next_idx = (current_idx + 1) % len(self.resolution_list)
+            except ValueError:
+                # Current resolution not in list, start from beginning
+                next_idx = 0
+        
+            # Save current sides for the current resolution before switching
+            if self.current_resolution:
+                for c in self.competitors:
+                    if c.current_side:
+                        c.resolution_sides[self.current_resolution] = c.current_side
         
-        # Switch to next resolution
-        self.current_resolution = self.resolution_list[next_idx]
+            # Switch to next resolution
+            self.current_resolution = self.resolution_list[next_idx]
         
-        # Always reset to Affirmative when switching resolutions
-        self.current_side = "Affirmative"
+            # Always reset to Affirmative when switching resolutions
+            self.current_side = "Affirmative"
         
-        # Load or clear sides for the new resolution
-        for c in self.competitors:
-            if self.current_resolution in c.resolution_sides:
-                # Restore saved side for this resolution
-                c.current_side = c.resolution_sides[self.current_resolution]
-            else:
-                # Check speech history to determine side
-                if hasattr(c, 'notes') and 'speeches' in c.notes:
-                    resolution_speeches = [s for s in c.notes['speeches'] 
-                                        if isinstance(s, dict) and s.get('resolution') == self.current_resolution]
-                    if resolution_speeches:
+            # Load or clear sides for the new resolution
+            for c in self.competitors:
+                if self.current_resolution in c.resolution_sides:
+                    # Restore saved side for this resolution
+                    c.current_side = c.resolution_sides[self.current_resolution]
+                else:
+                    # Check speech history to determine side
+                    last_speech = c.last_speech_for_resolution(self.current_resolution)
+                    if last_speech:
                         # Use the most recent side they spoke on for this resolution
-                        c.current_side = resolution_speeches[-1].get('side', '')
+                        c.current_side = last_speech.side
                         # Save this side for future reference
                         c.resolution_sides[self.current_resolution] = c.current_side
                     else:
                         # Clear side for new resolution (they haven't spoken on it yet)
                         c.current_side = ""
-                else:
-                    # Clear side for new resolution
-                    c.current_side = ""
         
-        # Update UI
-        self.set_current_resolution(self.current_resolution)
-        self.update_resolution_display()
-        self.update_lists()
-        self.save_to_csv()
+            # Update UI
+            self.set_current_resolution(self.current_resolution)  # also persists the switch
+            self.update_resolution_display()
+            self.update_lists()
 
     def save_notes(self, competitor, dialog):
         # Save current notes before closing
@@ -1984,7 +2232,7 @@ Keyboard Shortcuts:
             category = f'speech_{num}'
         
         competitor.notes[category] = self.notes_edit.toPlainText()
-        self.save_to_csv()
+        self.record_action('notes', name=competitor.name, category=category, text=competitor.notes[category])
         dialog.close()
 
 
@@ -2018,6 +2266,10 @@ Keyboard Shortcuts:
 
 
     def open_data_folder(self):
+        # Make sure the CSV in the folder includes journaled actions
+        if self.journal is not None and self.journal.entries:
+            self.save_to_csv()
+        self.flush_saves()
         if self.csv_file_path and os.path.exists(self.csv_file_path):
             folder = os.path.dirname(self.csv_file_path)
             os.startfile(folder) if os.name == 'nt' else os.system(f'open "{folder}"' if sys.platform == 'darwin' else f'xdg-open "{folder}"')
@@ -2034,6 +2286,7 @@ Keyboard Shortcuts:
             [int(x.strip()) for x in self.time_signals_edit.text().split(",") if x.strip()],
             reverse=True
         )
+        self.configure_clock()  # A running timer keeps the signals it has already given
         self.save_config()
         QMessageBox.information(self, "Settings Saved", "Timer settings have been updated.")
 
@@ -2076,17 +2329,17 @@ color: #BBBBBB;
 }
 
         /* Lists & Inputs */
-        QListWidget, QLineEdit, QComboBox, QTextEdit {
+        QListWidget, QListView, QLineEdit, QComboBox, QTextEdit {
         background: #3A3A3A;
 border: 1px solid #444;
         padding: 4px; font-size: 13px;
         }
-        QListWidget {
+        QListWidget, QListView {
         border-radius: 4px;
 }
-        QListWidget::item:hover    { background: #444;
+        QListWidget::item:hover, QListView::item:hover    { background: #444;
 }
-        QListWidget::item:selected { background: #444}
+        QListWidget::item:selected, QListView::item:selected { background: #444}
         
 
         """
@@ -2115,7 +2368,9 @@ border: 1px solid #444;
             'timer_mode': 'countdown',  # or 'stopwatch'
             'enable_shortcuts': True,
             'high_contrast': False,
-            'large_text': False
+            'large_text': False,
+            'lag_monitor': False,  # Heartbeat watchdog with a frame-time overlay
+            'persistence_mode': 'journal'  # 'csv' rewrites the full CSV on every action, 'sqlite' keeps sessions in a database
         }
 
         # Set up config directory
@@ -2173,70 +2428,95 @@ border: 1px solid #444;
             "CSV Files (*.csv)"
         )
         if file_path:
-            try:
-                self.csv_file_path = file_path
-                # Updated to receive resolutions
-                loaded_competitors, loaded_history, speech_recency, question_recency, resolution_list, current_resolution, current_side = persistence.load_from_csv(self.csv_file_path)
+            with self.action_timer.action('load_session'):
+                self.flush_saves()
+                try:
+                    self.csv_file_path = file_path
+                    # Updated to receive resolutions
+                    # In sqlite mode the database copy is at least as new as the CSV export
+                    store = self.get_store()
+                    key = sqlite_store.session_key(self.csv_file_path)
+                    from_store = store is not None and store.has_session(key)
+                    if from_store:
+                        loaded_competitors, loaded_history, speech_recency, question_recency, resolution_list, current_resolution, current_side = store.load_session(key)
+                    else:
+                        loaded_competitors, loaded_history, speech_recency, question_recency, resolution_list, current_resolution, current_side = persistence.load_from_csv(self.csv_file_path)
                 
-                if not loaded_competitors:
-                    QMessageBox.warning(self, "Error", "The CSV file is empty or couldn't be parsed.")
-                    return
+                    if not loaded_competitors:
+                        QMessageBox.warning(self, "Error", "The CSV file is empty or couldn't be parsed.")
+                        return
                 
-                self.competitors = loaded_competitors
-                self.history = loaded_history
+                    self.competitors = loaded_competitors
+                    imported = loaded_history
+                    if store is not None and not from_store and os.path.exists(history_log_path(self.csv_file_path)):
+                        # Moving a session into the database brings its on-disk history along
+                        imported = HistoryLog(self.csv_file_path)
+                    self.history = self.open_history(imported)
+                    if imported is not loaded_history:
+                        imported.close()
+                    self.undo_stack = UndoStack.from_dict(
+                        store.load_undo(key) if from_store else persistence.load_undo(self.csv_file_path))
+                    self.update_undo_buttons()
                 
-                # Load the recency orders
-                self.speech_recency_order = speech_recency
-                self.question_recency_order = question_recency
+                    # Load the recency orders
+                    self.speech_recency_order = RecencyOrder.from_list(speech_recency)
+                    self.question_recency_order = RecencyOrder.from_list(question_recency)
+                    self.rebuild_indexes()
                 
-                # Load resolution data
-                self.resolution_list = resolution_list or []
-                self.current_resolution = current_resolution or ""
-                self.current_side = current_side or "Affirmative"
+                    # Load resolution data
+                    self.resolution_list = resolution_list or []
+                    self.current_resolution = current_resolution or ""
+                    self.current_side = current_side or "Affirmative"
                 
-                # Initialize missing attributes for backward compatibility
-                for c in self.competitors:
-                    if not hasattr(c, 'current_side'):
-                        c.current_side = ""
-                    if not hasattr(c, 'resolution_sides'):
-                        c.resolution_sides = {}
-                    if not hasattr(c, 'notes'):
-                        c.notes = {}
-                    if not hasattr(c, 'last_speech_round'):
-                        c.last_speech_round = 0
-                    if not hasattr(c, 'last_question_round'):
-                        c.last_question_round = 0
+                    # Initialize missing attributes for backward compatibility
+                    for c in self.competitors:
+                        if not hasattr(c, 'current_side'):
+                            c.current_side = ""
+                        if not hasattr(c, 'resolution_sides'):
+                            c.resolution_sides = {}
+                        if not hasattr(c, 'notes'):
+                            c.notes = {}
+                        if not hasattr(c, 'last_speech_round'):
+                            c.last_speech_round = 0
+                        if not hasattr(c, 'last_question_round'):
+                            c.last_question_round = 0
                 
-                max_speech_round = max((c.last_speech_round for c in self.competitors), default=0)
-                max_question_round = max((c.last_question_round for c in self.competitors), default=0)
-                self.current_round = max(max_speech_round, max_question_round)
+                    max_speech_round = max((c.last_speech_round for c in self.competitors), default=0)
+                    max_question_round = max((c.last_question_round for c in self.competitors), default=0)
+                    self.current_round = max(max_speech_round, max_question_round)
                 
-                # Check if any competitor has logged speeches/questions to determine manual mode
-                has_speeches = any(c.speeches > 0 for c in self.competitors)
-                has_questions = any(c.questions > 0 for c in self.competitors)
+                    # Check if any competitor has logged speeches/questions to determine manual mode
+                    has_speeches = any(c.speeches > 0 for c in self.competitors)
+                    has_questions = any(c.questions > 0 for c in self.competitors)
                 
-                self.manual_reordering_speech_enabled = not has_speeches
-                self.manual_reordering_question_enabled = not has_questions
+                    self.manual_reordering_speech_enabled = not has_speeches
+                    self.manual_reordering_question_enabled = not has_questions
                 
-                self.entered_names = [c.name for c in self.competitors]
+                    self.entered_names = [c.name for c in self.competitors]
                 
-                # Mark as tracking started
-                self.tracking_started = True
+                    # Mark as tracking started
+                    self.tracking_started = True
                 
-                # FIX: Load resolution state with proper next speaker determination
-                self.load_resolution_state_on_startup()
+                    # FIX: Load resolution state with proper next speaker determination
+                    self.load_resolution_state_on_startup()
                 
-                self.update_lists()
-                self.update_all_ui_post_start()
-                self.update_history_tab()
-                self.update_status(loaded=True, filepath=file_path)
-                self.update_tab_indicators()
+                    self.update_lists()
+                    self.update_all_ui_post_start()
+                    self.update_history_tab()
+                    self.update_status(loaded=True, filepath=file_path)
+                    self.update_tab_indicators()
+                    if store is not None and not from_store:
+                        self.save_to_csv()  # Import the CSV into the database
                 
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to load CSV file: {str(e)}")
-                print(f"Error loading CSV: {traceback.format_exc()}")
-                self.csv_file_path = None
-                self.update_status(loaded=False)
+                except Exception as e:
+                    # Persistence errors already say which file and why
+                    message = str(e) if isinstance(e, persistence.PersistenceError) else f"Failed to load CSV file: {str(e)}"
+                    QMessageBox.critical(self, "Error", message)
+                    print(f"Error loading CSV: {traceback.format_exc()}")
+                    self.csv_file_path = None
+                    self.history.close()
+                    self.history = HistoryLog()
+                    self.update_status(loaded=False)
 
     def update_tab_indicators(self):
         tab_names = ["Speeches", "Questions", "Settings", "History", "Status", "Statistics", "Credits"]
@@ -2253,19 +2533,18 @@ border: 1px solid #444;
         if input_text:
             names = [name.strip() for name in input_text.split(',') if name.strip()]
             for name in names:
-                if name.lower() not in [n.lower() for n in self.entered_names]:
+                if self.registry.find(name) is None:
                     self.entered_names.append(name)
-                    self.competitors.append(Competitor(name))
+                    competitor = Competitor(name)
+                    self.competitors.append(competitor)
+                    self.registry.add(competitor)
             self.name_input.clear()
             
             # Update all lists
-            self.speech_list.clear()
-            self.question_list.clear()
-            self.manage_list.clear()
-            for name in sorted(self.entered_names, key=lambda x: x.lower()):
-                self.speech_list.addItem(name)
-                self.question_list.addItem(name)
-                self.manage_list.addItem(name)
+            names = sorted(self.entered_names, key=lambda x: x.lower())
+            self.speech_list.model().set_rows(names, plain=True)
+            self.question_list.model().set_rows(names, plain=True)
+            self.fill_manage_list()
 
     def start_tracking(self):
         # Add any remaining names from input
@@ -2273,8 +2552,10 @@ border: 1px solid #444;
         if current_input:
             names = [name.strip() for name in current_input.split(',') if name.strip()]
             for name in names:
-                if name.lower() not in [c.name.lower() for c in self.competitors]:
-                    self.competitors.append(Competitor(name))
+                if self.registry.find(name) is None:
+                    competitor = Competitor(name)
+                    self.competitors.append(competitor)
+                    self.registry.add(competitor)
             self.name_input.clear()
 
         if not self.competitors:
@@ -2283,13 +2564,16 @@ border: 1px solid #444;
         
         # FIX: Initialize recency order lists BEFORE the first UI update.
         # This ensures the lists have data to draw from immediately.
-        self.speech_recency_order = [c.name for c in self.competitors]
-        self.question_recency_order = [c.name for c in self.competitors]
+        self.speech_recency_order = RecencyOrder(c.name for c in self.competitors)
+        self.question_recency_order = RecencyOrder(c.name for c in self.competitors)
+        self.rebuild_indexes()
+        self.undo_stack.clear()
         self.manual_reordering_speech_enabled   = True
         self.manual_reordering_question_enabled = True
         # Set file path ONLY when starting tracking
         if not self.csv_file_path:
             self.csv_file_path = self.get_unique_file_path()
+        self.history = self.open_history()
 
         # Update UI for tracking mode
         self.name_input.hide()
@@ -2441,9 +2725,11 @@ border: 1px solid #444;
     
 
     def on_tab_changed(self, index):
+        self.ensure_tab(self.tabs.widget(index))
         self.update_tab_indicators()
-        if index == 5:  # Statistics tab index
-            self.update_stats_display()
+        self.update_stats_display()
+        if self.tabs.widget(index) is getattr(self, 'status_tab', None):
+            self.update_latency_display()
     
     def confirm_log_speech(self):
         # 1) Validate selection
@@ -2451,69 +2737,80 @@ border: 1px solid #444;
             QMessageBox.warning(self, "Error", "No competitor selected")
             return
 
-        competitor = self.pending_speech_competitor
-
-        # 2) Get duration and side
-        duration = self.get_speech_duration()
-        side = "Aff" if self.current_side == "Affirmative" else "Neg"
+        with self.action_timer.action('log_speech'):
+            competitor = self.pending_speech_competitor
+            action = SpeechAction.capture(self, competitor)
 
-        # 3a) Capture old count
-        old_count = competitor.speeches
+            # 2) Get duration and side
+            duration = self.get_speech_duration()
+            side = "Aff" if self.current_side == "Affirmative" else "Neg"
 
-        # 3b) Set and save the side for this resolution
-        competitor.current_side = side
-        if self.current_resolution:
-            competitor.resolution_sides[self.current_resolution] = side
+            # 3a) Capture old count
+            old_count = competitor.speeches
 
-        # 3c) Log the speech
-        competitor.add_speech(
-            round_num=self.current_round,
-            side=side,
-            duration=duration,
-            resolution=self.current_resolution
-        )
+            # 3b) Set and save the side for this resolution
+            competitor.current_side = side
+            if self.current_resolution:
+                competitor.resolution_sides[self.current_resolution] = side
 
-        # 3d) Capture new count
-        new_count = competitor.speeches
-
-        # FIX: Update recency order - move this competitor to the end
-        if competitor.name in self.speech_recency_order:
-            self.speech_recency_order.remove(competitor.name)
-        self.speech_recency_order.append(competitor.name)
-
-        # 3e) Record in history
-        self.log_history(
-            action_type='speech',
-            competitor_name=competitor.name,
-            count_type='speech_count',
-            old_value=old_count,
-            new_value=new_count
-        )
+            # 3c) Log the speech
+            competitor.add_speech(
+                round_num=self.current_round,
+                side=side,
+                duration=duration,
+                resolution=self.current_resolution
+            )
+            with self.action_timer.phase('stats'):
+                self.side_tally.add(competitor.speech_records[-1])
+                self.running_stats.add(competitor, competitor.speech_records[-1])
+
+            # 3d) Capture new count
+            new_count = competitor.speeches
+
+            # Move this competitor to the end of the recency order
+            with self.action_timer.phase('precedence'):
+                self.speech_precedence.log(competitor.name, new_count)
+
+            # 3e) Record in history
+            self.log_history(
+                action_type='speech',
+                competitor_name=competitor.name,
+                count_type='speech_count',
+                old_value=old_count,
+                new_value=new_count
+            )
 
-        # 4) Toggle side & advance round
-        self.current_side = "Negative" if self.current_side == "Affirmative" else "Affirmative"
-        self.current_round += 1
+            # 4) Toggle side & advance round
+            self.current_side = "Negative" if self.current_side == "Affirmative" else "Affirmative"
+            self.current_round += 1
+            action.finish(self, competitor)
 
-        # 5) Refresh UI
-        self.update_resolution_display()
-        self.manual_reordering_speech_enabled = False
-        self.update_lists()
-        self.save_to_csv()
-        self.update_stats_display()
+            # 5) Refresh UI
+            self.update_resolution_display()
+            self.manual_reordering_speech_enabled = False
+            self.update_lists()
+            self.record_undoable(
+                action,
+                'speech',
+                name=competitor.name,
+                speech=competitor.speech_records[-1].to_dict(),
+                current_side=self.current_side
+            )
+            self.update_stats_display()
 
-        # 6) Reset speech‑logging UI
-        self.speech_name_input.setMaximumWidth(16777215)
-        self.speech_name_input.setCurrentText("")
-        self.speech_log_button.setText("Log Speech")
-        self.speech_confirm_button.setVisible(False)
-        self.speech_cancel_button.setVisible(False)
-        self.pending_speech_competitor = None
-        self.speech_list.clearSelection()
-        self.speech_input_container.setVisible(False)
+            # 6) Reset speech‑logging UI
+            self.speech_name_input.setMaximumWidth(16777215)
+            self.speech_name_input.setCurrentText("")
+            self.speech_log_button.setText("Log Speech")
+            self.speech_confirm_button.setVisible(False)
+            self.speech_cancel_button.setVisible(False)
+            self.pending_speech_competitor = None
+            self.speech_list.clearSelection()
+            self.speech_input_container.setVisible(False)
 
-        # Clear the time inputs after logging
-        self.minutes_input.clear()
-        self.seconds_input.clear()
+            # Clear the time inputs after logging
+            self.minutes_input.clear()
+            self.seconds_input.clear()
 
 
     def confirm_log_question(self):
@@ -2522,39 +2819,47 @@ border: 1px solid #444;
             QMessageBox.warning(self, "Error", "No competitor selected")
             return
 
-        c = self.pending_question_competitor
-        old_questions = c.questions
-        c.questions += 1
-        c.last_question_round = self.current_round
-        
-        # FIX: Update recency order - move this competitor to the end
-        if c.name in self.question_recency_order:
-            self.question_recency_order.remove(c.name)
-        self.question_recency_order.append(c.name)
-        
-        self.current_round += 1
-
-        self.log_history(
-            action_type='question',
-            competitor_name=c.name,
-            count_type='question_count',
-            old_value=old_questions,
-            new_value=c.questions
-        )
+        with self.action_timer.action('log_question'):
+            c = self.pending_question_competitor
+            action = QuestionAction.capture(self, c)
+            old_questions = c.questions
+            c.questions += 1
+            c.last_question_round = self.current_round
+        
+            # Move this competitor to the end of the recency order
+            with self.action_timer.phase('precedence'):
+                self.question_precedence.log(c.name, c.questions)
+        
+            self.current_round += 1
+
+            self.log_history(
+                action_type='question',
+                competitor_name=c.name,
+                count_type='question_count',
+                old_value=old_questions,
+                new_value=c.questions
+            )
+            action.finish(self, c)
 
-        # Refresh & persist
-        self.manual_reordering_question_enabled = False
-        self.update_lists()
-        self.save_to_csv()
+            # Refresh & persist
+            self.manual_reordering_question_enabled = False
+            self.update_lists()
+            self.record_undoable(
+                action,
+                'question',
+                name=c.name,
+                questions=c.questions,
+                round=c.last_question_round
+            )
 
-        # 2) Tear down the UI exactly like cancel does:
-        self.reset_question_inputs()
-        self.question_input_container.setVisible(False)
-        self.question_confirm_button.setVisible(False)
-        self.question_cancel_button.setVisible(False)
-        self.pending_question_competitor = None
-        self.question_list.clearSelection()
-        self.update_stats_display()
+            # 2) Tear down the UI exactly like cancel does:
+            self.reset_question_inputs()
+            self.question_input_container.setVisible(False)
+            self.question_confirm_button.setVisible(False)
+            self.question_cancel_button.setVisible(False)
+            self.pending_question_competitor = None
+            self.question_list.clearSelection()
+            self.update_stats_display()
 
 
     def cancel_log_question(self):
@@ -2588,10 +2893,7 @@ border: 1px solid #444;
     def find_competitor(self, name):
         # Clean the name by removing any extra formatting or [side] indicator
         clean_name = name.split('[')[0].strip()
-        for competitor in self.competitors:
-            if competitor.name.lower() == clean_name.lower():
-                return competitor
-        return None  # Don't show error message here, let caller handle it
+        return self.registry.find(clean_name)  # None if missing; let caller handle it
     def rename_competitor(self):
         selected_items = self.manage_list.selectedItems()
         if not selected_items:
@@ -2609,23 +2911,19 @@ border: 1px solid #444;
         if ok and new_name.strip():
             new_name = new_name.strip()
             # Check for duplicate names
-            if any(c.name.lower() == new_name.lower() for c in self.competitors):
+            if self.registry.find(new_name) is not None:
                 QMessageBox.warning(self, "Error", "A competitor with this name already exists.")
                 return
                 
             # Find and update the competitor
-            for c in self.competitors:
-                if c.name == old_name:
-                    c.name = new_name
-                    break
+            self.registry.rename(old_name, new_name)
+            self.running_stats.changed()
             
             # Update recency orders
-            if old_name in self.speech_recency_order:
-                idx = self.speech_recency_order.index(old_name)
-                self.speech_recency_order[idx] = new_name
-            if old_name in self.question_recency_order:
-                idx = self.question_recency_order.index(old_name)
-                self.question_recency_order[idx] = new_name
+            self.speech_precedence.rename(old_name, new_name)
+            self.question_precedence.rename(old_name, new_name)
+            self.undo_stack.clear()  # Undo entries refer to the old name
+            self.update_undo_buttons()
                     
             # Update all lists and UI immediately
             self.update_lists()
@@ -2633,202 +2931,62 @@ border: 1px solid #444;
             self.save_to_csv()
             
             # Force refresh of the manage list to show the new name
-            self.manage_list.clear()
-            for c in sorted(self.competitors, key=lambda x: x.name.lower()):
-                self.manage_list.addItem(c.name)
-            self.update_manage_buttons()
+            self.fill_manage_list()
     
+    def rebuild_indexes(self):
+        """Resync the precedence engines, name registry and speech indexes after competitors are replaced"""
+        with self.action_timer.phase('precedence'):
+            speech_counts = {c.name: c.speeches for c in self.competitors}
+            question_counts = {c.name: c.questions for c in self.competitors}
+            self.speech_precedence.reset(self.speech_recency_order, speech_counts)
+            self.question_precedence.reset(self.question_recency_order, question_counts)
+            self.registry.reset(self.competitors)
+        with self.action_timer.phase('stats'):
+            self.side_tally.rebuild(self.competitors)
+            self.running_stats.rebuild(self.competitors)
+        self.fill_manage_list()
+
     def update_lists(self):
         # 1) If no data, just show names
         if not self.competitors:
-            self.speech_list.clear()
-            self.question_list.clear()
-            for name in sorted(self.entered_names):
-                for lw in (self.speech_list, self.question_list):
-                    lw.addItem(QListWidgetItem(name))
+            with self.action_timer.phase('rendering'):
+                names = sorted(self.entered_names)
+                self.speech_list.model().set_rows(names, plain=True)
+                self.question_list.model().set_rows(names, plain=True)
             return
 
         # 2) Determine manual vs automatic modes
         in_manual_speech = self.manual_reordering_speech_enabled
         in_manual_question = self.manual_reordering_question_enabled
 
-        # 3) Build ordered lists
-        # Speech order: ALWAYS use preserved recency order as base, then sort by count within groups
-        temp = {c.name: c for c in self.competitors}
-        
-        if in_manual_speech:
-            # Pure manual mode - use exact recency order
-            speakers = [temp[name] for name in self.speech_recency_order if name in temp]
-        else:
-            # Automatic mode - preserve recency order within each speech count group
-            # Group competitors by speech count
-            speech_groups = {}
-            for comp in self.competitors:
-                count = comp.speeches
-                if count not in speech_groups:
-                    speech_groups[count] = []
-                speech_groups[count].append(comp)
-            
-            # Sort each group by recency order (preserve manual ordering within groups)
-            speakers = []
-            for count in sorted(speech_groups.keys()):
-                group = speech_groups[count]
-                # Sort this group by recency order (lower index = higher priority)
-                group_sorted = sorted(group, key=lambda c: self.speech_recency_order.index(c.name) 
-                                    if c.name in self.speech_recency_order else float('inf'))
-                speakers.extend(group_sorted)
-        
-        for idx, comp in enumerate(speakers, start=1):
-            comp.speech_rank = idx
-
-        # Question order: same logic
-        if in_manual_question:
-            # Pure manual mode - use exact recency order
-            askers = [temp[name] for name in self.question_recency_order if name in temp]
-        else:
-            # Automatic mode - preserve recency order within each question count group
-            question_groups = {}
-            for comp in self.competitors:
-                count = comp.questions
-                if count not in question_groups:
-                    question_groups[count] = []
-                question_groups[count].append(comp)
-            
-            # Sort each group by recency order
-            askers = []
-            for count in sorted(question_groups.keys()):
-                group = question_groups[count]
-                group_sorted = sorted(group, key=lambda c: self.question_recency_order.index(c.name) 
-                                    if c.name in self.question_recency_order else float('inf'))
-                askers.extend(group_sorted)
-                
-        for idx, comp in enumerate(askers, start=1):
-            comp.question_rank = idx
-
-        # 4) Compute column widths
-        fm = self.speech_list.fontMetrics()
-        name_w   = max(fm.horizontalAdvance(c.name) for c in self.competitors) + 20
-        marker_w = fm.horizontalAdvance("|")
-        side_w   = fm.horizontalAdvance("Neg") + 10
-        label_w  = fm.horizontalAdvance("Speeches:")
-        count_w  = fm.horizontalAdvance("99") + 10
-        rec_w    = fm.horizontalAdvance("Recency:") + fm.horizontalAdvance("99")
-
-        # Helpers
-        def make_label(text, fixed_w=None):
-            lbl = QLabel(text)
-            if fixed_w is not None:
-                lbl.setFixedWidth(fixed_w)
-            lbl.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Preferred)
-            lbl.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            return lbl
-
-        def make_separator_item():
-            sep = QFrame()
-            sep.setFixedHeight(1)
-            sep.setStyleSheet("background-color: rgba(255,255,255,0.15); border: none;")
-            container = QWidget()
-            layout = QHBoxLayout(container)
-            layout.setContentsMargins(8,1,8,1)
-            layout.addWidget(sep)
-            item = QListWidgetItem()
-            item.setFlags(Qt.ItemFlag.NoItemFlags)
-            item.setSizeHint(container.sizeHint())
-            return item, container
-
-        # 5) Populate SPEECH list
-        self.speech_list.clear()
-        last_s = None
-        for comp in speakers:
-            if last_s is not None and comp.speeches != last_s:
-                sep_item, sep_widget = make_separator_item()
-                self.speech_list.addItem(sep_item)
-                self.speech_list.setItemWidget(sep_item, sep_widget)
-
-            item = QListWidgetItem()
-            item.setData(Qt.ItemDataRole.UserRole, comp.name)
-            widget = QWidget()
-            widget.setStyleSheet("background: transparent;")
-            lo = QHBoxLayout(widget)
-            lo.setContentsMargins(8,4,8,4)
-            lo.setSpacing(6)
-            lo.setAlignment(Qt.AlignmentFlag.AlignLeft)
-
-            lo.addWidget(make_label(comp.name, name_w))
-            lo.addWidget(make_label("|", marker_w))
-            lo.addWidget(make_label(comp.current_side or "—", side_w))
-            lo.addWidget(make_label("|", marker_w))
-            lo.addWidget(make_label("Speeches:", label_w))
-            lo.addWidget(make_label(str(comp.speeches), count_w))
-            lo.addWidget(make_label("|", marker_w))
-            lo.addWidget(make_label("Recency:", None))
-            lo.addWidget(make_label(str(comp.speech_rank), None))
-
-            if in_manual_speech:
-                up = QPushButton("▲")
-                up.setFixedSize(20,20)
-                up.clicked.connect(lambda _, n=comp.name: self.move_competitor(n, -1, 'speech'))
-                down = QPushButton("▼")
-                down.setFixedSize(20,20)
-                down.clicked.connect(lambda _, n=comp.name: self.move_competitor(n, 1, 'speech'))
-                lo.addWidget(up)
-                lo.addWidget(down)
-
-            lo.addStretch()
-            item.setSizeHint(widget.sizeHint())
-            self.speech_list.addItem(item)
-            self.speech_list.setItemWidget(item, widget)
-            last_s = comp.speeches
-
-        # 6) Populate QUESTION list
-        self.question_list.clear()
-        last_q = None
-        for comp in askers:
-            if last_q is not None and comp.questions != last_q:
-                sep_item, sep_widget = make_separator_item()
-                self.question_list.addItem(sep_item)
-                self.question_list.setItemWidget(sep_item, sep_widget)
-
-            item = QListWidgetItem()
-            item.setData(Qt.ItemDataRole.UserRole, comp.name)
-            widget = QWidget()
-            widget.setStyleSheet("background: transparent;")
-            lo = QHBoxLayout(widget)
-            lo.setContentsMargins(8,4,8,4)
-            lo.setSpacing(6)
-            lo.setAlignment(Qt.AlignmentFlag.AlignLeft)
-
-            lo.addWidget(make_label(comp.name, name_w))
-            lo.addWidget(make_label("|", marker_w))
-            lo.addWidget(make_label("Questions:", label_w))
-            lo.addWidget(make_label(str(comp.questions), count_w))
-            lo.addWidget(make_label("|", marker_w))
-            lo.addWidget(make_label("Recency:", None))
-            lo.addWidget(make_label(str(comp.question_rank), None))
-
-            if in_manual_question:
-                up = QPushButton("▲")
-                up.setFixedSize(20,20)
-                up.clicked.connect(lambda _, n=comp.name: self.move_competitor(n, -1, 'question'))
-                down = QPushButton("▼")
-                down.setFixedSize(20,20)
-                down.clicked.connect(lambda _, n=comp.name: self.move_competitor(n, 1, 'question'))
-                lo.addWidget(up)
-                lo.addWidget(down)
-
-            lo.addStretch()
-            item.setSizeHint(widget.sizeHint())
-            self.question_list.addItem(item)
-            self.question_list.setItemWidget(item, widget)
-            last_q = comp.questions
-
-        # 7) Rebuild manage list
+        # 3) Build ordered lists from the precedence engines
+        # Manual mode uses the exact recency order; automatic mode orders by count
+        # and keeps recency order within each count group.
+        with self.action_timer.phase('precedence'):
+            registry = self.registry
+            speakers = [name for name in self.speech_precedence.ordered(in_manual_speech) if name in registry]
+            for idx, name in enumerate(speakers, start=1):
+                registry.get(name).speech_rank = idx
+
+            askers = [name for name in self.question_precedence.ordered(in_manual_question) if name in registry]
+            for idx, name in enumerate(askers, start=1):
+                registry.get(name).question_rank = idx
+
+        with self.action_timer.phase('rendering'):
+            # 4) Hand the orders to the list models; the delegates paint only visible rows
+            self.speech_list.model().set_rows(speakers, manual=in_manual_speech)
+            self.question_list.model().set_rows(askers, manual=in_manual_question)
+
+    def fill_manage_list(self):
+        """Competitor names on the Settings tab, once it has been built; call when the roster changes"""
+        if not hasattr(self, 'manage_list'):
+            return
         self.manage_list.clear()
-        for c in sorted(self.competitors, key=lambda x: x.name.lower()):
-            self.manage_list.addItem(c.name)
+        names = [c.name for c in self.competitors] if self.competitors else self.entered_names
+        for name in sorted(names, key=lambda x: x.lower()):
+            self.manage_list.addItem(name)
         self.update_manage_buttons()
 
-
     def delete_competitor(self):
         selected_items = self.manage_list.selectedItems()
         if not selected_items:
@@ -2842,36 +3000,44 @@ border: 1px solid #444;
             QMessageBox.StandardButton.No
         )
         if reply == QMessageBox.StandardButton.Yes:
-            self.competitors = [c for c in self.competitors if c.name != name_to_delete]
+            deleted = self.registry.remove(name_to_delete)
+            if deleted is not None:
+                self.side_tally.remove_all(deleted.speech_records)
+                self.running_stats.remove_all(deleted, deleted.speech_records)
+                self.competitors.remove(deleted)
             
             # Remove from recency orders
-            if name_to_delete in self.speech_recency_order:
-                self.speech_recency_order.remove(name_to_delete)
-            if name_to_delete in self.question_recency_order:
-                self.question_recency_order.remove(name_to_delete)
+            self.speech_precedence.remove(name_to_delete)
+            self.question_precedence.remove(name_to_delete)
+            # Undo entries refer to competitors by name and recency neighbour
+            self.undo_stack.clear()
+            self.update_undo_buttons()
                 
             self.update_competitor_combos()
             self.update_lists()
+            self.fill_manage_list()
             self.save_to_csv()
 
     def add_competitor(self):
         new_name, ok = QInputDialog.getText(self, "Add Competitor", "Enter new competitor name:")
         if ok and new_name.strip():
             new_name = new_name.strip()
-            if any(c.name.lower() == new_name.lower() for c in self.competitors):
+            if self.registry.find(new_name) is not None:
                 QMessageBox.warning(self, "Error", f"A competitor named '{new_name}' already exists.")
                 return
             c = Competitor(new_name)
             c.last_speech_round = 0
             c.last_question_round = 0
             self.competitors.append(c)
+            self.registry.add(c)
             
             # Add to recency orders
-            self.speech_recency_order.append(new_name)
-            self.question_recency_order.append(new_name)
+            self.speech_precedence.add(new_name)
+            self.question_precedence.add(new_name)
             
             self.update_competitor_combos()
             self.update_lists()
+            self.fill_manage_list()
             self.save_to_csv()
 
     def update_manage_buttons(self):
@@ -2897,6 +3063,13 @@ border: 1px solid #444;
         # Question logging shortcuts  
         self.log_question_shortcut = QShortcut(QKeySequence("Ctrl+Q"), self)
         self.log_question_shortcut.activated.connect(self.quick_log_question)
+
+        # Undo / redo shortcuts
+        self.undo_shortcut = QShortcut(QKeySequence("Ctrl+Z"), self)
+        self.undo_shortcut.activated.connect(self.undo_last_action)
+
+        self.redo_shortcut = QShortcut(QKeySequence("Ctrl+Shift+Z"), self)
+        self.redo_shortcut.activated.connect(self.redo_last_action)
         
         # Navigation shortcuts
         self.next_tab_shortcut = QShortcut(QKeySequence("Ctrl+Tab"), self)
@@ -2911,35 +3084,21 @@ border: 1px solid #444;
 
     def quick_log_speech(self):
         """Quick log speech for first person in speech list"""
-        if not self.tracking_started or self.speech_list.count() == 0:
+        if not self.tracking_started:
             return
-        
-        # Get first item that's not a separator
-        first_item = None
-        for i in range(self.speech_list.count()):
-            item = self.speech_list.item(i)
-            if item.flags() & Qt.ItemFlag.ItemIsSelectable:
-                first_item = item
-                break
-        
-        if first_item:
-            self.on_speech_list_double_clicked(first_item)
+
+        name = self.speech_precedence.first(self.manual_reordering_speech_enabled)
+        if name:
+            self.open_speech_input(name)
 
     def quick_log_question(self):
         """Quick log question for first person in question list"""
-        if not self.tracking_started or self.question_list.count() == 0:
+        if not self.tracking_started:
             return
-        
-        # Get first item that's not a separator
-        first_item = None
-        for i in range(self.question_list.count()):
-            item = self.question_list.item(i)
-            if item.flags() & Qt.ItemFlag.ItemIsSelectable:
-                first_item = item
-                break
-        
-        if first_item:
-            self.on_question_list_double_clicked(first_item)
+
+        name = self.question_precedence.first(self.manual_reordering_question_enabled)
+        if name:
+            self.open_question_input(name)
 
     def next_tab(self):
         """Go to next tab"""
@@ -2991,7 +3150,7 @@ border: 1px solid #444;
                 color: #000000;
             }}
             
-            QListWidget, QLineEdit, QComboBox, QTextEdit {{
+            QListWidget, QListView, QLineEdit, QComboBox, QTextEdit {{
                 background: #000000;
                 border: 2px solid #FFFFFF;
                 color: #FFFFFF;
@@ -3000,10 +3159,10 @@ border: 1px solid #444;
                 font-weight: bold;
             }}
             
-            QListWidget::item:hover {{
+            QListWidget::item:hover, QListView::item:hover {{
                 background: #444444;
             }}
-            QListWidget::item:selected {{
+            QListWidget::item:selected, QListView::item:selected {{
                 background: #FFFFFF;
                 color: #000000;
             }}
@@ -3073,19 +3232,19 @@ border: 1px solid #444;
                 border-bottom-color: #6D9EEB;
             }}
 
-            QListWidget, QLineEdit, QComboBox, QTextEdit {{
+            QListWidget, QListView, QLineEdit, QComboBox, QTextEdit {{
                 background: #3A3A3A;
                 border: 1px solid #444;
                 padding: 4px;
                 font-size: {base_font_size}px;
             }}
-            QListWidget {{
+            QListWidget, QListView {{
                 border-radius: 4px;
             }}
-            QListWidget::item:hover {{
+            QListWidget::item:hover, QListView::item:hover {{
                 background: #444;
             }}
-            QListWidget::item:selected {{
+            QListWidget::item:selected, QListView::item:selected {{
                 background: #444;
             }}
             """
@@ -3097,11 +3256,13 @@ border: 1px solid #444;
         self.config['enable_shortcuts'] = self.shortcuts_checkbox.isChecked()
         self.config['high_contrast'] = self.high_contrast_checkbox.isChecked()
         self.config['large_text'] = self.large_text_checkbox.isChecked()
+        self.config['lag_monitor'] = self.lag_monitor_checkbox.isChecked()
         self.save_config()
         
         # Apply settings immediately
         self.apply_accessibility_settings()
         self.setup_keyboard_shortcuts()
+        self.set_lag_monitor(self.config['lag_monitor'])
         
         QMessageBox.information(self, "Settings Saved", "Accessibility settings have been updated.")
 
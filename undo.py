@@ -0,0 +1,280 @@
+from collections import deque
+from models import HistoryItem, SpeechRecord
+
+UNDO_LIMIT = 200  # actions kept for undo; older ones fall off the ring buffer
+
+
+class UndoError(Exception):
+    """An action can't be undone or redone against the current session state"""
+
+
+def _recency_slot(order, name):
+    """(name before this one, sequence number), so the position can be restored"""
+    if name not in order:
+        return None, None
+    return order.neighbour(name, -1), order.position(name)
+
+def _remove_history(history, item):
+    """Drop the newest history entry if it is the one item logged"""
+    if len(history) and history[-1].to_dict() == item.to_dict():
+        history.pop()
+
+
+class SpeechAction:
+    """A logged speech, with everything needed to take it back exactly.
+
+    Actions are applied to the tracker itself, which provides registry,
+    speech_precedence, side_tally, running_stats, history,
+    current_side, current_round and manual_reordering_speech_enabled.
+    """
+    __slots__ = ('name', 'record', 'history_item', 'after', 'seq', 'old_side', 'old_resolution_side',
+                 'old_last_round', 'old_current_side', 'new_current_side', 'old_round', 'new_round', 'old_manual')
+    kind = 'speech'
+
+    @classmethod
+    def capture(cls, session, competitor):
+        """Record the state a speech log is about to change; call before logging"""
+        action = cls()
+        action.name = competitor.name
+        action.after, action.seq = _recency_slot(session.speech_precedence.recency, competitor.name)
+        action.old_side = competitor.current_side
+        action.old_resolution_side = competitor.resolution_sides.get(session.current_resolution)
+        action.old_last_round = competitor.last_speech_round
+        action.old_current_side = session.current_side
+        action.old_round = session.current_round
+        action.old_manual = session.manual_reordering_speech_enabled
+        return action
+
+    def finish(self, session, competitor):
+        """Record the outcome of the log; call once the speech is in place"""
+        self.record = competitor.speech_records[-1]
+        self.history_item = session.history[-1]
+        self.new_current_side = session.current_side
+        self.new_round = session.current_round
+        return self
+
+    def undo(self, session):
+        competitor = session.registry.get(self.name)
+        if (competitor is None or not competitor.speech_records
+                or competitor.speech_records[-1].to_dict() != self.record.to_dict()):
+            raise UndoError(f"The last speech by {self.name} no longer matches this action")
+        removed = competitor.remove_speeches_from(len(competitor.speech_records) - 1)
+        session.side_tally.remove_all(removed)
+        session.running_stats.remove_all(competitor, removed)
+        competitor.speeches = len(competitor.speech_records)
+        competitor.current_side = self.old_side
+        competitor.last_speech_round = self.old_last_round
+        resolution = self.record.resolution
+        if resolution:
+            if self.old_resolution_side is None:
+                competitor.resolution_sides.pop(resolution, None)
+            else:
+                competitor.resolution_sides[resolution] = self.old_resolution_side
+        session.speech_precedence.restore(self.name, competitor.speeches, self.after, self.seq)
+        _remove_history(session.history, self.history_item)
+        session.current_side = self.old_current_side
+        session.current_round = self.old_round
+        session.manual_reordering_speech_enabled = self.old_manual
+
+    def redo(self, session):
+        competitor = session.registry.get(self.name)
+        if competitor is None:
+            raise UndoError(f"{self.name} is no longer in this session")
+        if self.record.resolution:
+            competitor.resolution_sides[self.record.resolution] = self.record.side
+        competitor.add_speech_record(self.record)
+        session.side_tally.add(self.record)
+        session.running_stats.add(competitor, self.record)
+        session.speech_precedence.log(self.name, competitor.speeches)
+        session.history.append(self.history_item)
+        session.current_side = self.new_current_side
+        session.current_round = self.new_round
+        session.manual_reordering_speech_enabled = False
+
+    def to_dict(self):
+        return {
+            'kind': self.kind, 'name': self.name, 'record': self.record.to_dict(),
+            'history': self.history_item.to_dict(), 'after': self.after, 'seq': self.seq,
+            'old_side': self.old_side, 'old_resolution_side': self.old_resolution_side,
+            'old_last_round': self.old_last_round, 'old_current_side': self.old_current_side,
+            'new_current_side': self.new_current_side, 'old_round': self.old_round,
+            'new_round': self.new_round, 'old_manual': self.old_manual,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        action = cls()
+        for field in cls.__slots__:
+            if field not in ('record', 'history_item'):
+                setattr(action, field, data.get(field))
+        action.record = SpeechRecord.from_dict(data['record'])
+        action.history_item = HistoryItem.from_dict(data['history'])
+        return action
+
+
+class QuestionAction:
+    """A logged question; see SpeechAction"""
+    __slots__ = ('name', 'history_item', 'after', 'seq', 'old_last_round', 'new_last_round',
+                 'old_round', 'new_round', 'old_manual')
+    kind = 'question'
+
+    @classmethod
+    def capture(cls, session, competitor):
+        action = cls()
+        action.name = competitor.name
+        action.after, action.seq = _recency_slot(session.question_precedence.recency, competitor.name)
+        action.old_last_round = competitor.last_question_round
+        action.old_round = session.current_round
+        action.old_manual = session.manual_reordering_question_enabled
+        return action
+
+    def finish(self, session, competitor):
+        self.history_item = session.history[-1]
+        self.new_last_round = competitor.last_question_round
+        self.new_round = session.current_round
+        return self
+
+    def undo(self, session):
+        competitor = session.registry.get(self.name)
+        if competitor is None or competitor.questions <= 0:
+            raise UndoError(f"{self.name} has no question left to take back")
+        competitor.questions -= 1
+        competitor.last_question_round = self.old_last_round
+        session.question_precedence.restore(self.name, competitor.questions, self.after, self.seq)
+        _remove_history(session.history, self.history_item)
+        session.current_round = self.old_round
+        session.manual_reordering_question_enabled = self.old_manual
+
+    def redo(self, session):
+        competitor = session.registry.get(self.name)
+        if competitor is None:
+            raise UndoError(f"{self.name} is no longer in this session")
+        competitor.questions += 1
+        competitor.last_question_round = self.new_last_round
+        session.question_precedence.log(self.name, competitor.questions)
+        session.history.append(self.history_item)
+        session.current_round = self.new_round
+        session.manual_reordering_question_enabled = False
+
+    def to_dict(self):
+        data = {'kind': self.kind, 'history': self.history_item.to_dict()}
+        data.update((field, getattr(self, field)) for field in self.__slots__ if field != 'history_item')
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        action = cls()
+        for field in cls.__slots__:
+            if field != 'history_item':
+                setattr(action, field, data.get(field))
+        action.history_item = HistoryItem.from_dict(data['history'])
+        return action
+
+
+class MoveAction:
+    """A manual swap in the speech or question recency order"""
+    __slots__ = ('list_type', 'name', 'direction')
+    kind = 'move'
+    history_item = None
+
+    def __init__(self, list_type, name, direction):
+        self.list_type = list_type
+        self.name = name
+        self.direction = direction
+
+    def _engine(self, session):
+        return session.speech_precedence if self.list_type == 'speech' else session.question_precedence
+
+    def undo(self, session):
+        # The name moved one step in direction; one step back restores both positions
+        if not self._engine(session).swap(self.name, -self.direction):
+            raise UndoError(f"{self.name} can't be moved back")
+
+    def redo(self, session):
+        if not self._engine(session).swap(self.name, self.direction):
+            raise UndoError(f"{self.name} can't be moved again")
+
+    def to_dict(self):
+        return {'kind': self.kind, 'list_type': self.list_type, 'name': self.name, 'direction': self.direction}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get('list_type', 'speech'), data['name'], data.get('direction', 0))
+
+
+ACTION_TYPES = {cls.kind: cls for cls in (SpeechAction, QuestionAction, MoveAction)}
+
+
+def action_from_dict(data):
+    return ACTION_TYPES[data['kind']].from_dict(data)
+
+
+class UndoStack:
+    """Bounded undo/redo history of structured actions.
+
+    Both stacks are ring buffers: pushing past the limit silently forgets the
+    oldest action, and undo and redo each touch a single action. A new action
+    clears the redo side.
+    """
+
+    def __init__(self, limit=UNDO_LIMIT):
+        self._undo = deque(maxlen=limit)
+        self._redo = deque(maxlen=limit)
+
+    def push(self, action):
+        self._undo.append(action)
+        self._redo.clear()
+
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    def undo(self, session):
+        """Take back the most recent action and return it"""
+        action = self._undo[-1]
+        action.undo(session)  # Raises UndoError before changing anything
+        self._redo.append(self._undo.pop())
+        return action
+
+    def redo(self, session):
+        action = self._redo[-1]
+        action.redo(session)
+        self._undo.append(self._redo.pop())
+        return action
+
+    def depth_of(self, history_item):
+        """How many undos it takes to reach the action that logged history_item, or 0"""
+        target = history_item.to_dict()
+        for depth, action in enumerate(reversed(self._undo), start=1):
+            if action.history_item is not None and action.history_item.to_dict() == target:
+                return depth
+        return 0
+
+    def clear(self):
+        self._undo.clear()
+        self._redo.clear()
+
+    def __len__(self):
+        return len(self._undo)
+
+    def to_dict(self):
+        return {
+            'undo': [action.to_dict() for action in self._undo],
+            'redo': [action.to_dict() for action in self._redo],
+        }
+
+    @classmethod
+    def from_dict(cls, data, limit=UNDO_LIMIT):
+        """Rebuild a saved stack, skipping actions that can't be read"""
+        stack = cls(limit)
+        for key, target in (('undo', stack._undo), ('redo', stack._redo)):
+            for item in (data or {}).get(key, []):
+                try:
+                    action = action_from_dict(item)
+                except (KeyError, TypeError, ValueError) as e:
+                    print(f"Skipping unreadable undo entry: {str(e)}")
+                    continue
+                target.append(action)
+        return stack